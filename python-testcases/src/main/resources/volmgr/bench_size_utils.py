@@ -0,0 +1,215 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Equivalence check and micro-benchmark of size_utils against
+            the per story size helpers it replaced. Runs without a LITP
+            deployment:
+
+                python bench_size_utils.py [iterations]
+
+            The legacy helpers are reproduced below as they were in the
+            testsets, with Python 2 integer division made explicit. The
+            properties of Size are checked in test_size_utils.
+'''
+
+import re
+import sys
+import timeit
+from size_utils import Size, split_size, smaller_unit
+
+LEGACY_EXPONENTS = {'P': 5, 'T': 4, 'G': 3, 'M': 2, 'K': 1, '': 0}
+LEGACY_PATTERN = r'^(\d+\.?\d*)([KMGkmg]?)$'
+
+
+def legacy_convert_to_gb(size):
+    """ Story2067.convert_to_gb """
+    if "M" in size:
+        value, _ = size.split("M")
+        size = str(int(value) // 1024) + "G"
+    return size
+
+
+def legacy_increase_size_gb(size):
+    """ Story2067.increase_size_gb """
+    if "G" in size:
+        value, _ = size.split("G")
+        size = str(int(value) + 1) + "G"
+    return size
+
+
+def legacy_convert_to_mb(size):
+    """ Story4331.convert_to_mb """
+    if "G" in size:
+        value, _ = size.split("G")
+        size = str(int(value) * 1024)
+    return size
+
+
+def legacy_get_plex_size(fs_size):
+    """ Story4331.get_plex_size """
+    return str(int(float(fs_size) * 1024 * 2))
+
+
+def legacy_get_snap_plex_size(fs_size, snap_size):
+    """ Story4331.get_snap_plex_size """
+    return str(int(float(fs_size) * float(snap_size) / 100) * 1024 * 2)
+
+
+def legacy_get_mb_size_from_blocks(blocks):
+    """ Story4331.get_mb_size_from_blocks """
+    return str(int(blocks) // 1024 // 1024)
+
+
+def legacy_increase(volume_size, by_amount):
+    """ Story9114._increase """
+    str_x, unit_x = re.match(LEGACY_PATTERN, volume_size).groups()
+    str_d, unit_d = re.match(LEGACY_PATTERN, by_amount).groups()
+    bytes_x = int(float(str_x) * (1024 ** LEGACY_EXPONENTS[unit_x]))
+    bytes_d = int(float(str_d) * (1024 ** LEGACY_EXPONENTS[unit_d]))
+    if LEGACY_EXPONENTS[unit_x] <= LEGACY_EXPONENTS[unit_d]:
+        unit = unit_x
+    else:
+        unit = unit_d
+    new_size = float(bytes_x + bytes_d) / (1024.0 ** LEGACY_EXPONENTS[unit])
+    return str(int(new_size)) + unit
+
+
+def legacy_sizes_are_equal(size_x, size_y):
+    """ Story9114._sizes_are_equal """
+    str_x, unit_x = re.match(LEGACY_PATTERN, size_x).groups()
+    str_y, unit_y = re.match(LEGACY_PATTERN, size_y).groups()
+    return int(float(str_x) * (1024 ** LEGACY_EXPONENTS[unit_x.upper()])) \
+        == int(float(str_y) * (1024 ** LEGACY_EXPONENTS[unit_y.upper()]))
+
+
+def new_convert_to_gb(size):
+    """ Story2067.convert_to_gb using Size """
+    if "M" in size:
+        size = Size.parse(size).to_litp("G")
+    return size
+
+
+def new_increase_size_gb(size):
+    """ Story2067.increase_size_gb using Size """
+    if "G" in size:
+        size = (Size.parse(size) + Size.parse("1G")).to_litp("G")
+    return size
+
+
+def new_convert_to_mb(size):
+    """ Story4331.convert_to_mb using Size """
+    if size[-1].isdigit():
+        return size
+    return str(Size.parse(size).whole_units('M'))
+
+
+def new_get_plex_size(fs_size):
+    """ Story4331.get_plex_size using Size """
+    return str(Size.parse(fs_size + 'M').sectors)
+
+
+def new_get_snap_plex_size(fs_size, snap_size):
+    """ Story4331.get_snap_plex_size using Size """
+    return str(Size.parse(fs_size + 'M').percent(snap_size).sectors)
+
+
+def new_get_mb_size_from_blocks(blocks):
+    """ Story4331.get_mb_size_from_blocks using Size """
+    return str(Size.parse(blocks).whole_units('M'))
+
+
+def new_increase(volume_size, by_amount):
+    """ Story9114._increase using Size """
+    _, unit_x = split_size(volume_size)
+    _, unit_d = split_size(by_amount)
+    increased = Size.parse(volume_size) + Size.parse(by_amount)
+    return increased.to_litp(smaller_unit(unit_x, unit_d))
+
+
+def new_sizes_are_equal(size_x, size_y):
+    """ Story9114._sizes_are_equal using Size """
+    return Size.parse(size_x) == Size.parse(size_y)
+
+
+def generate_cases():
+    """
+    Description:
+        Generates the inputs the helpers are compared on.
+    Returns:
+        dict. A list of argument tuples keyed by helper name.
+    """
+    values = [1, 2, 3, 4, 12, 28, 100, 511, 512, 1000, 1023, 1024, 1025,
+              2048, 4096, 10000, 65535, 102400]
+    percents = ['0', '1', '5', '10', '33', '50', '99', '100']
+    mb_sizes = ['{0}M'.format(value) for value in values]
+    gb_sizes = ['{0}G'.format(value) for value in values]
+    return {
+        'convert_to_gb': [(size,) for size in mb_sizes + gb_sizes],
+        'increase_size_gb': [(size,) for size in mb_sizes + gb_sizes],
+        'convert_to_mb': [(size,) for size in gb_sizes + ['512', '1024']],
+        'get_plex_size': [(str(value),) for value in values],
+        'get_snap_plex_size': [(str(value), percent) for value in values
+                               for percent in percents],
+        'get_mb_size_from_blocks': [(str(value * 1024 * 1023),)
+                                    for value in values],
+        'increase': [(size_x, size_y) for size_x in mb_sizes + gb_sizes
+                     for size_y in ('1M', '12M', '1G', '100K')],
+        'sizes_are_equal': [(size_x, size_y)
+                            for size_x in ('1024M', '1G', '1048576K', '1M')
+                            for size_y in ('1G', '1024M', '1023M', '1024K')],
+    }
+
+
+def time_cases(func, cases, iterations):
+    """
+    Description:
+        Times passes of a helper over all its cases, taking the best of
+        five runs.
+    Args:
+        func (function): The helper.
+        cases (list): The argument tuples.
+        iterations (int): The number of passes.
+    Returns:
+        float. The time taken in seconds.
+    """
+    return min(timeit.repeat(lambda: [func(*args) for args in cases],
+                             number=iterations, repeat=5))
+
+
+def main(iterations=200):
+    """
+    Description:
+        Checks that every replacement gives the same result as its legacy
+        helper and prints the time both take over all the cases.
+    Args:
+        iterations (int): Number of passes over the cases to time.
+    Returns:
+        int. 0 if every result matched, 1 otherwise.
+    """
+    module = sys.modules[__name__]
+    mismatches = 0
+    print("{0:<26}{1:>8}{2:>12}{3:>12}{4:>9}".format(
+        'helper', 'cases', 'legacy s', 'size s', 'speedup'))
+    for name, cases in sorted(generate_cases().items()):
+        legacy = getattr(module, 'legacy_' + name)
+        new = getattr(module, 'new_' + name)
+        for args in cases:
+            if legacy(*args) != new(*args):
+                mismatches += 1
+                print("MISMATCH {0}{1}: {2!r} != {3!r}".format(
+                    name, args, legacy(*args), new(*args)))
+        legacy_time = time_cases(legacy, cases, iterations)
+        new_time = time_cases(new, cases, iterations)
+        print("{0:<26}{1:>8}{2:>12.4f}{3:>12.4f}{4:>8.2f}x".format(
+            name, len(cases), legacy_time, new_time, legacy_time / new_time))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:]]))
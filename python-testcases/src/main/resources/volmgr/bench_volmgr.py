@@ -0,0 +1,466 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Scaling benchmark of the volmgr parsing and verification
+            helpers on synthetic vxdisk, vxprint, lvs, by-id and
+            show_plan output of 10 to 10,000 entries. Needs the LITP test
+            library the testsets import, but no deployment:
+
+                python bench_volmgr.py [--sizes 10,100] [--save]
+
+            Results are compared with the saved baseline; a helper more
+            than --tolerance times slower than its baseline is reported as
+            a regression and the exit code is 1.
+'''
+
+import argparse
+import json
+import os
+import sys
+import time
+import unittest
+from node_fanout import NodeFanout
+from lv_inventory import LvInventory
+from vxprint_parser import VxprintOutput
+from size_utils import Size
+from snapshot_names import SnapshotNames
+from shared_disks import SharedDiskResolver
+from disk_by_id import ByIdIndex
+from testset_story10830 import Story10830
+from testset_story10831 import Story10831
+from testset_story11872 import Story11872
+from testset_story4331 import Story4331
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'bench_volmgr_baseline.json')
+NODES = ('node1', 'node2')
+FS_PER_DG = 10
+FS_SIZE = '100M'
+SNAP_SIZE = '10'
+SNAP_NAME = 'bench'
+
+
+def get_linux_name(index):
+    """
+    Description:
+        Returns the Linux name of the disk at an index: sda, ..., sdz,
+        sdaa, ...
+    Args:
+        index (int): The disk index.
+    Returns:
+        str. The disk name.
+    """
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('a') + remainder) + letters
+    return 'sd' + letters
+
+
+def gen_vxdisk(count):
+    """
+    Description:
+        Generates "vxdisk -e -o alldgs list" output. One disk in ten is an
+        LVM disk, half of the others are in a disk group and the rest
+        are free.
+    Args:
+        count (int): The number of disks.
+    Returns:
+        list. The output lines.
+    """
+    lines = ['DEVICE       TYPE           DISK        GROUP        STATUS    '
+             '           OS_NATIVE_NAME   ATTR']
+    for index in range(count):
+        device = 'emc_clariion0_{0}'.format(index)
+        linux_name = get_linux_name(index)
+        if index % 10 == 0:
+            lines.append('{0} auto:LVM       -            -            LVM  '
+                         '                {1}              -'.format(
+                             device, linux_name))
+        elif index % 2:
+            lines.append('{0} auto:cdsdisk   {0}  vg{1}  online shared  '
+                         '  {2}  -'.format(device, index // FS_PER_DG,
+                                           linux_name))
+        else:
+            lines.append('{0} auto:none      -            -            '
+                         'online invalid       {1}  -'.format(
+                             device, linux_name))
+    return lines
+
+
+def gen_by_id(count):
+    """
+    Description:
+        Generates "ls -la /dev/disk/by-id" output with a scsi and a wwn
+        link per disk.
+    Args:
+        count (int): The number of disks.
+    Returns:
+        list. The output lines.
+    """
+    lines = ['total 0']
+    for index in range(count):
+        uuid = '6006016011602d00{0:016x}'.format(index)
+        linux_name = get_linux_name(index)
+        for link in ('scsi-3' + uuid, 'wwn-0x' + uuid):
+            lines.append('lrwxrwxrwx 1 root root  9 Oct 17 10:00 {0} -> '
+                         '../../{1}'.format(link, linux_name))
+    return lines
+
+
+def gen_vxprint(count):
+    """
+    Description:
+        Generates "vxprint -vt" output of file systems with a deployment
+        snapshot cache each, FS_PER_DG file systems per disk group.
+    Args:
+        count (int): The number of file systems.
+    Returns:
+        list. The output lines.
+    """
+    fs_length = Size.parse(FS_SIZE).sectors
+    cache_length = Size.parse(FS_SIZE).percent(SNAP_SIZE).sectors
+    lines = []
+    for index in range(count):
+        fs_id = 'fs{0}'.format(index)
+        cache_name = SnapshotNames.get_cache_name(fs_id, SNAP_NAME)
+        if index % FS_PER_DG == 0:
+            dg_name = 'vg{0}'.format(index // FS_PER_DG)
+            lines.extend([
+                'Disk group: {0}'.format(dg_name), '',
+                'DG NAME         NCONFIG      NLOG     MINORS   GROUP-ID',
+                'V  NAME         RVG/VSET/CO  KSTATE   STATE    LENGTH   '
+                'READPOL   PREFPLEX UTYPE', '',
+                'dg {0}  default  default  {1}  1508762345.12.node1'.format(
+                    dg_name, 43000 + index)])
+        lines.extend([
+            'v  {0}  -  ENABLED  ACTIVE  {1}  SELECT  -  fsgen'.format(
+                fs_id, fs_length),
+            'pl {0}-01  {0}  ENABLED  ACTIVE  {1}  CONCAT  -  RW'.format(
+                fs_id, fs_length),
+            'co {0}  {0}_cv  ENABLED  ACTIVE'.format(cache_name),
+            'v  {0}_cv  -  ENABLED  ACTIVE  {1}  SELECT  -  fsgen'.format(
+                cache_name, cache_length)])
+    return lines
+
+
+def gen_lvs(count):
+    """
+    Description:
+        Generates "lvs --nameprefixes" output, a snapshot for every
+        second volume.
+    Args:
+        count (int): The number of volumes.
+    Returns:
+        list. The output lines.
+    """
+    lines = []
+    for index in range(count):
+        if index % 2:
+            lines.append("  LVM2_VG_NAME='vg_root' LVM2_LV_NAME='L_lv{0}_' "
+                         "LVM2_LV_SIZE='104857600' LVM2_LV_ATTR='swi-a-s---' "
+                         "LVM2_ORIGIN='lv{0}'".format(index - 1))
+        else:
+            lines.append("  LVM2_VG_NAME='vg_root' LVM2_LV_NAME='lv{0}' "
+                         "LVM2_LV_SIZE='1073741824' LVM2_LV_ATTR='owi-aos---' "
+                         "LVM2_ORIGIN=''".format(index))
+    return lines
+
+
+def gen_show_plan(count, nodes=NODES):
+    """
+    Description:
+        Generates "litp show_plan" output of a restore_snapshot plan with
+        the tasks checked by chk_restore_plan_tasks plus one restore task
+        per file system, ten tasks per phase.
+    Args:
+        count (int): The number of file system tasks.
+        nodes (tuple): The node hostnames.
+    Returns:
+        list. The output lines.
+    """
+    cluster_url = '/deployments/d1/clusters/c1'
+    tasks = [
+        ('/snapshots/snapshot', 'Check VxVM snapshots are valid'),
+        ('/snapshots/snapshot', 'Check LVM snapshots on node(s) "{0}" '
+         'are valid'.format('", "'.join(nodes))),
+        ('/snapshots/snapshot', 'Check that all nodes are reachable and an '
+         'active node exists for each VxVM volume group'),
+        ('/snapshots/snapshot', 'Check VxVM snapshots are present'),
+        ('/snapshots/snapshot', 'Check peer node(s) "{0}" are reachable '
+         'with all LVM snapshots present'.format('", "'.join(nodes))),
+        ('/snapshots/snapshot', 'Restore VxVM deployment snapshot')]
+    for index in range(count):
+        tasks.append(('{0}/storage_profile/volume_groups/vg{1}/'
+                      'file_systems/fs{2}'.format(cluster_url,
+                                                  index // FS_PER_DG, index),
+                      'Restore VxVM snapshot "L_fs{0}_" for file system '
+                      '"fs{0}"'.format(index)))
+    tasks.append(('{0}/nodes'.format(cluster_url), 'Restart node(s) "{0}"'
+                  .format('", "'.join(nodes))))
+    for node in nodes:
+        tasks.append(('{0}/nodes/{1}'.format(cluster_url, node),
+                      'Wait for node "{0}" to restart'.format(node)))
+    lines = []
+    for index, (path, description) in enumerate(tasks):
+        if index % 10 == 0:
+            lines.extend(['', 'Phase {0}'.format(index // 10 + 1),
+                          'Task status', '-----------'])
+        lines.extend(['Initial\t\t{0}'.format(path),
+                      '\t\t{0}'.format(description)])
+    lines.extend(['', 'Tasks: {0} | Initial: {0}'.format(len(tasks)), '',
+                  'Plan Status: Initial'])
+    return lines
+
+
+def create_test(test_class):
+    """
+    Description:
+        Creates a test case instance to call helper methods on, without
+        running its setUp.
+    Args:
+        test_class (class): The testset class.
+    Returns:
+        GenericTest. The test case.
+    """
+    return test_class(unittest.TestLoader().getTestCaseNames(test_class)[0])
+
+
+def set_outputs(test, outputs):
+    """
+    Description:
+        Answers the run_command calls of a test case with canned output.
+    Args:
+        test (GenericTest): The test case.
+        outputs (dict): The stdout lines keyed by node.
+    """
+    def run_command(node, cmd, **kwargs):
+        """ Returns the canned output of the node. """
+        return outputs[node], [], 0
+    test.run_command = run_command
+
+
+def get_vg_ids(count):
+    """ The ids of every tenth disk group of gen_vxdisk. """
+    return ['vg{0}'.format(index)
+            for index in range(0, count // FS_PER_DG + 1, 10)]
+
+
+def setup_shared_disk_resolver(count):
+    """ Disks of two nodes, a tenth of them in known disk groups. """
+    vxdisk = gen_vxdisk(count)
+    return SharedDiskResolver(get_vg_ids(count)).resolve, \
+        (dict((node, vxdisk) for node in NODES),)
+
+
+def setup_by_id_index(count):
+    """ The free shared disks looked up in the by-id listings. """
+    vxdisk = gen_vxdisk(count)
+    shared = SharedDiskResolver(get_vg_ids(count)).resolve(
+        dict((node, vxdisk) for node in NODES))
+    by_id_lines = gen_by_id(count)
+
+    def find_by_id():
+        """ Indexes the listings and finds the uuid of every disk. """
+        by_id = dict((node, ByIdIndex(by_id_lines)) for node in NODES)
+        return [disk.find_by_id(by_id, NODES) for disk in shared.values()]
+    return find_by_id, ()
+
+
+def setup_verify_fs_cache(count):
+    """ Every file system and its cache on one of two nodes. """
+    test = create_test(Story4331)
+    test.ms_node = 'ms1'
+    test.test_nodes = list(NODES)
+    test.fanout = NodeFanout(test)
+    set_outputs(test, {NODES[0]: gen_vxprint(count), NODES[1]: []})
+
+    def get_props_from_url(node, url, filter_prop=None):
+        """ Returns the properties of a file system. """
+        props = {'size': FS_SIZE, 'snap_size': SNAP_SIZE}
+        return props[filter_prop] if filter_prop else props
+    test.get_props_from_url = get_props_from_url
+    fs_urls = ['/deployments/d1/clusters/c1/storage_profile/volume_groups/'
+               'vg{0}/file_systems/fs{1}'.format(index // FS_PER_DG, index)
+               for index in range(count)]
+    return test.verify_fs_cache, (fs_urls, SNAP_NAME)
+
+
+def setup_chk_restore_plan_tasks(count):
+    """ A restore plan with a restore task per file system. """
+    test = create_test(Story10831)
+    test.mn_nodes = list(NODES)
+    return test.chk_restore_plan_tasks, (gen_show_plan(count), '', True)
+
+
+def setup_get_task_url(count):
+    """ The restore tasks of every file system. """
+    test = create_test(Story11872)
+    return test._get_task_url, \
+        (gen_show_plan(count), 'Restore VxVM snapshot', False)
+
+
+def setup_verify_snapshot_names(count):
+    """ The snapshots of every origin of the lvs report. """
+    test = create_test(Story10830)
+    names = SnapshotNames()
+    names.lvm[NODES[0]] = set(SnapshotNames.get_lvm_name('lv{0}'.format(
+        index)) for index in range(0, count - 1, 2))
+    inventory = LvInventory(test)
+    inventory.nodes = [NODES[0]]
+    inventory.inventory = {
+        NODES[0]: LvInventory.parse_lvs_output(gen_lvs(count), NODES[0])}
+
+    def verify():
+        """ Compares the expected names with the inventory. """
+        names.verify(test, SnapshotNames.get_observed_lvm(inventory))
+    return verify, ()
+
+
+def setup_parse_lvs_output(count):
+    """ The lvs report of a node. """
+    return LvInventory.parse_lvs_output, (gen_lvs(count), NODES[0])
+
+
+def setup_vxprint_output(count):
+    """ The vxprint listing of a node. """
+    return VxprintOutput, (gen_vxprint(count), NODES[0])
+
+
+BENCHMARKS = {
+    'SharedDiskResolver': setup_shared_disk_resolver,
+    'ByIdIndex': setup_by_id_index,
+    'verify_fs_cache': setup_verify_fs_cache,
+    'chk_restore_plan_tasks': setup_chk_restore_plan_tasks,
+    '_get_task_url': setup_get_task_url,
+    'verify_snapshot_names': setup_verify_snapshot_names,
+    'parse_lvs_output': setup_parse_lvs_output,
+    'VxprintOutput': setup_vxprint_output,
+}
+
+
+def time_call(func, args, min_secs=0.2, repeat=3):
+    """
+    Description:
+        Returns the best time of a call over several rounds, each running
+        it often enough to take at least min_secs.
+    Args:
+        func (function): The helper.
+        args (tuple): Its arguments.
+        min_secs (float): The minimum duration of a round.
+        repeat (int): The number of rounds.
+    Returns:
+        float. The seconds per call.
+    """
+    start = time.time()
+    func(*args)
+    elapsed = time.time() - start
+    number = max(1, int(min_secs / elapsed)) if elapsed else 1000
+    best = elapsed
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(number):
+            func(*args)
+        best = min(best, (time.time() - start) / number)
+    return best
+
+
+def run(names, sizes, max_secs):
+    """
+    Description:
+        Times the helpers at every size. Larger sizes of a helper are
+        skipped once a single call takes longer than max_secs.
+    Args:
+        names (list): The benchmark names.
+        sizes (list): The entry counts.
+        max_secs (float): The longest single call to keep growing.
+    Returns:
+        dict. {name: {size: seconds per call}}, sizes as strings.
+    """
+    results = {}
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            func, args = BENCHMARKS[name](size)
+            secs = time_call(func, args)
+            results[name][str(size)] = secs
+            print("{0:<44}{1:>7}{2:>14.6f}s".format(name, size, secs))
+            if secs > max_secs:
+                print("{0:<44}skipping sizes above {1}".format(name, size))
+                break
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Description:
+        Reports the helpers slower than their baseline.
+    Args:
+        results (dict): The timings of this run.
+        baseline (dict): The saved timings.
+        tolerance (float): The slowdown ratio reported as a regression.
+    Returns:
+        int. The number of regressions.
+    """
+    regressions = 0
+    for name, timings in sorted(results.items()):
+        for size, secs in sorted(timings.items(), key=lambda i: int(i[0])):
+            base = baseline.get(name, {}).get(size)
+            if not base:
+                continue
+            ratio = secs / base
+            if ratio > tolerance:
+                regressions += 1
+                print("REGRESSION {0} at {1}: {2:.6f}s vs baseline "
+                      "{3:.6f}s ({4:.2f}x)".format(name, size, secs, base,
+                                                   ratio))
+    return regressions
+
+
+def main(argv):
+    """
+    Description:
+        Runs the benchmarks, compares them with the baseline and saves a
+        new baseline if asked to.
+    Args:
+        argv (list): The command line arguments.
+    Returns:
+        int. 1 if a regression was found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description='volmgr helper benchmark')
+    parser.add_argument('--sizes', default=','.join(
+        str(size) for size in DEFAULT_SIZES))
+    parser.add_argument('--only', default=None,
+                        help='comma separated benchmark names')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save', action='store_true',
+                        help='save the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=1.5)
+    parser.add_argument('--max-secs', type=float, default=30.0)
+    options = parser.parse_args(argv)
+    names = options.only.split(',') if options.only else sorted(BENCHMARKS)
+    sizes = [int(size) for size in options.sizes.split(',')]
+
+    results = run(names, sizes, options.max_secs)
+    regressions = 0
+    if os.path.isfile(options.baseline):
+        with open(options.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file),
+                                  options.tolerance)
+    if options.save:
+        with open(options.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=1, sort_keys=True)
+        print("Baseline saved to {0}".format(options.baseline))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,408 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Record and replay of the remote commands, LITP CLI calls and
+            connection lookups of a test. A live run with
+            VOLMGR_FIXTURE_MODE=record saves the responses of every test
+            to a gzipped JSON archive; a run with
+            VOLMGR_FIXTURE_MODE=replay answers the same calls from the
+            archive without a cluster. On replay the waits of the test go
+            through a virtual clock, and testsets skip the GenericTest
+            setUp and tearDown, which need a deployment.
+            Run "python command_fixtures.py testset_storyNNNN.py ..." to
+            replay the recorded tests of testsets offline. OfflineTest
+            stands in for GenericTest in tests of the volmgr helpers.
+'''
+
+import gzip
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import unittest
+
+try:
+    STRING_TYPES = basestring
+except NameError:
+    STRING_TYPES = str
+
+FIXTURE_MODE_ENV = 'VOLMGR_FIXTURE_MODE'
+FIXTURE_DIR_ENV = 'VOLMGR_FIXTURE_DIR'
+DEFAULT_FIXTURE_DIR = '/tmp/volmgr_fixtures'
+RECORD = 'record'
+REPLAY = 'replay'
+
+# GenericTest METHODS WHOSE RESPONSES ARE RECORDED. ANY OTHER execute_cli_*
+# METHOD IS RECORDED TOO.
+RECORDED_METHODS = (
+    'run_command',
+    'run_command_local',
+    'run_commands_after_cleanup',
+    'get_management_node_filename',
+    'get_managed_node_filenames',
+    'get_node_att',
+    'get_node_ilo_ip',
+    'wait_for_ping',
+    'wait_for_node_up',
+    'find',
+    'find_parent_path_from_item_type',
+    'get_props_from_url',
+)
+
+# RemoteSession FRAMES ITS COMMANDS WITH A RANDOM MARKER; IT IS STORED AS
+# A PLACEHOLDER AND SUBSTITUTED BACK ON REPLAY
+SESSION_MARKER_RE = re.compile(r'__VOLMGR_[0-9a-f]{8}__')
+MARKER_PLACEHOLDER = '__VOLMGR_MARKER__'
+
+
+def _substitute(value, pattern, replacement):
+    """
+    Description:
+        Replaces a pattern in all the strings of a value.
+    Args:
+        value: A string, or a list, tuple or dict of strings.
+        pattern (RegexObject): The pattern to replace.
+        replacement (str): The replacement.
+    Returns:
+        The value with the replaced strings; tuples become lists.
+    """
+    if isinstance(value, STRING_TYPES):
+        return pattern.sub(replacement, value)
+    if isinstance(value, (list, tuple)):
+        return [_substitute(item, pattern, replacement) for item in value]
+    if isinstance(value, dict):
+        return dict((key, _substitute(item, pattern, replacement))
+                    for key, item in value.items())
+    return value
+
+
+def _find_marker(value):
+    """
+    Description:
+        Returns the RemoteSession marker used in a call's arguments.
+    Args:
+        value: The call arguments.
+    Returns:
+        str. The marker, or None if the call is not a framed session.
+    """
+    if isinstance(value, STRING_TYPES):
+        match = SESSION_MARKER_RE.search(value)
+        return match.group(0) if match else None
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            marker = _find_marker(item)
+            if marker:
+                return marker
+    if isinstance(value, dict):
+        return _find_marker(list(value.values()))
+    return None
+
+
+class CommandFixtures(object):
+    """
+    Records the responses of a test case's remote calls, or replays them.
+    """
+
+    def __init__(self, test, mode=None, fixture_dir=None):
+        """
+        Description:
+            Creates the fixtures of a test case.
+        Args:
+            test (GenericTest): The test case.
+            mode (str): 'record', 'replay' or None to do nothing;
+                        $VOLMGR_FIXTURE_MODE by default.
+            fixture_dir (str): Directory of the archives;
+                               $VOLMGR_FIXTURE_DIR or /tmp/volmgr_fixtures
+                               by default.
+        """
+        self.test = test
+        self.mode = mode if mode is not None else \
+            os.environ.get(FIXTURE_MODE_ENV)
+        self.fixture_dir = fixture_dir or \
+            os.environ.get(FIXTURE_DIR_ENV, DEFAULT_FIXTURE_DIR)
+        self.responses = {}
+        self._next = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._wrapped = []
+        self._now = None
+
+    @property
+    def offline(self):
+        """ True when the calls are answered from the archive. """
+        return self.mode == REPLAY
+
+    def clock(self):
+        """
+        Description:
+            Returns the current time; on replay, the virtual time advanced
+            by sleep only.
+        Returns:
+            float. The time in seconds.
+        """
+        if self._now is not None:
+            return self._now
+        return time.time()
+
+    def sleep(self, secs):
+        """
+        Description:
+            Waits between polls of the test. On replay the virtual clock
+            is moved on instead.
+        Args:
+            secs (float): The time to wait in seconds.
+        """
+        if self._now is not None:
+            self._now += secs
+            return
+        time.sleep(secs)
+
+    @staticmethod
+    def is_recorded(method):
+        """
+        Description:
+            Returns whether the calls of a GenericTest method are recorded.
+        Args:
+            method (str): The method name.
+        Returns:
+            bool. True if the method is recorded.
+        """
+        return method in RECORDED_METHODS or method.startswith('execute_cli_')
+
+    @property
+    def path(self):
+        """ The archive of the test case. """
+        return os.path.join(self.fixture_dir, self.test.id() + '.json.gz')
+
+    @staticmethod
+    def get_key(method, args, kwargs):
+        """
+        Description:
+            Returns the key identifying the responses of a call.
+        Args:
+            method (str): The method name.
+            args (tuple): The positional arguments.
+            kwargs (dict): The keyword arguments.
+        Returns:
+            str. The key.
+        """
+        return json.dumps(
+            [method, _substitute(list(args), SESSION_MARKER_RE,
+                                 MARKER_PLACEHOLDER),
+             _substitute(kwargs, SESSION_MARKER_RE, MARKER_PLACEHOLDER)],
+            sort_keys=True, default=str)
+
+    def start(self):
+        """
+        Description:
+            Wraps the recorded methods of the test case. In replay mode
+            the archive is loaded, the virtual clock is started and every
+            method with recorded responses is answered, whether or not the
+            test case defines it. Nothing is done if no mode is set.
+        """
+        if self.mode not in (RECORD, REPLAY):
+            return
+        methods = [method for method in dir(self.test)
+                   if self.is_recorded(method) and
+                   callable(getattr(self.test, method, None))]
+        if self.mode == REPLAY:
+            self.load()
+            self._now = time.time()
+            methods.extend(set(json.loads(key)[0] for key in self.responses)
+                           - set(methods))
+        for method in methods:
+            func = getattr(self.test, method, None)
+            wrap = self._record if self.mode == RECORD else self._replay
+            setattr(self.test, method, wrap(method, func))
+            self._wrapped.append(method)
+        self.test.addCleanup(self.stop)
+
+    def stop(self):
+        """
+        Description:
+            Restores the wrapped methods and the real clock, and writes
+            the archive of a recording.
+        """
+        for method in self._wrapped:
+            if method in self.test.__dict__:
+                delattr(self.test, method)
+        self._wrapped = []
+        self._now = None
+        if self.mode == RECORD:
+            self.save()
+
+    def load(self):
+        """
+        Description:
+            Loads the archive of the test case.
+        """
+        if not os.path.isfile(self.path):
+            self.test.fail("No command fixture {0}".format(self.path))
+        with gzip.open(self.path, 'rb') as fixture_file:
+            fixture = json.loads(fixture_file.read().decode('utf-8'))
+        self.responses = fixture['responses']
+        self._next = {}
+
+    def save(self):
+        """
+        Description:
+            Writes the recorded responses to the archive of the test case.
+        Returns:
+            str. The path of the archive.
+        """
+        if not os.path.isdir(self.fixture_dir):
+            os.makedirs(self.fixture_dir)
+        fixture = {'test': self.test.id(), 'recorded': time.time(),
+                   'responses': self.responses}
+        with gzip.open(self.path, 'wb') as fixture_file:
+            fixture_file.write(json.dumps(fixture, sort_keys=True,
+                                          default=str).encode('utf-8'))
+        return self.path
+
+    def _record(self, method, func):
+        """
+        Description:
+            Returns a wrapper storing the response of each call. Calls
+            made inside another recorded call are not stored, since the
+            outer call is answered as a whole on replay.
+        Args:
+            method (str): The method name.
+            func (function): The bound method.
+        Returns:
+            function. The wrapper.
+        """
+        def recorded(*args, **kwargs):
+            """ Calls the method and stores its response. """
+            if getattr(self._local, 'depth', 0):
+                return func(*args, **kwargs)
+            self._local.depth = 1
+            response = {}
+            try:
+                result = func(*args, **kwargs)
+                response['result'] = _substitute(
+                    result, SESSION_MARKER_RE, MARKER_PLACEHOLDER)
+                response['tuple'] = isinstance(result, tuple)
+                return result
+            except Exception as err:
+                response['error'] = str(err)
+                response['assertion'] = \
+                    isinstance(err, self.test.failureException)
+                raise
+            finally:
+                self._local.depth = 0
+                with self._lock:
+                    self.responses.setdefault(
+                        self.get_key(method, args, kwargs),
+                        []).append(response)
+        return recorded
+
+    def _replay(self, method, func):
+        """
+        Description:
+            Returns a wrapper answering each call from the archive. Calls
+            with the same arguments get their responses in recorded
+            order; the last one is repeated once they run out, e.g. for
+            polling loops.
+        Args:
+            method (str): The method name.
+            func (function): The bound method, None if the test case does
+                             not define it; not called.
+        Returns:
+            function. The wrapper.
+        """
+        def replayed(*args, **kwargs):
+            """ Returns the next recorded response of the call. """
+            key = self.get_key(method, args, kwargs)
+            with self._lock:
+                responses = self.responses.get(key)
+                if not responses:
+                    self.test.fail("No recorded response for {0}".format(
+                        key[:500]))
+                index = self._next.get(key, 0)
+                self._next[key] = index + 1
+                response = responses[min(index, len(responses) - 1)]
+            if 'error' in response:
+                if response['assertion']:
+                    raise self.test.failureException(response['error'])
+                raise RuntimeError(response['error'])
+            marker = _find_marker([args, kwargs])
+            result = response['result']
+            if marker:
+                result = _substitute(
+                    result, re.compile(MARKER_PLACEHOLDER), marker)
+            return tuple(result) if response['tuple'] else result
+        replayed.__wrapped__ = func
+        return replayed
+
+
+class OfflineTest(unittest.TestCase):
+    """
+    Stand-in for GenericTest in tests of the volmgr helpers. The calls of
+    each test are answered from its archive in FIXTURE_DIR; no deployment
+    or LITP test library is needed.
+    """
+
+    FIXTURE_DIR = None
+
+    def setUp(self):
+        """
+        Description:
+            Starts replaying the archive of the test.
+        """
+        self.fixtures = CommandFixtures(self, REPLAY, self.FIXTURE_DIR)
+        self.fixtures.start()
+
+    @staticmethod
+    def log(level, msg):
+        """
+        Description:
+            Logs a message as GenericTest.log does.
+        Args:
+            level (str): The level name, e.g. 'info'.
+            msg (str): The message.
+        """
+        logging.getLogger('volmgr').log(
+            getattr(logging, level.upper(), logging.INFO), msg)
+
+
+def main(argv):
+    """
+    Description:
+        Replays the recorded tests of testset modules offline, e.g.
+        python command_fixtures.py [-d <fixture dir>] testset_story2115.py
+        Tests without an archive are skipped.
+    Args:
+        argv (list): The command line arguments.
+    Returns:
+        int. 0 if all the replayed tests passed.
+    """
+    args = list(argv)
+    if args[:1] == ['-d']:
+        os.environ[FIXTURE_DIR_ENV] = args[1]
+        args = args[2:]
+    os.environ[FIXTURE_MODE_ENV] = REPLAY
+    fixture_dir = os.environ.get(FIXTURE_DIR_ENV, DEFAULT_FIXTURE_DIR)
+    suite = unittest.TestSuite()
+    loader = unittest.TestLoader()
+    for module_name in args:
+        module = __import__(os.path.basename(module_name).replace('.py', ''))
+        for test_suite in loader.loadTestsFromModule(module):
+            for test in test_suite:
+                if os.path.isfile(os.path.join(
+                        fixture_dir, test.id() + '.json.gz')):
+                    suite.addTest(test)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
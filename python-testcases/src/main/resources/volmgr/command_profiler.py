@@ -0,0 +1,336 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Per test profiler of remote commands, model queries and CLI
+            calls. Records the node, duration and bytes returned of every
+            call, writes a JSON profile and a folded stack summary for
+            flame graph tools, and fails a test exceeding its declared
+            call budget. Profiling is enabled with VOLMGR_PROFILE=1.
+'''
+
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    STRING_TYPES = basestring
+except NameError:
+    STRING_TYPES = str
+
+PROFILE_ENV = 'VOLMGR_PROFILE'
+PROFILE_DIR_ENV = 'VOLMGR_PROFILE_DIR'
+DEFAULT_PROFILE_DIR = '/tmp/volmgr_profiles'
+
+# CATEGORY OF EACH PROFILED GenericTest METHOD. ANY OTHER execute_cli_*
+# METHOD IS PROFILED AS 'cli'.
+CATEGORIES = {
+    'run_command': 'remote',
+    'run_command_local': 'remote',
+    'run_commands_after_cleanup': 'remote',
+    'find': 'model',
+    'find_parent_path_from_item_type': 'model',
+    'get_props_from_url': 'model',
+    'get_storage_profile_paths': 'model',
+    'execute_cli_show_cmd': 'model',
+    'wait_for_plan_state': 'plan',
+    'run_and_check_plan': 'plan',
+}
+
+
+def command_budget(**limits):
+    """
+    Description:
+        Decorator declaring the call budget of a test method. A key is a
+        category ('remote', 'model', 'cli' or 'plan') or a method name.
+        e.g. @command_budget(model=20, run_command=100)
+    Args:
+        limits (dict): The maximum number of calls of each key.
+    Returns:
+        function. The decorator.
+    """
+    def decorate(func):
+        """ Attaches the budget to the test method. """
+        func.command_budget = limits
+        return func
+    return decorate
+
+
+def _payload_size(result):
+    """
+    Description:
+        Returns the number of characters in a call result.
+    Args:
+        result: The value returned by the profiled method.
+    Returns:
+        int. The size of all strings in the result.
+    """
+    if isinstance(result, (list, tuple)):
+        return sum(_payload_size(item) for item in result)
+    if isinstance(result, dict):
+        return sum(_payload_size(key) + _payload_size(value)
+                   for key, value in result.items())
+    if isinstance(result, STRING_TYPES):
+        return len(result)
+    return 0
+
+
+class CommandProfiler(object):
+    """
+    Records the remote calls made by a test case.
+    """
+
+    def __init__(self, test, profile_dir=None, enabled=None):
+        """
+        Description:
+            Creates a profiler for a test case.
+        Args:
+            test (GenericTest): The test case to profile.
+            profile_dir (str): Directory the profiles are written to;
+                               $VOLMGR_PROFILE_DIR or /tmp/volmgr_profiles
+                               by default.
+            enabled (bool): Profile the test; True if $VOLMGR_PROFILE is
+                            set to a value other than 0 by default.
+        """
+        self.test = test
+        self.enabled = enabled if enabled is not None else \
+            os.environ.get(PROFILE_ENV, '0') not in ('', '0')
+        self.profile_dir = profile_dir or \
+            os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+        self.calls = []
+        self.budget = {}
+        self.counts = {}
+        self.start_time = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._wrapped = []
+
+    def get_category(self, method):
+        """
+        Description:
+            Returns the category of a GenericTest method.
+        Args:
+            method (str): The method name.
+        Returns:
+            str. The category, or None if the method is not profiled.
+        """
+        if method in CATEGORIES:
+            return CATEGORIES[method]
+        if method.startswith('execute_cli_'):
+            return 'cli'
+        return None
+
+    def set_budget(self, key, max_calls):
+        """
+        Description:
+            Limits the number of calls of a category or method for the
+            rest of the test.
+        Args:
+            key (str): A category or method name.
+            max_calls (int): The maximum number of calls.
+        """
+        self.budget[key] = max_calls
+
+    def start(self):
+        """
+        Description:
+            Wraps the profiled methods of the test case and registers a
+            cleanup writing the profile when the test ends. The budget
+            declared with command_budget on the test method is applied.
+            Nothing is done if profiling is not enabled.
+        """
+        if not self.enabled:
+            return
+        self.start_time = time.time()
+        test_method = getattr(self.test, self.test._testMethodName, None)
+        self.budget.update(getattr(test_method, 'command_budget', {}))
+        for method in dir(self.test):
+            category = self.get_category(method)
+            if category is None:
+                continue
+            func = getattr(self.test, method, None)
+            if callable(func):
+                setattr(self.test, method,
+                        self._wrap(method, category, func))
+                self._wrapped.append(method)
+        self.test.addCleanup(self.stop)
+
+    def stop(self):
+        """
+        Description:
+            Restores the profiled methods and writes the profile.
+        """
+        for method in self._wrapped:
+            if method in self.test.__dict__:
+                delattr(self.test, method)
+        self._wrapped = []
+        self.write_profile()
+
+    def _get_stack(self):
+        """
+        Description:
+            Returns the names of the test case methods and profiled calls
+            leading to the current call, outermost first.
+        Returns:
+            list. The frame names.
+        """
+        outer = getattr(self._local, 'calls', None)
+        if outer:
+            return list(outer)
+        names = []
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        while frame is not None:
+            if frame.f_locals.get('self') is self.test:
+                names.append(frame.f_code.co_name)
+                if frame.f_code.co_name.startswith('test') or \
+                   frame.f_code.co_name in ('setUp', 'tearDown'):
+                    break
+            frame = frame.f_back
+        names.reverse()
+        return names or ['[thread]']
+
+    def _count(self, method, category):
+        """
+        Description:
+            Counts a call and fails the test if it exceeds the budget.
+        Args:
+            method (str): The method name.
+            category (str): The method category.
+        """
+        with self._lock:
+            for key in (category, method):
+                self.counts[key] = self.counts.get(key, 0) + 1
+                if key in self.budget and \
+                   self.counts[key] > self.budget[key]:
+                    self.test.fail(
+                        "Command budget exceeded: {0} {1} calls, budget "
+                        "{2}".format(self.counts[key], key,
+                                     self.budget[key]))
+
+    def _wrap(self, method, category, func):
+        """
+        Description:
+            Returns a wrapper recording each call of a method.
+        Args:
+            method (str): The method name.
+            category (str): The method category.
+            func (function): The bound method.
+        Returns:
+            function. The wrapper.
+        """
+        def profiled(*args, **kwargs):
+            """ Calls the method and records the call. """
+            self._count(method, category)
+            stack = self._get_stack() + [method]
+            outer = getattr(self._local, 'calls', [])
+            self._local.calls = stack
+            record = {'method': method, 'category': category,
+                      'node': args[0] if args and
+                      isinstance(args[0], STRING_TYPES) else None,
+                      'arg': str(args[1])[:200] if len(args) > 1
+                      else None,
+                      'stack': stack, 'nested': bool(outer),
+                      'start': time.time(),
+                      'duration': None, 'bytes': 0, 'error': None}
+            try:
+                result = func(*args, **kwargs)
+                record['bytes'] = _payload_size(result)
+                return result
+            except Exception as err:
+                record['error'] = str(err)[:200]
+                raise
+            finally:
+                record['duration'] = time.time() - record['start']
+                record['start'] -= self.start_time
+                self._local.calls = outer
+                with self._lock:
+                    self.calls.append(record)
+        return profiled
+
+    def get_totals(self, key='category'):
+        """
+        Description:
+            Returns the number of calls, seconds and bytes per category or
+            method.
+        Args:
+            key (str): 'category' or 'method'.
+        Returns:
+            dict. {name: {'calls': int, 'secs': float, 'bytes': int}}
+        """
+        totals = {}
+        for record in self.calls:
+            total = totals.setdefault(record[key],
+                                      {'calls': 0, 'secs': 0.0, 'bytes': 0})
+            total['calls'] += 1
+            total['secs'] += record['duration']
+            total['bytes'] += record['bytes']
+        return totals
+
+    def get_folded_stacks(self):
+        """
+        Description:
+            Returns the calls in folded stack format, one line per stack
+            with its self time in milliseconds, as read by flamegraph.pl
+            and speedscope.
+        Returns:
+            list. The folded stack lines.
+        """
+        self_ms = {}
+        for record in self.calls:
+            stack = ';'.join(record['stack'])
+            self_ms[stack] = self_ms.get(stack, 0) + \
+                record['duration'] * 1000
+            if record['nested']:
+                # THE PARENT CALL'S SELF TIME EXCLUDES ITS NESTED CALLS
+                parent = ';'.join(record['stack'][:-1])
+                self_ms[parent] = self_ms.get(parent, 0) - \
+                    record['duration'] * 1000
+        return ['{0} {1}'.format(stack, int(round(max(msecs, 0))))
+                for stack, msecs in sorted(self_ms.items())]
+
+    def format_summary(self):
+        """
+        Description:
+            Formats the call totals for logging.
+        Returns:
+            str. The summary.
+        """
+        lines = ['Command profile of {0}: {1} calls'.format(
+            self.test.id(), len(self.calls))]
+        for name, total in sorted(self.get_totals('method').items(),
+                                  key=lambda item: -item[1]['secs']):
+            lines.append('  {0:<36}{1:>6} calls{2:>9.1f}s{3:>10} bytes'
+                         .format(name, total['calls'], total['secs'],
+                                 total['bytes']))
+        return '\n'.join(lines)
+
+    def write_profile(self):
+        """
+        Description:
+            Writes <test id>.json and <test id>.folded to the profile
+            directory and logs the summary.
+        Returns:
+            str. The path of the JSON profile.
+        """
+        self.test.log('info', self.format_summary())
+        if not os.path.isdir(self.profile_dir):
+            os.makedirs(self.profile_dir)
+        path = os.path.join(self.profile_dir, self.test.id())
+        profile = {'test': self.test.id(),
+                   'elapsed': time.time() - self.start_time,
+                   'budget': self.budget,
+                   'categories': self.get_totals('category'),
+                   'methods': self.get_totals('method'),
+                   'calls': self.calls}
+        with open(path + '.json', 'w') as profile_file:
+            json.dump(profile, profile_file, indent=1, sort_keys=True)
+        with open(path + '.folded', 'w') as folded_file:
+            folded_file.write('\n'.join(self.get_folded_stacks()) + '\n')
+        return path + '.json'
@@ -0,0 +1,129 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Index of a "ls -la /dev/disk/by-id" listing by the device each
+            link points to, so that the by-id link and the LITP uuid of a
+            disk are found with a dictionary lookup.
+'''
+
+
+class ByIdIndex(object):
+    """
+    The /dev/disk/by-id links of one node, keyed by target device.
+    """
+
+    LS_CMD = '/bin/ls -la /dev/disk/by-id'
+    LINK_SEPARATOR = ' -> '
+    # WWN LINKS NAME THE SAME DISKS AS THE SCSI LINKS BUT IN A FORMAT LITP
+    # DOES NOT USE FOR DISK UUIDS
+    EXCLUDED = 'wwn'
+
+    def __init__(self, lines=None):
+        """
+        Description:
+            Creates the index, optionally from a listing.
+        Args:
+            lines (list): Lines of "ls -la /dev/disk/by-id" output.
+        """
+        self._by_device = {}
+        if lines:
+            self.add(lines)
+
+    def add(self, lines):
+        """
+        Description:
+            Indexes the links of a listing in a single pass, in listing
+            order. Lines containing "wwn" and lines that are not links are
+            skipped.
+        Args:
+            lines (list): Lines of "ls -la /dev/disk/by-id" output.
+        """
+        for line in lines:
+            if self.LINK_SEPARATOR not in line or self.EXCLUDED in line:
+                continue
+            source, target = line.rsplit(self.LINK_SEPARATOR, 1)
+            fields = source.split()
+            if not fields:
+                continue
+            device = target.strip().rsplit('/', 1)[-1]
+            self._by_device.setdefault(device, []).append((fields[-1], line))
+
+    @classmethod
+    def collect(cls, fanout, nodes):
+        """
+        Description:
+            Lists /dev/disk/by-id on every node concurrently.
+        Args:
+            fanout (NodeFanout): The fan-out to run the command with.
+            nodes (list): The node filenames.
+        Returns:
+            dict. A ByIdIndex keyed by node.
+        """
+        results = fanout.run(nodes, cls.LS_CMD, su_root=True)
+        return dict((node, cls(results[node].stdout)) for node in results)
+
+    def get_links(self, device):
+        """
+        Description:
+            Returns all the links to a device.
+        Args:
+            device (str): The device name, e.g. sdb.
+        Returns:
+            list. The link names in listing order.
+        """
+        return [link for link, _ in self._by_device.get(device, [])]
+
+    def get_link(self, device):
+        """
+        Description:
+            Returns the first link to a device.
+        Args:
+            device (str): The device name, e.g. sdb.
+        Returns:
+            str. The link name, e.g. scsi-36006016..., or None.
+        """
+        entries = self._by_device.get(device)
+        return entries[0][0] if entries else None
+
+    def get_line(self, device):
+        """
+        Description:
+            Returns the listing line of the first link to a device.
+        Args:
+            device (str): The device name, e.g. sdb.
+        Returns:
+            str. The line, or None if the device has no link.
+        """
+        entries = self._by_device.get(device)
+        return entries[0][1] if entries else None
+
+    @staticmethod
+    def get_uuid_from_link(link):
+        """
+        Description:
+            Strips the uuid used in LITP from a scsi link name, i.e. the
+            part after "scsi-" without its leading NAA type digit.
+        Args:
+            link (str): The link name, e.g. scsi-36006016....
+        Returns:
+            str. The uuid.
+        """
+        return link.split("-")[1][1:]
+
+    def get_uuid(self, device):
+        """
+        Description:
+            Returns the LITP uuid of a device.
+        Args:
+            device (str): The device name, e.g. sdb.
+        Returns:
+            str. The uuid, or None if the device has no link.
+        """
+        link = self.get_link(device)
+        return self.get_uuid_from_link(link) if link else None
@@ -0,0 +1,277 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Grub configuration of a set of nodes. grub.cfg, the SFHA grub
+            script, the default grub file and their backups are read from
+            every node with one shell execution per node, run on all nodes
+            concurrently, and parsed into kernel command lines and their
+            rd.lvm.lv volumes so that the volumes in grub are checked from
+            memory.
+'''
+
+import re
+import test_constants
+from node_fanout import NodeFanout
+from remote_session import RemoteSession
+from snapshot_names import SnapshotNames
+
+
+class GrubEntry(object):
+    """
+    A kernel command line of a grub file.
+    """
+
+    __slots__ = ('line', 'kernel', 'lvs')
+
+    LV_RE = re.compile(r'\brd\.lvm\.lv=([^\s"\']+)')
+    KERNEL_RE = re.compile(r'(\S*vmlinuz\S*)')
+
+    def __init__(self, line):
+        """
+        Description:
+            Parses a kernel line, or a GRUB_CMDLINE_LINUX setting.
+        Args:
+            line (str): The line.
+        """
+        self.line = line
+        match = self.KERNEL_RE.search(line)
+        self.kernel = match.group(1) if match else None
+        self.lvs = set(self.LV_RE.findall(line))
+
+    def __repr__(self):
+        return "GrubEntry({0} {1})".format(self.kernel, sorted(self.lvs))
+
+
+class GrubFile(object):
+    """
+    A grub file read from a node.
+    """
+
+    KERNEL_MARKER = 'vmlinuz'
+    CMDLINE_PREFIX = 'GRUB_CMDLINE_LINUX'
+
+    def __init__(self, path, lines):
+        """
+        Description:
+            Parses the kernel lines of a file.
+        Args:
+            path (str): The file path.
+            lines (list): The file contents.
+        """
+        self.path = path
+        self.lines = lines
+        self.entries = [GrubEntry(line) for line in lines
+                        if self.KERNEL_MARKER in line or
+                        line.strip().startswith(self.CMDLINE_PREFIX)]
+
+    @property
+    def lvs(self):
+        """ The rd.lvm.lv volumes of all the kernel lines, as vg/lv. """
+        lvs = set()
+        for entry in self.entries:
+            lvs.update(entry.lvs)
+        return lvs
+
+    def contains(self, text):
+        """
+        Description:
+            Checks whether a line of the file contains a text.
+        Args:
+            text (str): The text.
+        Returns:
+            bool. True if found.
+        """
+        return any(text in line for line in self.lines)
+
+    def __repr__(self):
+        return "GrubFile({0} {1} entries)".format(self.path,
+                                                  len(self.entries))
+
+
+class GrubState(object):
+    """
+    The grub files of a set of nodes.
+    """
+
+    CONFIG_FILE = test_constants.GRUB_CONFIG_FILE
+    SFHA_FILE = '/etc/grub.d/03_vxdmp_config_script'
+    DEFAULT_FILE = '/etc/default/grub'
+    BACKUP_SUFFIX = '.backup'
+    # FILES WHOSE KERNEL LINES LIST THE LVM VOLUMES
+    LV_FILES = (CONFIG_FILE, SFHA_FILE, DEFAULT_FILE)
+    ALL_FILES = LV_FILES + (CONFIG_FILE + BACKUP_SUFFIX,
+                            SFHA_FILE + BACKUP_SUFFIX,
+                            DEFAULT_FILE + BACKUP_SUFFIX)
+
+    def __init__(self, test, fanout=None):
+        """
+        Description:
+            Creates an empty state bound to a test case.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            fanout (NodeFanout): Fan-out used to query the nodes; one is
+                                 created if not given.
+        """
+        self.test = test
+        self.fanout = fanout or NodeFanout(test)
+        self.files = {}
+        self.nodes = []
+
+    @staticmethod
+    def get_backup_path(path):
+        """ Returns the path of the backup of a grub file. """
+        return path + GrubState.BACKUP_SUFFIX
+
+    def _collect_node(self, node, paths):
+        """
+        Description:
+            Reads the files of a node with one root shell execution.
+        Args:
+            node (str): The node filename.
+            paths (list): The file paths.
+        Returns:
+            dict. The GrubFile keyed by path, None for a missing file.
+        """
+        results = RemoteSession(self.test, node).run_commands(
+            ['/bin/cat {0}'.format(path) for path in paths])
+        return dict((path, GrubFile(path, result.stdout)
+                     if result.rc == 0 else None)
+                    for path, result in zip(paths, results))
+
+    def collect(self, nodes, paths=ALL_FILES):
+        """
+        Description:
+            Reads the files of the nodes concurrently, replacing what was
+            read before.
+        Args:
+            nodes (list): The node filenames.
+            paths (list): The file paths.
+        Returns:
+            dict. node -> path -> GrubFile, or None for a missing file.
+        """
+        paths = list(paths)
+        self.files = self.fanout.map(
+            lambda node: self._collect_node(node, paths), nodes)
+        self.nodes = [node for node in nodes if node in self.files]
+        return self.files
+
+    def get(self, node, path=CONFIG_FILE):
+        """
+        Description:
+            Returns a collected file.
+        Args:
+            node (str): The node filename.
+            path (str): The file path.
+        Returns:
+            GrubFile. The file, or None if it is missing on the node.
+        """
+        return self.files[node][path]
+
+    def exists(self, node, path):
+        """ Checks whether a collected file exists on a node. """
+        return self.get(node, path) is not None
+
+    def contains(self, node, text, path=CONFIG_FILE):
+        """
+        Description:
+            Checks whether a collected file contains a text.
+        Args:
+            node (str): The node filename.
+            text (str): The text.
+            path (str): The file path.
+        Returns:
+            bool. True if the file exists and contains the text.
+        """
+        grub_file = self.get(node, path)
+        return grub_file is not None and grub_file.contains(text)
+
+    def matches_backup(self, node, path=CONFIG_FILE):
+        """
+        Description:
+            Checks whether a file and its backup both exist on a node and
+            have the same contents.
+        Args:
+            node (str): The node filename.
+            path (str): The file path.
+        Returns:
+            bool. True if they are identical.
+        """
+        grub_file = self.get(node, path)
+        backup = self.get(node, self.get_backup_path(path))
+        return grub_file is not None and backup is not None and \
+            grub_file.lines == backup.lines
+
+    @staticmethod
+    def is_fs_lv(lv_path, vg_id, fs_id, mount_point=None):
+        """
+        Description:
+            Checks whether an rd.lvm.lv volume is that of a file system,
+            by the exact LV name LITP gives it.
+        Args:
+            lv_path (str): The vg/lv value.
+            vg_id (str): The id of the volume group item.
+            fs_id (str): The id of the file system item.
+            mount_point (str): The mount point of the file system; needed
+                               for the kickstart file systems of the MS.
+        Returns:
+            bool. True if it is.
+        """
+        return lv_path.rsplit('/', 1)[-1] == SnapshotNames.get_lv_name(
+            vg_id, fs_id, mount_point)
+
+    def find_fs(self, fss, nodes=None, paths=LV_FILES):
+        """
+        Description:
+            Returns the files listing the volume of each file system.
+        Args:
+            fss (list): The (vg id, fs id) of each file system, with the
+                        mount point as a third item for the kickstart
+                        file systems of the MS.
+            nodes (list): The nodes, by default all collected ones.
+            paths (list): The files to look in.
+        Returns:
+            dict. LV name -> node -> sorted paths of the files listing
+                  it; every node is present, possibly with no paths.
+        """
+        found = {}
+        for fsystem in fss:
+            lv_name = SnapshotNames.get_lv_name(*fsystem)
+            found[lv_name] = {}
+            for node in nodes or self.nodes:
+                found[lv_name][node] = sorted(
+                    path for path in paths
+                    if self.get(node, path) is not None and
+                    any(self.is_fs_lv(lv_path, *fsystem)
+                        for lv_path in self.get(node, path).lvs))
+        return found
+
+    def verify_lvs(self, fss, present=True, nodes=None, paths=LV_FILES):
+        """
+        Description:
+            Asserts that the volume of every file system is listed in
+            every file on every node, or in none of them, reporting all
+            the exceptions at once.
+        Args:
+            fss (list): The (vg id, fs id) of each file system, as for
+                        find_fs.
+            present (bool): False to assert that none is listed.
+            nodes (list): The nodes, by default all collected ones.
+            paths (list): The files to look in.
+        """
+        wrong = []
+        for lv_name, node_paths in sorted(self.find_fs(fss, nodes,
+                                                       paths).items()):
+            for node, found in sorted(node_paths.items()):
+                if present:
+                    wrong.extend((node, path, lv_name) for path in paths
+                                 if path not in found)
+                else:
+                    wrong.extend((node, path, lv_name) for path in found)
+        self.test.assertEqual([], wrong, "File systems {0} grub: {1}".format(
+            'missing from' if present else 'unexpectedly in', wrong))
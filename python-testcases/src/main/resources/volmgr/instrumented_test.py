@@ -0,0 +1,62 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Shared setUp of the volmgr testsets. Starts the command
+            fixtures and the command profiler, which do nothing unless
+            enabled through their environment variables, waits for plans
+            with the PlanWatcher and, in testsets that wait for log
+            messages, follows the MS system log with a LogWatcher. When
+            the fixtures are replayed the GenericTest setUp and tearDown,
+            which need a deployment, are skipped.
+'''
+
+from plan_watcher import PlanWatcher
+from command_profiler import CommandProfiler
+from command_fixtures import CommandFixtures
+from log_watcher import LogWatcher
+
+
+class InstrumentedTestMixin(object):
+    """
+    Mixin placed before GenericTest in the bases of a testset, e.g.
+    class Story2115(InstrumentedTestMixin, GenericTest).
+    """
+
+    # SET IN TESTSETS WAITING FOR LOG MESSAGES ON THE MS; THE LOG SIZE IS
+    # THEN READ ONCE PER TEST
+    WATCH_LOG = False
+
+    def setUp(self):
+        """
+        Description:
+            Starts the fixtures, runs the GenericTest setUp and installs
+            the watchers and the profiler.
+        """
+        self.fixtures = CommandFixtures(self)
+        self.fixtures.start()
+        if not self.fixtures.offline:
+            super(InstrumentedTestMixin, self).setUp()
+        self.plan_watcher = PlanWatcher(self, clock=self.fixtures.clock,
+                                        sleep=self.fixtures.sleep)
+        self.wait_for_plan_state = self.plan_watcher.wait_for_plan_state
+        self.profiler = CommandProfiler(self)
+        self.profiler.start()
+        if self.WATCH_LOG:
+            self.log_watcher = LogWatcher(
+                self, self.get_management_node_filename())
+            self.log_watcher.mark()
+            self.wait_for_log_msg = self.log_watcher.wait_for_log_msg
+
+    def tearDown(self):
+        """
+        Description:
+            Runs the GenericTest tearDown, unless replaying.
+        """
+        if not self.fixtures.offline:
+            super(InstrumentedTestMixin, self).tearDown()
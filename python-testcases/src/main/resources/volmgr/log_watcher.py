@@ -0,0 +1,256 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Log message waiter. Records the size of a log when the test
+            starts and follows only the content written after it with a
+            single "tail -F" per wait, instead of grepping the whole log
+            on every poll, so the cost of a wait does not grow with the
+            log. Provides a drop in replacement for
+            GenericTest.wait_for_log_msg.
+'''
+
+import re
+import test_constants
+
+
+class LogMatch(object):
+    """
+    The first log line found by a wait.
+    """
+
+    __slots__ = ('message', 'line', 'offset', 'timestamp')
+
+    def __init__(self, message, line, offset, timestamp):
+        """
+        Description:
+            Creates a match.
+        Args:
+            message (str): The message that matched.
+            line (str): The log line.
+            offset (int): Byte offset of the line in the log, None if
+                          the wait started from a line number.
+            timestamp (str): The syslog timestamp of the line, or None.
+        """
+        self.message = message
+        self.line = line
+        self.offset = offset
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return "LogMatch({0!r} at {1} {2})".format(self.message,
+                                                  self.offset,
+                                                  self.timestamp)
+
+
+class LogWatcher(object):
+    """
+    Waits for messages to appear in a log of a node.
+    """
+
+    # TRADITIONAL "Oct 17 10:00:00" OR RFC 3339 SYSLOG TIMESTAMPS
+    TIMESTAMP_RE = re.compile(
+        r'^(\d{4}-\d\d-\d\dT\S+|[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d)')
+    DEFAULT_TIMEOUT_SECS = 120
+    # EXTRA TIME GIVEN TO THE su SESSION BEYOND THE FOLLOW TIMEOUT
+    SU_TIMEOUT_MARGIN_SECS = 30
+
+    def __init__(self, test, node,
+                 log_path=test_constants.GEN_SYSTEM_LOG_PATH):
+        """
+        Description:
+            Creates a watcher for a log. Until mark is called the whole
+            log is followed.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            node (str): The node filename.
+            log_path (str): The log file.
+        """
+        self.test = test
+        self.node = node
+        self.log_path = log_path
+        self.offset = 0
+        self._wait_for_log_msg = test.wait_for_log_msg
+
+    def mark(self):
+        """
+        Description:
+            Records the current size of the log; later waits only look at
+            what is written after it.
+        Returns:
+            int. The byte offset.
+        """
+        stdout, _, _ = self.test.run_command(
+            self.node, '/usr/bin/stat -c %s {0}'.format(self.log_path),
+            su_root=True, default_asserts=True)
+        self.offset = int(stdout[0])
+        return self.offset
+
+    @staticmethod
+    def quote(text):
+        """
+        Description:
+            Quotes a string for the shell.
+        Args:
+            text (str): The string.
+        Returns:
+            str. The quoted string.
+        """
+        return "'{0}'".format(text.replace("'", "'\\''"))
+
+    def get_follow_cmd(self, grep_args, timeout_sec, offset=None,
+                       log_len=None):
+        """
+        Description:
+            Builds the command following the log until the first matching
+            line or the timeout. The start offset is printed first; it is
+            reset to 0 if the log was rotated and is now smaller. grep -b
+            prints the byte position of the match relative to it. tail
+            runs as a coprocess and is killed once grep has matched, as
+            it would otherwise only exit on its next write or timeout.
+        Args:
+            grep_args (str): The grep pattern arguments.
+            timeout_sec (int): The maximum time to follow the log.
+            offset (int): The byte offset to start from.
+            log_len (int): The number of lines to skip instead of offset.
+        Returns:
+            str. The command.
+        """
+        tail = "coproc /usr/bin/timeout {0} /usr/bin/tail".format(
+            max(1, int(timeout_sec)))
+        if log_len:
+            start = "echo 0; {0} -n +{1}".format(tail, log_len + 1)
+        else:
+            start = "O={0}; [ $(/usr/bin/stat -c %s {1}) -lt $O ] && O=0; " \
+                    "echo $O; {2} -c +$((O + 1))".format(
+                        offset, self.log_path, tail)
+        return "{0} -F {1} 2>/dev/null; " \
+               "/bin/grep -m1 -b {2} <&${{COPROC[0]}}; " \
+               "kill $COPROC_PID 2>/dev/null".format(
+                   start, self.log_path, grep_args)
+
+    def _follow(self, grep_args, timeout_sec, offset, log_len=None):
+        """
+        Description:
+            Follows the log until the first matching line.
+        Args:
+            grep_args (str): The grep pattern arguments.
+            timeout_sec (int): The maximum time to wait.
+            offset (int): The byte offset to start from.
+            log_len (int): The number of lines to skip instead of offset.
+        Returns:
+            tuple. The byte offset and text of the line, or None on
+                   timeout. The offset is None when log_len is given.
+        """
+        stdout, _, _ = self.test.run_command(
+            self.node, self.get_follow_cmd(grep_args, timeout_sec, offset,
+                                           log_len), su_root=True,
+            su_timeout_secs=timeout_sec + self.SU_TIMEOUT_MARGIN_SECS)
+        if len(stdout) < 2 or ':' not in stdout[1]:
+            return None
+        position, line = stdout[1].split(':', 1)
+        if log_len:
+            return None, line
+        return int(stdout[0]) + int(position), line
+
+    def get_timestamp(self, line):
+        """
+        Description:
+            Returns the syslog timestamp at the start of a line.
+        Args:
+            line (str): The log line.
+        Returns:
+            str. The timestamp, or None.
+        """
+        match = self.TIMESTAMP_RE.match(line)
+        return match.group(1) if match else None
+
+    def wait_for(self, messages, timeout_sec=DEFAULT_TIMEOUT_SECS,
+                 offset=None):
+        """
+        Description:
+            Waits for any of several messages, taken literally, to be
+            written to the log after the mark.
+        Args:
+            messages (list): The messages.
+            timeout_sec (int): The maximum time to wait.
+            offset (int): The byte offset to start from instead of the
+                          mark.
+        Returns:
+            LogMatch. The first matching line, or None on timeout.
+        """
+        matcher = re.compile('|'.join(re.escape(message)
+                                      for message in messages))
+        found = self._follow(
+            '-F ' + ' '.join('-e ' + self.quote(message)
+                             for message in messages),
+            timeout_sec, self.offset if offset is None else offset)
+        if found is None:
+            return None
+        position, line = found
+        match = matcher.search(line)
+        return LogMatch(match.group(0) if match else None, line, position,
+                        self.get_timestamp(line))
+
+    def wait_for_pattern(self, pattern, timeout_sec=DEFAULT_TIMEOUT_SECS,
+                         offset=None):
+        """
+        Description:
+            Waits for a line matching an extended regular expression to be
+            written to the log after the mark.
+        Args:
+            pattern (str): The expression, e.g. "litp.*[Pp]lan".
+            timeout_sec (int): The maximum time to wait.
+            offset (int): The byte offset to start from instead of the
+                          mark.
+        Returns:
+            LogMatch. The first matching line, or None on timeout.
+        """
+        found = self._follow('-E -e ' + self.quote(pattern), timeout_sec,
+                             self.offset if offset is None else offset)
+        if found is None:
+            return None
+        position, line = found
+        match = re.search(pattern, line)
+        return LogMatch(match.group(0) if match else None, line, position,
+                        self.get_timestamp(line))
+
+    def wait_for_log_msg(self, node, msg,
+                         log_file=test_constants.GEN_SYSTEM_LOG_PATH,
+                         timeout_sec=DEFAULT_TIMEOUT_SECS, log_len=None,
+                         **kwargs):
+        """
+        Description:
+            Drop in replacement for GenericTest.wait_for_log_msg. The
+            message is a grep pattern in double quotes, as before, and is
+            looked for after log_len lines or, by default, after the mark.
+            Waits on other nodes or logs, or with further arguments, use
+            the GenericTest method.
+        Args:
+            node (str): The node filename.
+            msg (str): The message.
+            log_file (str): The log file.
+            timeout_sec (int): The maximum time to wait.
+            log_len (int): The number of lines to skip.
+            kwargs: Further GenericTest.wait_for_log_msg arguments.
+        Returns:
+            bool. True if the message is found.
+        """
+        if node != self.node or log_file != self.log_path or kwargs:
+            return self._wait_for_log_msg(node, msg, log_file=log_file,
+                                          timeout_sec=timeout_sec,
+                                          log_len=log_len or 0, **kwargs)
+        found = self._follow('-e "{0}"'.format(msg), timeout_sec,
+                             self.offset, log_len)
+        if found is None:
+            self.test.log('info', 'Log message "{0}" not found in {1}s'
+                          .format(msg, timeout_sec))
+            return False
+        self.test.log('info', 'Log message "{0}" found: {1}'.format(
+            msg, found[1]))
+        return True
@@ -0,0 +1,284 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Collects the name, volume group, size, attributes, origin,
+            file system type and mount point of every logical volume on
+            a node in a single root shell execution and indexes them as
+            typed records.
+'''
+
+import re
+from node_fanout import NodeFanout
+from remote_session import RemoteSession
+from size_utils import Size
+
+
+class LvRecord(object):
+    """
+    A single LVM logical volume.
+    """
+
+    __slots__ = ('node', 'vg_name', 'lv_name', 'size', 'attr', 'origin',
+                 'fs_type', 'mount_point')
+
+    def __init__(self, node, vg_name, lv_name, size, attr, origin=None):
+        """
+        Description:
+            Creates a record read from the lvs report.
+        Args:
+            node (str): The node filename.
+            vg_name (str): The volume group name.
+            lv_name (str): The logical volume name.
+            size (Size): The logical volume size.
+            attr (str): The lvs attribute string, e.g. "-wi-ao----".
+            origin (str): The origin of a snapshot volume.
+        """
+        self.node = node
+        self.vg_name = vg_name
+        self.lv_name = lv_name
+        self.size = size
+        self.attr = attr
+        self.origin = origin or None
+        self.fs_type = None
+        self.mount_point = None
+
+    @property
+    def path(self):
+        """ The /dev/<vg>/<lv> path of the volume. """
+        return '/dev/{0}/{1}'.format(self.vg_name, self.lv_name)
+
+    @property
+    def dm_path(self):
+        """ The /dev/mapper path; dashes in names are doubled. """
+        return '/dev/mapper/{0}-{1}'.format(self.vg_name.replace('-', '--'),
+                                            self.lv_name.replace('-', '--'))
+
+    @property
+    def is_snapshot(self):
+        """ True for a snapshot volume. """
+        return self.attr[:1] in ('s', 'S')
+
+    @property
+    def is_origin(self):
+        """ True for a volume which has snapshots. """
+        return self.attr[:1] in ('o', 'O')
+
+    @property
+    def is_open(self):
+        """ True if the volume device is open, e.g. mounted. """
+        return self.attr[5:6] == 'o'
+
+    def __repr__(self):
+        return "LvRecord({0}/{1} {2} {3} node={4})".format(
+            self.vg_name, self.lv_name, self.size, self.attr, self.node)
+
+
+class LvInventory(object):
+    """
+    Logical volume inventory of a set of nodes.
+    """
+
+    LVS_CMD = "/sbin/lvs --noheadings --nameprefixes --units b --nosuffix " \
+              "-o vg_name,lv_name,lv_size,lv_attr,origin"
+    # "-c /dev/null" PROBES THE DEVICES INSTEAD OF READING THE BLKID CACHE
+    BLKID_CMD = "/sbin/blkid -c /dev/null -s TYPE"
+    MOUNTS_CMD = "/bin/cat /proc/mounts"
+    NAME_PREFIX_RE = re.compile(r"LVM2_(\w+)='([^']*)'")
+    BLKID_RE = re.compile(r'^(\S+): .*TYPE="([^"]*)"')
+
+    def __init__(self, test, fanout=None):
+        """
+        Description:
+            Creates an empty inventory bound to a test case.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            fanout (NodeFanout): Fan-out used to query the nodes; one is
+                                 created if not given.
+        """
+        self.test = test
+        self.fanout = fanout or NodeFanout(test)
+        self.inventory = {}
+        self.nodes = []
+
+    @classmethod
+    def parse_lvs_output(cls, lines, node=None):
+        """
+        Description:
+            Parses "lvs --nameprefixes" output.
+        Args:
+            lines (list): The lvs output lines.
+            node (str): The node the output was taken from.
+        Returns:
+            list. The LvRecord of each volume.
+        """
+        records = []
+        for line in lines:
+            fields = dict(cls.NAME_PREFIX_RE.findall(line))
+            if 'LV_NAME' not in fields:
+                continue
+            records.append(LvRecord(node, fields['VG_NAME'],
+                                    fields['LV_NAME'],
+                                    Size(fields['LV_SIZE']),
+                                    fields.get('LV_ATTR', ''),
+                                    fields.get('ORIGIN')))
+        return records
+
+    @classmethod
+    def parse_blkid_output(cls, lines):
+        """
+        Description:
+            Parses "blkid -s TYPE" output.
+        Args:
+            lines (list): The blkid output lines.
+        Returns:
+            dict. The file system type of each device.
+        """
+        types = {}
+        for line in lines:
+            match = cls.BLKID_RE.match(line.strip())
+            if match:
+                types[match.group(1)] = match.group(2)
+        return types
+
+    @staticmethod
+    def parse_mounts_output(lines):
+        """
+        Description:
+            Parses /proc/mounts. Octal escapes in mount points, e.g. \\040
+            for a space, are decoded.
+        Args:
+            lines (list): The /proc/mounts lines.
+        Returns:
+            dict. The first mount point of each device.
+        """
+        mounts = {}
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 2:
+                continue
+            mount_point = re.sub(r'\\([0-7]{3})',
+                                 lambda match: chr(int(match.group(1), 8)),
+                                 fields[1])
+            mounts.setdefault(fields[0], mount_point)
+        return mounts
+
+    @classmethod
+    def build_records(cls, lvs_lines, blkid_lines, mounts_lines, node=None):
+        """
+        Description:
+            Builds the records of a node from the collected outputs.
+        Args:
+            lvs_lines (list): The lvs output lines.
+            blkid_lines (list): The blkid output lines.
+            mounts_lines (list): The /proc/mounts lines.
+            node (str): The node the output was taken from.
+        Returns:
+            list. The LvRecord of each volume.
+        """
+        records = cls.parse_lvs_output(lvs_lines, node)
+        types = cls.parse_blkid_output(blkid_lines)
+        mounts = cls.parse_mounts_output(mounts_lines)
+        for record in records:
+            for device in (record.dm_path, record.path):
+                if record.fs_type is None:
+                    record.fs_type = types.get(device)
+                if record.mount_point is None:
+                    record.mount_point = mounts.get(device)
+        return records
+
+    def _collect_node(self, node):
+        """
+        Description:
+            Collects the records of a node with one root shell execution.
+        Args:
+            node (str): The node filename.
+        Returns:
+            list. The LvRecord of each volume.
+        """
+        lvs_res, blkid_res, mounts_res = RemoteSession(
+            self.test, node).run_commands(
+                [self.LVS_CMD, self.BLKID_CMD, self.MOUNTS_CMD])
+        self.test.assertEqual([], lvs_res.stderr)
+        self.test.assertEqual(0, lvs_res.rc)
+        self.test.assertEqual(0, mounts_res.rc)
+        return self.build_records(lvs_res.stdout, blkid_res.stdout,
+                                  mounts_res.stdout, node)
+
+    def collect(self, nodes):
+        """
+        Description:
+            Collects the inventory of every node concurrently.
+        Args:
+            nodes (list): The node filenames.
+        Returns:
+            dict. node -> list of LvRecord.
+        """
+        self.nodes = []
+        for node in nodes:
+            if node not in self.nodes:
+                self.nodes.append(node)
+        self.inventory = self.fanout.map(self._collect_node, self.nodes)
+        return self.inventory
+
+    def find(self, nodes=None, vg_name=None, lv_name=None, origin=None,
+             snapshots=None):
+        """
+        Description:
+            Returns the records of the last collected inventory matching
+            all of the given criteria, in node order.
+        Args:
+            nodes (list): Only return records from these nodes.
+            vg_name (str): The volume group name.
+            lv_name (str): The logical volume name.
+            origin (str): The origin volume name of a snapshot.
+            snapshots (bool): True for only snapshots, False for only
+                              volumes that are not snapshots.
+        Returns:
+            list. The matching LvRecord objects.
+        """
+        records = []
+        for node in self.nodes:
+            if nodes is not None and node not in nodes:
+                continue
+            for record in self.inventory[node]:
+                if (vg_name is None or record.vg_name == vg_name) and \
+                   (lv_name is None or record.lv_name == lv_name) and \
+                   (origin is None or record.origin == origin) and \
+                   (snapshots is None or record.is_snapshot == snapshots):
+                    records.append(record)
+        return records
+
+    def get(self, node, lv_name, vg_name=None):
+        """
+        Description:
+            Returns a volume of a node.
+        Args:
+            node (str): The node filename.
+            lv_name (str): The logical volume name.
+            vg_name (str): The volume group name, if it is known.
+        Returns:
+            LvRecord. The volume, or None if it does not exist.
+        """
+        records = self.find([node], vg_name, lv_name)
+        return records[0] if records else None
+
+    def get_by_mount_point(self, node, mount_point):
+        """
+        Description:
+            Returns the volume mounted on a mount point of a node.
+        Args:
+            node (str): The node filename.
+            mount_point (str): The mount point.
+        Returns:
+            LvRecord. The volume, or None if no volume is mounted there.
+        """
+        for record in self.inventory.get(node, []):
+            if record.mount_point == mount_point:
+                return record
+        return None
@@ -0,0 +1,149 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Batch of model property updates. Updates of many items are
+            queued and checked locally, merged into one litp update per
+            item, sent to the MS in one batched execution and deployed
+            with a single plan.
+'''
+
+import re
+import test_constants
+from remote_session import RemoteSession
+from size_utils import Size
+
+
+class ModelUpdateBatch(object):
+    """
+    Queued property updates of model items.
+    """
+
+    # PROPERTIES HOLDING A LITP SIZE, WHICH MAY ONLY GROW
+    SIZE_PROPS = ('size',)
+    LITP_SIZE_RE = re.compile(r'^[1-9][0-9]*[MGT]$')
+
+    def __init__(self, test, ms_node, journal=None):
+        """
+        Description:
+            Creates an empty batch.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            ms_node (str): Filename of the management server.
+            journal (ModelJournal): Journal recording the updates, if any.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.journal = journal
+        self.queued = {}
+        self.baselines = {}
+        self._order = []
+
+    def _get_baseline(self, url, prop, current):
+        """
+        Description:
+            Returns the value a property has in the model before the batch
+            is applied, read once per item and property.
+        Args:
+            url (str): The model path of the item.
+            prop (str): The property name.
+            current (dict): Current property values known to the caller.
+        Returns:
+            str. The value.
+        """
+        baseline = self.baselines.setdefault(url, {})
+        if prop not in baseline:
+            if current and prop in current:
+                baseline[prop] = current[prop]
+            else:
+                baseline[prop] = self.test.get_props_from_url(
+                    self.ms_node, url, filter_prop=prop)
+        return baseline[prop]
+
+    def queue(self, url, props, current=None):
+        """
+        Description:
+            Checks and queues updates of an item. A size must be in the
+            LITP format, e.g. 1024M, and must not be smaller than the
+            size in the model; a change of unit alone is allowed. Updates
+            of an item already queued are merged, the last value winning,
+            so intermediate values are never sent to LITP.
+        Args:
+            url (str): The model path of the item.
+            props (dict): The new property values.
+            current (dict): Current property values, if known, to avoid
+                            reading them from the model.
+        """
+        for prop, value in props.items():
+            if prop not in self.SIZE_PROPS:
+                continue
+            self.test.assertTrue(self.LITP_SIZE_RE.match(value),
+                                 "Invalid {0} '{1}' for {2}".format(
+                                     prop, value, url))
+            old_value = self._get_baseline(url, prop, current)
+            self.test.assertTrue(Size.parse(value) >= Size.parse(old_value),
+                                 "{0} of {1} cannot shrink from {2} to "
+                                 "{3}".format(prop, url, old_value, value))
+        if url not in self.queued:
+            self.queued[url] = {}
+            self._order.append(url)
+        self.queued[url].update(props)
+
+    def apply(self):
+        """
+        Description:
+            Runs the litp update of every queued item in one batched
+            execution on the MS and empties the batch.
+        Returns:
+            dict. The applied property values keyed by item path.
+        """
+        applied = dict(self.queued)
+        cmds = []
+        for url in self._order:
+            if self.journal:
+                self.journal.read_original(url)
+            cmds.append(self.test.cli.get_update_cmd(url, ' '.join(
+                "{0}={1}".format(prop, value)
+                for prop, value in sorted(self.queued[url].items()))))
+        if cmds:
+            results = RemoteSession(self.test, self.ms_node,
+                                    su_root=False).run_commands(cmds)
+            for url, cmd, result in zip(self._order, cmds, results):
+                self.test.assertEqual(0, result.rc,
+                                      "{0} failed: {1}".format(
+                                          cmd, result.stderr))
+                if self.journal:
+                    self.journal.record(url, self.queued[url])
+        self.queued = {}
+        self.baselines = {}
+        self._order = []
+        return applied
+
+    def commit(self, plan_timeout_mins=10, verify=True):
+        """
+        Description:
+            Applies the batch and runs a single plan deploying it.
+        Args:
+            plan_timeout_mins (int): The plan timeout.
+            verify (bool): Check that every item shows its new values
+                           once the plan has completed.
+        Returns:
+            dict. The applied property values keyed by item path.
+        """
+        applied = self.apply()
+        if not applied:
+            return applied
+        self.test.run_and_check_plan(self.ms_node,
+                                     test_constants.PLAN_COMPLETE,
+                                     plan_timeout_mins=plan_timeout_mins)
+        if verify:
+            for url, props in sorted(applied.items()):
+                for prop, value in sorted(props.items()):
+                    self.test.assertEqual(value, self.test.get_props_from_url(
+                        self.ms_node, url, filter_prop=prop))
+        return applied
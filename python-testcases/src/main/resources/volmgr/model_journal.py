@@ -0,0 +1,198 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Journal of the model properties a test updates through
+            execute_cli_update_cmd. Replaces backup_path_props: an item is
+            only shown when it is first updated, and at cleanup only the
+            properties whose value changed are restored, all in one
+            batched execution on the MS.
+'''
+
+import shlex
+from remote_session import RemoteSession
+
+
+class ModelJournal(object):
+    """
+    Records property updates of tracked model items and reverts them.
+    """
+
+    def __init__(self, test, ms_node):
+        """
+        Description:
+            Creates an empty journal.
+        Args:
+            test (GenericTest): The test case whose updates are recorded.
+            ms_node (str): Filename of the management server.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.originals = {}
+        self.changes = {}
+        self._tracked = []
+        self._update = None
+
+    def start(self):
+        """
+        Description:
+            Wraps execute_cli_update_cmd of the test case so that updates
+            of tracked items are recorded.
+        """
+        self._update = self.test.execute_cli_update_cmd
+        self.test.execute_cli_update_cmd = self._journaled_update
+
+    def track(self, url):
+        """
+        Description:
+            Starts tracking an item, in place of backup_path_props. The
+            restore cleanup is registered with the first tracked item.
+        Args:
+            url (str): The model path of the item.
+        """
+        if not self._tracked:
+            self.test.addCleanup(self.restore)
+        if url not in self._tracked:
+            self._tracked.append(url)
+
+    def read_original(self, url):
+        """
+        Description:
+            Reads the original properties of a tracked item, once, before
+            its first update.
+        Args:
+            url (str): The model path of the item.
+        Returns:
+            bool. Whether the item is tracked.
+        """
+        if url not in self._tracked:
+            return False
+        if url not in self.originals:
+            self.originals[url] = self.test.get_props_from_url(
+                self.ms_node, url)
+        return True
+
+    def record(self, url, values):
+        """
+        Description:
+            Records the new values of a tracked item, for updates run
+            without execute_cli_update_cmd, e.g. by ModelUpdateBatch.
+            read_original must be called before the update.
+        Args:
+            url (str): The model path of the item.
+            values (dict): The new value of each property, None if deleted.
+        """
+        if url in self._tracked:
+            self.changes.setdefault(url, {}).update(values)
+
+    @staticmethod
+    def parse_props(props, action_del=False):
+        """
+        Description:
+            Parses the properties of an update.
+        Args:
+            props (str): The update properties, e.g. "size=1G name='a b'",
+                         or the property names of a deletion.
+            action_del (bool): Whether the properties are deleted.
+        Returns:
+            dict. The new value of each property, None if deleted.
+        """
+        values = {}
+        for token in shlex.split(props or ''):
+            if action_del:
+                values[token] = None
+            elif '=' in token:
+                name, value = token.split('=', 1)
+                values[name] = value
+        return values
+
+    def _journaled_update(self, node, url, *args, **kwargs):
+        """
+        Description:
+            Runs execute_cli_update_cmd, recording the new values if the
+            item is tracked and the update succeeded. The original
+            properties of the item are read before its first update.
+        Args:
+            node (str): The node the command is run on.
+            url (str): The model path of the item.
+            args: Further execute_cli_update_cmd arguments.
+            kwargs: Further execute_cli_update_cmd arguments.
+        Returns:
+            The execute_cli_update_cmd result.
+        """
+        if node != self.ms_node or not self.read_original(url):
+            return self._update(node, url, *args, **kwargs)
+        result = self._update(node, url, *args, **kwargs)
+        if result[2] == 0:
+            props = kwargs.get('props', args[0] if args else None)
+            self.record(url, self.parse_props(
+                props, kwargs.get('action_del', False)))
+        return result
+
+    def get_inverse(self):
+        """
+        Description:
+            Returns the minimal updates reverting the recorded changes.
+            Properties set back to their original value are left alone.
+        Returns:
+            list. (url, {property: value}, [deleted property]) per item
+                  needing an update, in tracking order.
+        """
+        inverse = []
+        for url in self._tracked:
+            original = self.originals.get(url) or {}
+            restore = {}
+            delete = []
+            for name, value in sorted(self.changes.get(url, {}).items()):
+                if original.get(name) == value:
+                    continue
+                if name in original:
+                    restore[name] = original[name]
+                else:
+                    delete.append(name)
+            if restore or delete:
+                inverse.append((url, restore, delete))
+        return inverse
+
+    def get_restore_cmds(self):
+        """
+        Description:
+            Returns the litp update commands reverting the changes.
+        Returns:
+            list. The commands.
+        """
+        cmds = []
+        for url, restore, delete in self.get_inverse():
+            if restore:
+                cmds.append(self.test.cli.get_update_cmd(url, ' '.join(
+                    "{0}='{1}'".format(name, value)
+                    for name, value in sorted(restore.items()))))
+            if delete:
+                cmds.append(self.test.cli.get_update_cmd(
+                    url, ' '.join(delete), action_del=True))
+        return cmds
+
+    def restore(self):
+        """
+        Description:
+            Reverts the recorded changes with one batched execution on the
+            MS and clears the journal.
+        """
+        cmds = self.get_restore_cmds()
+        if cmds:
+            self.test.log('info', 'Restoring {0} updated model items'.format(
+                len(self.get_inverse())))
+            results = RemoteSession(self.test, self.ms_node,
+                                    su_root=False).run_commands(cmds)
+            for cmd, result in zip(cmds, results):
+                self.test.assertEqual(0, result.rc,
+                                      "{0} failed: {1}".format(
+                                          cmd, result.stderr))
+        self.originals = {}
+        self.changes = {}
+        self._tracked = []
@@ -0,0 +1,258 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   In-memory snapshot of the LITP model used by the volmgr
+            testsets. The model is fetched with a single recursive
+            "litp show" per root path and then queried from memory instead
+            of issuing one "litp show" per item and property.
+'''
+
+
+class ModelItem(object):
+    """
+    A single item of the LITP model as reported by "litp show -r".
+    """
+
+    __slots__ = ('path', 'item_type', 'state', 'source', 'properties',
+                 'inherited_props')
+
+    def __init__(self, path):
+        """
+        Description:
+            Creates an empty item for the given model path.
+        Args:
+            path (str): Model path of the item.
+        """
+        self.path = path
+        self.item_type = None
+        self.state = None
+        self.source = None
+        self.properties = {}
+        self.inherited_props = set()
+
+    @property
+    def item_id(self):
+        """
+        Description:
+            The id of the item, i.e. the last element of its path.
+        Returns:
+            str. The item id.
+        """
+        return self.path.rsplit('/', 1)[-1]
+
+    @property
+    def base_type(self):
+        """
+        Description:
+            The item type with any "reference-to-" prefix removed, so that
+            inherited items match the type of their source.
+        Returns:
+            str. The base item type.
+        """
+        if self.item_type and \
+           self.item_type.startswith(ModelSnapshot.REFERENCE_PREFIX):
+            return self.item_type[len(ModelSnapshot.REFERENCE_PREFIX):]
+        return self.item_type
+
+
+class ModelSnapshot(object):
+    """
+    Point in time copy of the LITP model, indexed by path, item type
+    and node hostname.
+    """
+
+    REFERENCE_PREFIX = 'reference-to-'
+    COLLECTION_PREFIX = 'collection-of-'
+    INHERITED_MARKER = ' [*]'
+    DEFAULT_PATHS = ('/deployments', '/infrastructure')
+
+    def __init__(self, test, ms_node, paths=DEFAULT_PATHS):
+        """
+        Description:
+            Fetches the model below each of the given paths and builds the
+            in-memory indexes.
+        Args:
+            test (GenericTest): Test case used to run the CLI command.
+            ms_node (str): Filename of the management server.
+            paths (tuple): Model paths to be fetched recursively.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.paths = paths
+        self._items = {}
+        self._order = []
+        self._by_type = {}
+        self._by_hostname = {}
+        self.refresh()
+
+    def refresh(self):
+        """
+        Description:
+            Re-reads the model from the management server. All of the
+            requested paths are fetched in a single remote invocation.
+        """
+        cmd = " && ".join([self.test.cli.get_show_cmd(path, "-r")
+                           for path in self.paths])
+        stdout, _, _ = self.test.run_command(self.ms_node, cmd,
+                                             default_asserts=True)
+        self.load(stdout)
+
+    def load(self, show_output):
+        """
+        Description:
+            Replaces the contents of the snapshot with the items parsed
+            from the supplied "litp show -r" output.
+        Args:
+            show_output (list): Lines of "litp show -r" output.
+        """
+        self._items = {}
+        self._order = []
+        self._by_type = {}
+        self._by_hostname = {}
+        for item in self.parse_show_output(show_output):
+            self._items[item.path] = item
+            self._order.append(item.path)
+            self._by_type.setdefault(item.base_type, []).append(item.path)
+            if 'hostname' in item.properties:
+                self._by_hostname[item.properties['hostname']] = item.path
+
+    @staticmethod
+    def parse_show_output(show_output):
+        """
+        Description:
+            Parses the output of "litp show -r" into model items.
+            The " [*]" marker appended to inherited property values is
+            stripped and recorded in ModelItem.inherited_props.
+        Args:
+            show_output (list): Lines of "litp show -r" output.
+        Returns:
+            list. ModelItem objects in the order they were reported.
+        """
+        items = []
+        item = None
+        in_props = False
+        for line in show_output:
+            if not line.strip():
+                continue
+            if line.startswith('/'):
+                item = ModelItem(line.strip())
+                items.append(item)
+                in_props = False
+                continue
+            if item is None:
+                continue
+            key, _, value = line.strip().partition(': ')
+            if line.startswith(' ' * 8) and in_props:
+                if value.endswith(ModelSnapshot.INHERITED_MARKER):
+                    value = value[:-len(ModelSnapshot.INHERITED_MARKER)]
+                    item.inherited_props.add(key)
+                item.properties[key] = value
+            elif key == 'properties:':
+                in_props = True
+            elif key == 'type':
+                item.item_type = value
+            elif key == 'state':
+                item.state = value
+            elif key == 'inherited from':
+                item.source = value
+        return items
+
+    def get_item(self, url):
+        """
+        Description:
+            Returns the item at the given path.
+        Args:
+            url (str): Model path of the item.
+        Returns:
+            ModelItem. The item or None if it is not in the snapshot.
+        """
+        return self._items.get(url.rstrip('/'))
+
+    def find(self, path, resource, assert_not_empty=True):
+        """
+        Description:
+            In-memory equivalent of GenericTest.find. Returns the paths of
+            all items of the given type, or of references to that type,
+            below the given path.
+        Args:
+            path (str): Model path to search below.
+            resource (str): Item type to search for.
+            assert_not_empty (bool): Assert that at least one item is found.
+        Returns:
+            list. Paths of the matching items in model order.
+        """
+        prefix = path.rstrip('/') + '/'
+        found = [url for url in self._by_type.get(resource, [])
+                 if url.startswith(prefix) or url == path]
+        if assert_not_empty:
+            self.test.assertNotEqual([], found,
+                                     "No {0} items found below {1}".format(
+                                         resource, path))
+        return found
+
+    def get_props_from_url(self, url, filter_prop=None):
+        """
+        Description:
+            In-memory equivalent of GenericTest.get_props_from_url.
+        Args:
+            url (str): Model path of the item.
+            filter_prop (str): Name of a single property to return.
+        Returns:
+            dict. All properties of the item or, if filter_prop is given,
+                  str. the value of that property or None if it is unset.
+        """
+        item = self.get_item(url)
+        if item is None:
+            return None
+        if filter_prop:
+            return item.properties.get(filter_prop)
+        return dict(item.properties)
+
+    def get_storage_profile_paths(self, vol_driver='lvm',
+                                  path_url='/infrastructure'):
+        """
+        Description:
+            In-memory equivalent of GenericTest.get_storage_profile_paths.
+        Args:
+            vol_driver (str): The volume driver, lvm or vxvm.
+            path_url (str): Model path to search below.
+        Returns:
+            list. Paths of the storage profiles using the volume driver.
+        """
+        return [url for url in self.find(path_url, 'storage-profile',
+                                         assert_not_empty=False)
+                if self._items[url].properties.get('volume_driver') ==
+                vol_driver]
+
+    def get_node_url_from_hostname(self, hostname):
+        """
+        Description:
+            Returns the model path of the node with the given hostname.
+        Args:
+            hostname (str): Hostname of the node.
+        Returns:
+            str. The node path or None if no node has that hostname.
+        """
+        return self._by_hostname.get(hostname)
+
+    @staticmethod
+    def get_node_url_from_child_url(url):
+        """
+        Description:
+            Returns the path of the node which the given item is below.
+        Args:
+            url (str): Model path of an item below a node.
+        Returns:
+            str. The node path or None if the item is not below a node.
+        """
+        url_list = url.split('/')
+        if 'nodes' not in url_list:
+            return None
+        node_index = url_list.index('nodes')
+        return '/'.join(url_list[:node_index + 2])
@@ -0,0 +1,156 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Runs the same, or a per node, command on a set of nodes
+            concurrently through a bounded pool of worker threads.
+'''
+
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+
+class NodeResult(tuple):
+    """
+    The (stdout, stderr, rc) result of a command on a single node.
+    Unpacks exactly like the tuple returned by GenericTest.run_command
+    and additionally carries the wall time of the call.
+    """
+
+    def __new__(cls, stdout, stderr, rc, elapsed=0.0):
+        result = super(NodeResult, cls).__new__(cls, (stdout, stderr, rc))
+        result.elapsed = elapsed
+        return result
+
+    @property
+    def stdout(self):
+        """ The stdout lines of the command. """
+        return self[0]
+
+    @property
+    def stderr(self):
+        """ The stderr lines of the command. """
+        return self[1]
+
+    @property
+    def rc(self):
+        """ The return code of the command. """
+        return self[2]
+
+
+class NodeFanout(object):
+    """
+    Executes work on several nodes in parallel. Each node is handled by a
+    single worker so that a node's connection is never used by two
+    threads at the same time.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, test, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Description:
+            Creates a fan-out helper bound to a test case.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            max_workers (int): Maximum number of concurrent worker threads.
+        """
+        self.test = test
+        self.max_workers = max(1, max_workers)
+        self.timings = {}
+
+    def map(self, func, nodes):
+        """
+        Description:
+            Calls func(node) for every node concurrently.
+            If any call raises, the first exception (in node order) is
+            re-raised in the calling thread once all workers have
+            finished, so assertions made by func fail the test as usual.
+        Args:
+            func (function): Function taking a node filename.
+            nodes (list): Node filenames. Duplicates are called once.
+        Returns:
+            dict. The value returned by func, keyed by node.
+        """
+        unique_nodes = []
+        for node in nodes:
+            if node not in unique_nodes:
+                unique_nodes.append(node)
+
+        work = queue.Queue()
+        for node in unique_nodes:
+            work.put(node)
+        results = {}
+        errors = {}
+        self.timings = {}
+
+        def worker():
+            """ Takes nodes off the queue until it is empty. """
+            while True:
+                try:
+                    node = work.get_nowait()
+                except queue.Empty:
+                    return
+                start = time.time()
+                try:
+                    results[node] = func(node)
+                except Exception as err:  # pylint: disable=broad-except
+                    errors[node] = err
+                finally:
+                    self.timings[node] = time.time() - start
+
+        threads = [threading.Thread(target=worker)
+                   for _ in range(min(self.max_workers, len(unique_nodes)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for node in unique_nodes:
+            if node in errors:
+                self.test.log("error", "Command on node {0} failed: {1}"
+                              .format(node, errors[node]))
+                raise errors[node]
+        return results
+
+    def run(self, nodes, cmd, **kwargs):
+        """
+        Description:
+            Runs a command on every node concurrently using
+            GenericTest.run_command.
+        Args:
+            nodes (list): Node filenames to run the command on.
+            cmd (str|dict|function): The command to run. A dict maps each
+                                     node to its own command and a
+                                     function is called with the node to
+                                     build its command.
+        Kwargs:
+            Passed unchanged to GenericTest.run_command, e.g. su_root.
+        Returns:
+            dict. A NodeResult (stdout, stderr, rc) keyed by node.
+        """
+        def run_on_node(node):
+            """ Runs the node's command and times it. """
+            if isinstance(cmd, dict):
+                node_cmd = cmd[node]
+            elif callable(cmd):
+                node_cmd = cmd(node)
+            else:
+                node_cmd = cmd
+            start = time.time()
+            stdout, stderr, rc = \
+                self.test.run_command(node, node_cmd, **kwargs)
+            return NodeResult(stdout, stderr, rc, time.time() - start)
+
+        return self.map(run_on_node, nodes)
@@ -0,0 +1,213 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Index of the identities of the deployment nodes. Maps node
+            filename, hostname, model url, IPv4 address and iLO address to
+            each other with dictionary lookups, built once from a model
+            snapshot and the connection configuration.
+'''
+
+from model_snapshot import ModelSnapshot
+
+
+class NodeIdentity(object):
+    """
+    The names and addresses of a single node.
+    """
+
+    __slots__ = ('filename', 'hostname', 'url', 'ipv4', 'ilo_ip')
+
+    def __init__(self, filename, hostname, url, ipv4=None, ilo_ip=None):
+        """
+        Description:
+            Creates the identity of a node.
+        Args:
+            filename (str): The connection configuration filename.
+            hostname (str): The node hostname.
+            url (str): The model path of the node.
+            ipv4 (str): The IPv4 address used to connect to the node.
+            ilo_ip (str): The address of the node iLO, if modelled.
+        """
+        self.filename = filename
+        self.hostname = hostname
+        self.url = url
+        self.ipv4 = ipv4
+        self.ilo_ip = ilo_ip
+
+    def __repr__(self):
+        return "NodeIdentity({0} {1} {2} {3} ilo={4})".format(
+            self.filename, self.hostname, self.url, self.ipv4, self.ilo_ip)
+
+
+class NodeIdentityIndex(object):
+    """
+    Lookups between the identities of the nodes of a deployment. The index
+    is built on first use and rebuilt on the first use after invalidate,
+    which must be called when nodes are added to or removed from the
+    model.
+    """
+
+    MS_URL = '/ms'
+
+    def __init__(self, test, ms_node, model=None):
+        """
+        Description:
+            Creates an index bound to a test case.
+        Args:
+            test (GenericTest): Test case used to read the connection
+                                configuration and the model.
+            ms_node (str): Filename of the management server.
+            model (ModelSnapshot): Snapshot to build the index from; one
+                                   is taken on first use if not given.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self._model = model
+        self._identities = []
+        self._index = {}
+        self._stale = True
+
+    def invalidate(self):
+        """
+        Description:
+            Marks the index as out of date, e.g. after an expansion plan.
+            The next lookup rebuilds it from a new model snapshot.
+        """
+        self._model = None
+        self._stale = True
+
+    @staticmethod
+    def _get_model_ilo_ip(model, node_url):
+        """
+        Description:
+            Returns the iLO address modelled below the system of a node.
+        Args:
+            model (ModelSnapshot): The model snapshot.
+            node_url (str): The model path of the node.
+        Returns:
+            str. The iLO address, or None if the system has no bmc.
+        """
+        bmc_urls = model.find(node_url + '/system', 'bmc',
+                              assert_not_empty=False)
+        if not bmc_urls:
+            return None
+        return model.get_props_from_url(bmc_urls[0], 'ipaddress')
+
+    def build(self, model=None):
+        """
+        Description:
+            Builds the index. Nodes of the connection configuration are
+            matched to model nodes by hostname; model nodes without a
+            connection configuration are indexed without a filename.
+        Args:
+            model (ModelSnapshot): The model snapshot to use.
+        """
+        model = model or self._model or \
+            ModelSnapshot(self.test, self.ms_node)
+        self._model = model
+        url_by_hostname = {}
+        for node_url in model.find('/deployments', 'node',
+                                   assert_not_empty=False):
+            url_by_hostname[model.get_props_from_url(
+                node_url, 'hostname')] = node_url
+
+        self._identities = []
+        filenames = [self.ms_node] + [
+            node for node in self.test.get_managed_node_filenames()
+            if node != self.ms_node]
+        for filename in filenames:
+            hostname = self.test.get_node_att(filename, 'hostname')
+            if filename == self.ms_node:
+                node_url = self.MS_URL
+                ilo_ip = None
+            else:
+                node_url = url_by_hostname.pop(hostname, None)
+                ilo_ip = self._get_model_ilo_ip(model, node_url) \
+                    if node_url else None
+            self._identities.append(NodeIdentity(
+                filename, hostname, node_url,
+                self.test.get_node_att(filename, 'ipv4'), ilo_ip))
+        for hostname, node_url in sorted(url_by_hostname.items()):
+            self._identities.append(NodeIdentity(
+                None, hostname, node_url,
+                ilo_ip=self._get_model_ilo_ip(model, node_url)))
+
+        self._index = {}
+        for identity in self._identities:
+            for value in (identity.filename, identity.hostname,
+                          identity.url, identity.ipv4, identity.ilo_ip):
+                if value is not None:
+                    self._index.setdefault(value, identity)
+        self._stale = False
+
+    def get(self, value):
+        """
+        Description:
+            Returns the identity of the node with the given filename,
+            hostname, model path, IPv4 or iLO address. A model path below
+            a node resolves to that node.
+        Args:
+            value (str): Any of the node names or addresses.
+        Returns:
+            NodeIdentity. The identity, or None if the node is unknown.
+        """
+        if self._stale:
+            self.build()
+        identity = self._index.get(value)
+        if identity is None and value and value.startswith('/'):
+            if value.startswith(self.MS_URL + '/'):
+                identity = self._index.get(self.MS_URL)
+            else:
+                identity = self._index.get(
+                    ModelSnapshot.get_node_url_from_child_url(value))
+        return identity
+
+    def get_all(self):
+        """
+        Description:
+            Returns the identities of all the nodes, the MS first.
+        Returns:
+            list. The NodeIdentity objects.
+        """
+        if self._stale:
+            self.build()
+        return list(self._identities)
+
+    def _get_att(self, value, att):
+        """
+        Description:
+            Returns an attribute of the identity of a node.
+        Args:
+            value (str): Any of the node names or addresses.
+            att (str): The NodeIdentity attribute.
+        Returns:
+            str. The attribute, or None if the node is unknown.
+        """
+        identity = self.get(value)
+        return getattr(identity, att) if identity is not None else None
+
+    def get_filename(self, value):
+        """ Returns the filename of a node, e.g. from its model path. """
+        return self._get_att(value, 'filename')
+
+    def get_hostname(self, value):
+        """ Returns the hostname of a node. """
+        return self._get_att(value, 'hostname')
+
+    def get_url(self, value):
+        """ Returns the model path of a node, e.g. from its filename. """
+        return self._get_att(value, 'url')
+
+    def get_ipv4(self, value):
+        """ Returns the IPv4 address of a node. """
+        return self._get_att(value, 'ipv4')
+
+    def get_ilo_ip(self, value):
+        """ Returns the iLO address of a node. """
+        return self._get_att(value, 'ilo_ip')
@@ -0,0 +1,282 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Parses "litp show_plan" output once into phases and tasks with
+            indexes by node, item path, item type, quoted value and
+            description keyword.
+'''
+
+import re
+
+
+class PlanTask(object):
+    """
+    A single task of a LITP plan.
+    """
+
+    __slots__ = ('phase', 'index', 'status', 'path', 'description',
+                 'item_type')
+
+    def __init__(self, phase, index, status, path):
+        """
+        Description:
+            Creates a task read from a show_plan task row.
+        Args:
+            phase (int): The phase number.
+            index (int): The position of the task in its phase, from 1.
+            status (str): The task status, e.g. Initial or Success.
+            path (str): The model path of the task item.
+        """
+        self.phase = phase
+        self.index = index
+        self.status = status
+        self.path = path
+        self.description = ''
+        self.item_type = None
+
+    def __repr__(self):
+        return "PlanTask({0}.{1} {2} {3} '{4}')".format(
+            self.phase, self.index, self.status, self.path,
+            self.description)
+
+
+class PlanModel(object):
+    """
+    Parsed show_plan output.
+    """
+
+    TASK_STATUSES = ('Initial', 'Running', 'Success', 'Failed', 'Stopped')
+    TASK_DONE_STATUSES = ('Success', 'Failed', 'Stopped')
+    PLAN_STATUS_PREFIX = 'Plan Status:'
+    TOKEN_RE = re.compile(r'[\w.-]+')
+    QUOTED_RE = re.compile(r'"([^"]*)"')
+
+    def __init__(self, plan_output, model=None):
+        """
+        Description:
+            Parses the plan and builds the indexes.
+        Args:
+            plan_output (list): The show_plan output lines.
+            model (ModelSnapshot): Snapshot used to index the tasks by
+                                   item type; the parent collection name
+                                   is used if not given.
+        """
+        self.tasks = []
+        self.phases = {}
+        self.status = None
+        self._by_description = {}
+        self._by_keyword = {}
+        self._by_quoted = {}
+        self._by_node_url = {}
+        self._by_item_type = {}
+        self._by_status = {}
+        self._parse(plan_output)
+        for task in self.tasks:
+            self._index(task, model)
+
+    @staticmethod
+    def normalize(text):
+        """
+        Description:
+            Collapses all whitespace in a text to single spaces.
+        Args:
+            text (str): The text to normalize.
+        Returns:
+            str. The normalized text.
+        """
+        return ' '.join(text.split())
+
+    @classmethod
+    def tokens(cls, text):
+        """
+        Description:
+            Splits a text into lower case keyword tokens.
+        Args:
+            text (str): The text to split.
+        Returns:
+            list. The tokens.
+        """
+        return [token.lower() for token in cls.TOKEN_RE.findall(text)]
+
+    def _parse(self, plan_output):
+        """
+        Description:
+            Reads the phases and tasks. A task row is its status followed
+            by its path; the indented lines below it are its description,
+            which show_plan wraps over several lines.
+        Args:
+            plan_output (list): The show_plan output lines.
+        """
+        phase = None
+        task = None
+        description = []
+        for line in plan_output:
+            fields = line.split()
+            if not fields:
+                continue
+            if line.startswith(self.PLAN_STATUS_PREFIX):
+                self.status = line[len(self.PLAN_STATUS_PREFIX):].strip()
+                task = None
+            elif fields[0] == 'Phase' and len(fields) == 2 and \
+                 fields[1].isdigit():
+                phase = int(fields[1])
+                self.phases[phase] = []
+                task = None
+            elif phase is not None and len(fields) == 2 and \
+                 fields[0] in self.TASK_STATUSES and \
+                 fields[1].startswith('/'):
+                task = PlanTask(phase, len(self.phases[phase]) + 1,
+                                fields[0], fields[1])
+                description = []
+                self.phases[phase].append(task)
+                self.tasks.append(task)
+            elif task is not None and line[0].isspace():
+                description.append(line)
+                task.description = self.normalize(' '.join(description))
+            else:
+                task = None
+
+    def _index(self, task, model):
+        """
+        Description:
+            Adds a task to the indexes.
+        Args:
+            task (PlanTask): The task.
+            model (ModelSnapshot): Snapshot used to find the item type.
+        """
+        item = model.get_item(task.path) if model else None
+        if item is not None:
+            task.item_type = item.base_type
+        else:
+            path_list = task.path.rstrip('/').split('/')
+            task.item_type = path_list[-2] if len(path_list) > 2 else None
+        self._by_description.setdefault(task.description, []).append(task)
+        self._by_item_type.setdefault(task.item_type, []).append(task)
+        self._by_status.setdefault(task.status, []).append(task)
+        for token in set(self.tokens(task.description)):
+            self._by_keyword.setdefault(token, []).append(task)
+        for value in set(self.QUOTED_RE.findall(task.description)):
+            self._by_quoted.setdefault(value, []).append(task)
+        path_list = task.path.split('/')
+        if 'nodes' in path_list:
+            node_index = path_list.index('nodes')
+            node_url = '/'.join(path_list[:node_index + 2])
+            self._by_node_url.setdefault(node_url, []).append(task)
+        elif task.path == '/ms' or task.path.startswith('/ms/'):
+            self._by_node_url.setdefault('/ms', []).append(task)
+
+    def _candidates(self, fragment):
+        """
+        Description:
+            Narrows the tasks whose description may contain a fragment
+            using the keyword index. Only the inner tokens of the fragment
+            are used, since its first and last words may be partial.
+        Args:
+            fragment (str): The normalized fragment.
+        Returns:
+            list. The candidate tasks.
+        """
+        inner = self.tokens(fragment)[1:-1]
+        if not inner:
+            return self.tasks
+        candidates = None
+        for token in inner:
+            ids = set(id(task) for task in self._by_keyword.get(token, []))
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        return [task for task in self.tasks if id(task) in candidates]
+
+    def find_tasks(self, fragment=None, path=None, status=None,
+                   item_type=None, phase=None):
+        """
+        Description:
+            Returns the tasks matching all of the given criteria.
+        Args:
+            fragment (str): Text the description must contain; whitespace
+                            differences are ignored.
+            path (str): The exact task item path.
+            status (str): The task status.
+            item_type (str): The task item type.
+            phase (int): The phase number.
+        Returns:
+            list. The matching tasks in plan order.
+        """
+        if fragment is not None:
+            fragment = self.normalize(fragment)
+            tasks = self._by_description.get(fragment) or \
+                [task for task in self._candidates(fragment)
+                 if fragment in task.description]
+        elif status is not None:
+            tasks = self._by_status.get(status, [])
+        elif item_type is not None:
+            tasks = self._by_item_type.get(item_type, [])
+        else:
+            tasks = self.tasks
+        return [task for task in tasks
+                if (path is None or task.path == path) and
+                (status is None or task.status == status) and
+                (item_type is None or task.item_type == item_type) and
+                (phase is None or task.phase == phase)]
+
+    def has_task(self, fragment=None, path=None, status=None,
+                 item_type=None, phase=None):
+        """
+        Description:
+            Checks whether any task matches all of the given criteria.
+        Args:
+            See find_tasks.
+        Returns:
+            bool. True if a matching task exists.
+        """
+        return bool(self.find_tasks(fragment, path, status, item_type,
+                                    phase))
+
+    def tasks_below(self, url):
+        """
+        Description:
+            Returns the tasks whose item is, or is below, the given path.
+        Args:
+            url (str): A model path, e.g. a node url.
+        Returns:
+            list. The tasks in plan order.
+        """
+        url = url.rstrip('/')
+        if url in self._by_node_url:
+            return list(self._by_node_url[url])
+        return [task for task in self.tasks
+                if task.path == url or task.path.startswith(url + '/')]
+
+    def mentions(self, value):
+        """
+        Description:
+            Returns the tasks whose description names the given value,
+            either quoted or as a whole word. Used to find the tasks of a
+            node hostname or volume group name without matching longer
+            names that start with it.
+        Args:
+            value (str): The value, e.g. "node1".
+        Returns:
+            list. The tasks in plan order.
+        """
+        tasks = self._by_quoted.get(value, [])
+        if not tasks and len(self.tokens(value)) == 1:
+            tasks = self._by_keyword.get(value.lower(), [])
+        return list(tasks)
+
+    def get_tasks_by_status(self, status):
+        """
+        Description:
+            Returns the tasks in the given status.
+        Args:
+            status (str): The task status.
+        Returns:
+            list. The tasks in plan order.
+        """
+        return list(self._by_status.get(status, []))
@@ -0,0 +1,295 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Plan progress watcher. A drop in replacement for
+            GenericTest.wait_for_plan_state which polls the plan state
+            with an adaptive backoff, follows the system log between polls
+            to wake up as soon as litpd logs plan activity and can record
+            per phase and per task durations.
+'''
+
+import time
+import test_constants
+from plan_model import PlanModel
+from log_watcher import LogWatcher
+
+
+class LitpPlanSource(object):
+    """
+    Reads the plan of a LITP management server.
+    """
+
+    # PLAN LEVEL MESSAGES ONLY; TASK LINES WOULD WAKE THE WAIT FOR EVERY
+    # TASK OF A RUNNING PLAN
+    LOG_PATTERN = 'litp.*[Pp]lan'
+
+    def __init__(self, test, node, sleep=time.sleep, follow_log=False):
+        """
+        Description:
+            Creates a plan source for a management server. When following
+            the log its current size is recorded, so that plan activity
+            logged from now on wakes up the next wait.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            node (str): Filename of the management server.
+            sleep (function): Waits for a number of seconds.
+            follow_log (bool): Follow the system log between polls
+                               instead of sleeping.
+        """
+        self.test = test
+        self.node = node
+        self.sleep = sleep
+        self.log_watcher = None
+        if follow_log:
+            self.log_watcher = LogWatcher(test, node)
+            self.log_watcher.mark()
+
+    def get_state(self):
+        """
+        Description:
+            Returns the current plan state.
+        Returns:
+            int. One of the test_constants PLAN_* values.
+        """
+        return self.test.get_current_plan_state(self.node)
+
+    def get_plan(self):
+        """
+        Description:
+            Returns the show_plan output, or an empty list if no plan
+            exists.
+        Returns:
+            list. The show_plan output lines.
+        """
+        stdout, _, rc = self.test.run_command(
+            self.node, self.test.cli.get_show_plan_cmd())
+        if rc != 0:
+            return []
+        return stdout
+
+    def wait_for_change(self, timeout_secs):
+        """
+        Description:
+            Waits before the next poll. When following the log the wait
+            ends as soon as litpd logs plan activity, and the next wait
+            starts after the line that ended it.
+        Args:
+            timeout_secs (float): The maximum time to wait.
+        """
+        if self.log_watcher is None:
+            self.sleep(timeout_secs)
+            return
+        match = self.log_watcher.wait_for_pattern(self.LOG_PATTERN,
+                                                  timeout_secs)
+        if match is not None:
+            self.log_watcher.offset = match.offset + len(match.line) + 1
+
+
+class FakePlanSource(object):
+    """
+    Plan source replaying a scripted sequence of plan states and
+    show_plan outputs. Used to exercise the watcher without a LITP
+    deployment.
+    """
+
+    def __init__(self, states, plans=None):
+        """
+        Description:
+            Creates a scripted plan source. Each call to get_state moves
+            on to the next state; the last state is then repeated.
+        Args:
+            states (list): The plan states to report.
+            plans (list): The show_plan output to report with each state.
+        """
+        self.states = list(states)
+        self.plans = list(plans) if plans else []
+        self.index = -1
+        self.waits = []
+
+    def get_state(self):
+        """ Returns the next scripted state. """
+        self.index = min(self.index + 1, len(self.states) - 1)
+        return self.states[self.index]
+
+    def get_plan(self):
+        """ Returns the show_plan output of the current state. """
+        if not self.plans:
+            return []
+        return self.plans[min(max(self.index, 0), len(self.plans) - 1)]
+
+    def wait_for_change(self, timeout_secs):
+        """ Records the requested wait without sleeping. """
+        self.waits.append(timeout_secs)
+
+
+class PlanWatcher(object):
+    """
+    Waits for a plan to reach a state, recording how long each phase and
+    task took.
+    """
+
+    def __init__(self, test, initial_interval=1.0, max_interval=10.0,
+                 backoff=1.5, track_tasks=False, follow_log=True,
+                 source_factory=None, clock=time.time, sleep=time.sleep):
+        """
+        Description:
+            Creates a watcher bound to a test case.
+        Args:
+            test (GenericTest): Test case used to log and run commands.
+            initial_interval (float): First poll interval in seconds.
+            max_interval (float): Upper bound of the poll interval.
+            backoff (float): Factor the interval grows by while the plan
+                             state does not change.
+            track_tasks (bool): Also read show_plan on each poll to time
+                                the phases and tasks; off by default as
+                                it doubles the commands run per poll.
+            follow_log (bool): Follow the system log of the management
+                               server between polls, so that a state
+                               change is seen without waiting for the
+                               poll interval.
+            source_factory (function): Returns the plan source of a node;
+                                       a LitpPlanSource by default.
+            clock (function): Returns the current time in seconds.
+            sleep (function): Waits between polls of the default plan
+                              source.
+        """
+        self.test = test
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.track_tasks = track_tasks
+        self.follow_log = follow_log
+        self.source_factory = source_factory or \
+            (lambda node: LitpPlanSource(test, node, sleep, follow_log))
+        self.clock = clock
+        self.terminal_states = (test_constants.PLAN_COMPLETE,
+                                test_constants.PLAN_FAILED,
+                                test_constants.PLAN_STOPPED)
+        self.report = {}
+
+    def _record_tasks(self, plan_output, now, timings):
+        """
+        Description:
+            Updates the task start and end times from a show_plan read.
+        Args:
+            plan_output (list): The show_plan output lines.
+            now (float): The time of the read.
+            timings (dict): Task key -> [status, start, end].
+        """
+        for task in PlanModel(plan_output).tasks:
+            key = (task.phase, task.index, task.path, task.description)
+            timing = timings.setdefault(key, [task.status, None, None])
+            timing[0] = task.status
+            if task.status != 'Initial' and timing[1] is None:
+                timing[1] = now
+            if task.status in PlanModel.TASK_DONE_STATUSES and \
+               timing[2] is None:
+                timing[2] = now
+
+    def _build_report(self, state, start, polls, timings):
+        """
+        Description:
+            Builds the report of the last wait.
+        Args:
+            state (int): The last plan state read.
+            start (float): The time the wait started.
+            polls (int): The number of state reads.
+            timings (dict): Task key -> [status, start, end].
+        Returns:
+            dict. The wait report.
+        """
+        tasks = []
+        phases = {}
+        for key in sorted(timings):
+            phase, _, path, desc = key
+            status, task_start, task_end = timings[key]
+            duration = None
+            if task_start is not None and task_end is not None:
+                duration = task_end - task_start
+            tasks.append({'phase': phase, 'path': path, 'desc': desc,
+                          'status': status, 'duration': duration})
+            if task_start is None:
+                continue
+            phase_start, phase_end = phases.get(phase, (task_start, None))
+            phase_start = min(phase_start, task_start)
+            if task_end is not None:
+                phase_end = max(phase_end or task_end, task_end)
+            phases[phase] = (phase_start, phase_end)
+        phase_durations = {}
+        for phase, (phase_start, phase_end) in phases.items():
+            if phase_end is not None:
+                phase_durations[phase] = phase_end - phase_start
+        return {'state': state, 'elapsed': self.clock() - start,
+                'polls': polls, 'phases': phase_durations, 'tasks': tasks}
+
+    def wait_for_plan_state(self, node, expected_state, timeout_mins=10):
+        """
+        Description:
+            Waits for the plan on a node to reach the expected state.
+            The poll interval starts at initial_interval and grows by
+            backoff, up to max_interval, while the state is unchanged; it
+            is reset whenever the state changes. When following the log a
+            poll is also made as soon as litpd logs plan activity.
+        Args:
+            node (str): Filename of the management server.
+            expected_state (int): The test_constants PLAN_* state to wait
+                                  for.
+            timeout_mins (int): The maximum time to wait in minutes.
+        Returns:
+            bool. True if the expected state is reached, False if the plan
+                  ends in another state or the timeout expires.
+        """
+        source = self.source_factory(node)
+        start = self.clock()
+        deadline = start + timeout_mins * 60
+        interval = self.initial_interval
+        timings = {}
+        polls = 0
+        last_state = None
+        while True:
+            state = source.get_state()
+            polls += 1
+            if self.track_tasks:
+                self._record_tasks(source.get_plan(), self.clock(), timings)
+            if state != last_state:
+                interval = self.initial_interval
+                last_state = state
+            if state == expected_state or state in self.terminal_states:
+                break
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                break
+            source.wait_for_change(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_interval)
+
+        self.report = self._build_report(state, start, polls, timings)
+        self.test.log('info', self.format_report())
+        return state == expected_state
+
+    def format_report(self):
+        """
+        Description:
+            Formats the report of the last wait for logging.
+        Returns:
+            str. The formatted report.
+        """
+        if not self.report:
+            return ''
+        lines = ['Plan state {0} after {1:.1f}s and {2} polls'.format(
+            self.report['state'], self.report['elapsed'],
+            self.report['polls'])]
+        for phase in sorted(self.report['phases']):
+            lines.append('  Phase {0}: {1:.1f}s'.format(
+                phase, self.report['phases'][phase]))
+        for task in self.report['tasks']:
+            if task['duration'] is not None:
+                lines.append('    {0} {1:.1f}s {2} {3}'.format(
+                    task['status'], task['duration'], task['path'],
+                    task['desc']))
+        return '\n'.join(lines)
@@ -0,0 +1,260 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Powers peer nodes off and on concurrently. Each node moves
+            through the power-off, unreachable, power-on and ssh states
+            on its own worker, up to a configurable number of nodes at a
+            time, and the time every state is reached is recorded, so an
+            outage of several nodes takes as long as the slowest node.
+'''
+
+import threading
+import time
+from node_fanout import NodeFanout
+
+
+class NodePowerRecord(object):
+    """
+    The power state changes of one node.
+    """
+
+    __slots__ = ('node', 'timeline', 'failed')
+
+    def __init__(self, node):
+        """
+        Description:
+            Creates an empty record.
+        Args:
+            node (str): The node filename.
+        """
+        self.node = node
+        self.timeline = []
+        self.failed = None
+
+    @property
+    def elapsed(self):
+        """ Seconds until the last state was reached, 0 if none was. """
+        return self.timeline[-1][1] if self.timeline else 0
+
+    def __repr__(self):
+        return "NodePowerRecord({0} {1}{2})".format(
+            self.node, ', '.join(['{0} {1:.0f}s'.format(state, secs)
+                                  for state, secs in self.timeline]),
+            ' failed {0}'.format(self.failed) if self.failed else '')
+
+
+class PowerOrchestrator(object):
+    """
+    Power operations on several peer nodes at once.
+    """
+
+    POWER_OFF = 'power-off'
+    UNREACHABLE = 'unreachable'
+    POWER_ON = 'power-on'
+    SSH = 'ssh'
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, test, ms_node, max_workers=DEFAULT_MAX_WORKERS,
+                 poll_interval=10, identity=None):
+        """
+        Description:
+            Creates an orchestrator. The power operations are run from the
+            MS, through iLO on physical deployments.
+        Args:
+            test (GenericTest): Test case used to run the operations.
+            ms_node (str): Filename of the management server.
+            max_workers (int): Maximum number of nodes handled at a time.
+            poll_interval (int): Seconds between checks of a node.
+            identity (NodeIdentityIndex): Gives the iLO addresses from the
+                                          model instead of asking the MS.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.poll_interval = poll_interval
+        self.fanout = NodeFanout(test, max_workers=max_workers)
+        self.identity = identity
+        self.records = {}
+        self._ilo_ips = {}
+
+    def get_ilo_ip(self, node):
+        """ Returns the iLO address of a node, read once. """
+        if node not in self._ilo_ips:
+            ilo_ip = self.identity.get_ilo_ip(node) \
+                if self.identity is not None else None
+            self._ilo_ips[node] = ilo_ip or self.test.get_node_ilo_ip(
+                self.ms_node, node)
+        return self._ilo_ips[node]
+
+    def _reach(self, node, state, ilo):
+        """
+        Description:
+            Runs the operation of a state, or checks once whether a node
+            is in it.
+        Args:
+            node (str): The node filename.
+            state (str): The state.
+            ilo (bool): Power the node through its iLO.
+        Returns:
+            bool. True if the node is in the state.
+        """
+        kwargs = {'ilo_ip': self.get_ilo_ip(node)} if ilo else {}
+        if state == self.POWER_OFF:
+            self.test.poweroff_peer_node(self.ms_node, node, **kwargs)
+            return True
+        if state == self.POWER_ON:
+            self.test.poweron_peer_node(self.ms_node, node, **kwargs)
+            return True
+        if state == self.UNREACHABLE:
+            return self.test.wait_for_ping(
+                self.test.get_node_att(node, 'ipv4'), False, timeout_mins=1)
+        try:
+            _, _, rc = self.test.run_command(node, '/bin/true', su_root=True)
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return rc == 0
+
+    def _run_node(self, node, states, ilo, start, deadline, abort):
+        """
+        Description:
+            Moves a node through states until it reaches the last one, it
+            passes the deadline or another node has failed.
+        Args:
+            node (str): The node filename.
+            states (list): The states, in order.
+            ilo (bool): Power the node through its iLO.
+            start (float): The time the orchestration started.
+            deadline (float): The time by which the node must be done.
+            abort (threading.Event): Set when any node fails.
+        Returns:
+            bool. True if the node reached the last state.
+        """
+        record = self.records[node]
+        for state in states:
+            try:
+                while not self._reach(node, state, ilo):
+                    if abort.is_set():
+                        return False
+                    if time.time() >= deadline:
+                        record.failed = state
+                        abort.set()
+                        return False
+                    abort.wait(self.poll_interval)
+            except Exception:
+                record.failed = state
+                abort.set()
+                raise
+            record.timeline.append((state, time.time() - start))
+        return True
+
+    def run(self, nodes, states, ilo=True, timeout_mins=30, start=None):
+        """
+        Description:
+            Moves every node through the states concurrently and asserts
+            that all of them got through. Fails as soon as one node passes
+            the deadline.
+        Args:
+            nodes (list): The node filenames.
+            states (list): The states, in order.
+            ilo (bool): Power the nodes through their iLO; False on cloud
+                        deployments.
+            timeout_mins (int): Minutes allowed for each node.
+            start (float): The start time of an earlier run whose records
+                           are continued; new records are started if not
+                           given.
+        Returns:
+            dict. The NodePowerRecord of each node.
+        """
+        if start is None:
+            start = time.time()
+            for node in nodes:
+                self.records[node] = NodePowerRecord(node)
+        abort = threading.Event()
+        deadline = time.time() + timeout_mins * 60
+        try:
+            self.fanout.map(lambda node: self._run_node(
+                node, states, ilo, start, deadline, abort), nodes)
+        finally:
+            for node in nodes:
+                self.test.log('info', 'Power timeline: {0!r}'.format(
+                    self.records[node]))
+        failures = dict((node, self.records[node].failed) for node in nodes
+                        if self.records[node].failed)
+        self.test.assertEqual({}, failures,
+                              "Nodes not powered, node: state not reached "
+                              "{0}".format(failures))
+        return dict((node, self.records[node]) for node in nodes)
+
+    def power_off(self, nodes, ilo=True, timeout_mins=30, start=None):
+        """
+        Description:
+            Powers the nodes off and waits until none is reachable.
+            Connections to the nodes are dropped so that they reconnect
+            once the nodes are back.
+        Args:
+            nodes (list): The node filenames.
+            ilo (bool): Power the nodes through their iLO.
+            timeout_mins (int): Minutes allowed for each node.
+            start (float): See run.
+        Returns:
+            dict. The NodePowerRecord of each node.
+        """
+        records = self.run(nodes, [self.POWER_OFF, self.UNREACHABLE], ilo,
+                           timeout_mins, start)
+        self.test.disconnect_all_nodes()
+        return records
+
+    def power_on(self, nodes, ilo=True, timeout_mins=30, start=None):
+        """
+        Description:
+            Powers the nodes on and waits until all accept ssh commands.
+        Args:
+            nodes (list): The node filenames.
+            ilo (bool): Power the nodes through their iLO.
+            timeout_mins (int): Minutes allowed for each node.
+            start (float): See run.
+        Returns:
+            dict. The NodePowerRecord of each node.
+        """
+        return self.run(nodes, [self.POWER_ON, self.SSH], ilo, timeout_mins,
+                        start)
+
+    def power_cycle(self, nodes, ilo=True, timeout_mins=30):
+        """
+        Description:
+            Powers the nodes off and back on. All the nodes are off before
+            any is powered on again; their records cover both halves.
+        Args:
+            nodes (list): The node filenames.
+            ilo (bool): Power the nodes through their iLO.
+            timeout_mins (int): Minutes allowed for each node and half.
+        Returns:
+            dict. The NodePowerRecord of each node.
+        """
+        start = time.time()
+        for node in nodes:
+            self.records[node] = NodePowerRecord(node)
+        self.power_off(nodes, ilo, timeout_mins, start)
+        return self.power_on(nodes, ilo, timeout_mins, start)
+
+    def ensure_up(self, nodes, ilo=True, timeout_mins=30):
+        """
+        Description:
+            Powers on the nodes not pingable from the MS.
+        Args:
+            nodes (list): The node filenames.
+            ilo (bool): Power the nodes through their iLO.
+            timeout_mins (int): Minutes allowed for each node.
+        Returns:
+            dict. The NodePowerRecord of each node powered on.
+        """
+        down = [node for node in nodes
+                if not self.test.is_ip_pingable(self.ms_node, node)]
+        if not down:
+            return {}
+        return self.power_on(down, ilo, timeout_mins)
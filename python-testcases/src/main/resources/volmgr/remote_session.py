@@ -0,0 +1,145 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Runs many commands on a node through a single root shell
+            execution. Each command's stdout and stderr are framed with
+            markers, the stdout end marker carrying its exit code, so the
+            results unpack exactly like separate GenericTest.run_command
+            calls. The stderr markers are tagged apart from the stdout ones
+            so that output with stderr merged into stdout, as su_root
+            gives, is parsed too.
+'''
+
+import random
+from node_fanout import NodeResult
+
+
+class RemoteSession(object):
+    """
+    Command pipeline to the root shell of one node. No connection state is
+    kept between calls, so GenericTest.disconnect_all_nodes and reboots
+    need no special handling.
+    """
+
+    DEFAULT_MAX_BATCH = 50
+    # FRAME MARKER TAGS: STDOUT BEGIN AND END, STDERR BEGIN AND END
+    OUT_BEGIN = 'OB'
+    OUT_END = 'OE'
+    ERR_BEGIN = 'EB'
+    ERR_END = 'EE'
+
+    def __init__(self, test, node, su_root=True,
+                 max_batch=DEFAULT_MAX_BATCH):
+        """
+        Description:
+            Creates a session to a node.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            node (str): The node filename.
+            su_root (bool): Run the commands as root.
+            max_batch (int): Maximum number of commands sent in one shell
+                             execution.
+        """
+        self.test = test
+        self.node = node
+        self.su_root = su_root
+        self.max_batch = max(1, max_batch)
+        self.marker = '__VOLMGR_{0:08x}__'.format(random.getrandbits(32))
+
+    def run_command(self, cmd, **kwargs):
+        """
+        Description:
+            Runs a single command, exactly as GenericTest.run_command.
+        Args:
+            cmd (str): The command.
+            kwargs: Further GenericTest.run_command arguments.
+        Returns:
+            list, list, int. The stdout, stderr and return code.
+        """
+        return self.test.run_command(self.node, cmd, su_root=self.su_root,
+                                     **kwargs)
+
+    def frame_commands(self, cmds):
+        """
+        Description:
+            Builds the shell script running the commands in order. Every
+            command runs in its own subshell so that an exit or cd in one
+            command does not affect the next.
+        Args:
+            cmds (list): The commands.
+        Returns:
+            str. The script.
+        """
+        parts = []
+        for index, cmd in enumerate(cmds):
+            parts.append(
+                "echo '{0}:{3}:{1}'; echo '{0}:{4}:{1}' >&2; ( {2} ); "
+                "echo \"{0}:{5}:{1}:$?\"; echo '{0}:{6}:{1}' >&2".format(
+                    self.marker, index, cmd, self.OUT_BEGIN, self.ERR_BEGIN,
+                    self.OUT_END, self.ERR_END))
+        return '; '.join(parts)
+
+    def parse_framed_output(self, stdout, stderr, count):
+        """
+        Description:
+            Splits the output of a framed script into per command results.
+            The return code is only taken from a stdout end marker, which
+            alone carries one; stderr markers found in stdout, because the
+            streams were merged, only delimit the output.
+        Args:
+            stdout (list): The script stdout lines.
+            stderr (list): The script stderr lines.
+            count (int): The number of commands in the script.
+        Returns:
+            list. A NodeResult per command, or None for a command whose
+                  frame is incomplete.
+        """
+        outs = [[] for _ in range(count)]
+        errs = [[] for _ in range(count)]
+        rcs = [None] * count
+        for lines, collected in ((stdout, outs), (stderr, errs)):
+            index = None
+            for line in lines:
+                if line.startswith(self.marker + ':'):
+                    fields = line.strip().split(':')
+                    if fields[1] in (self.OUT_BEGIN, self.ERR_BEGIN):
+                        index = int(fields[2])
+                    else:
+                        if fields[1] == self.OUT_END and len(fields) == 4:
+                            rcs[int(fields[2])] = int(fields[3])
+                        index = None
+                elif index is not None:
+                    collected[index].append(line)
+        return [NodeResult(outs[index], errs[index], rcs[index])
+                if rcs[index] is not None else None
+                for index in range(count)]
+
+    def run_commands(self, cmds, **kwargs):
+        """
+        Description:
+            Runs the commands in order in as few shell executions as
+            max_batch allows. A command whose frame is incomplete, e.g.
+            because the execution timed out, is run again on its own.
+        Args:
+            cmds (list): The commands.
+            kwargs: Further GenericTest.run_command arguments.
+        Returns:
+            list. A NodeResult (stdout, stderr, rc) per command.
+        """
+        results = []
+        for start in range(0, len(cmds), self.max_batch):
+            batch = cmds[start:start + self.max_batch]
+            stdout, stderr, _ = self.run_command(self.frame_commands(batch),
+                                                 **kwargs)
+            for cmd, result in zip(batch, self.parse_framed_output(
+                    stdout, stderr, len(batch))):
+                if result is None:
+                    result = NodeResult(*self.run_command(cmd, **kwargs))
+                results.append(result)
+        return results
@@ -0,0 +1,171 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Monitors the management server and the peer nodes concurrently
+            while they come back from a restore_snapshot reboot. Each node
+            moves through ping, ssh, litpd (MS only) and LVM merge states
+            and the time of every state change is recorded.
+'''
+
+import threading
+import time
+from redhat_cmd_utils import RHCmdUtils
+from node_fanout import NodeFanout
+
+
+class RestoreMonitor(object):
+    """
+    Readiness monitor for the nodes rebooted by restore_snapshot.
+    """
+
+    PING = 'ping'
+    SSH = 'ssh'
+    LITPD = 'litpd'
+    MERGED = 'merged'
+    MERGE_CMD = "/sbin/lvs | /bin/awk '{print $3}' | /bin/grep 'Owi'"
+
+    def __init__(self, test, ms_node, peer_nodes, poll_interval=10,
+                 stage_timeouts=None):
+        """
+        Description:
+            Creates a monitor for the given nodes.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            ms_node (str): Filename of the management server.
+            peer_nodes (list): Filenames of the peer nodes.
+            poll_interval (int): Seconds between checks of a node.
+            stage_timeouts (dict): Minutes allowed for a state, counted
+                                   from the previous state change.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.peer_nodes = list(peer_nodes)
+        self.poll_interval = poll_interval
+        self.stage_timeouts = {self.LITPD: 5}
+        if stage_timeouts:
+            self.stage_timeouts.update(stage_timeouts)
+        self.rhc = RHCmdUtils()
+        self.fanout = NodeFanout(test, max_workers=len(self.peer_nodes) + 1)
+        self.timeline = {}
+        self.failures = {}
+
+    def get_stages(self, node):
+        """
+        Description:
+            Returns the states a node has to reach, in order.
+        Args:
+            node (str): The node filename.
+        Returns:
+            list. The state names.
+        """
+        if node == self.ms_node:
+            return [self.PING, self.SSH, self.LITPD, self.MERGED]
+        return [self.PING, self.SSH, self.MERGED]
+
+    def _check(self, node, node_ip, stage):
+        """
+        Description:
+            Checks once whether a node has reached a state.
+        Args:
+            node (str): The node filename.
+            node_ip (str): The node IP address.
+            stage (str): The state to check.
+        Returns:
+            bool. True if the node is in the state.
+        """
+        if stage == self.PING:
+            return self.test.wait_for_ping(node_ip, timeout_mins=1)
+        if stage == self.SSH:
+            cmd = '/bin/true'
+            expected_rc = 0
+        elif stage == self.LITPD:
+            cmd = self.rhc.get_service_running_cmd('litpd')
+            expected_rc = 0
+        else:
+            cmd = self.MERGE_CMD
+            expected_rc = 1
+        try:
+            _, _, rc = self.test.run_command(node, cmd, su_root=True)
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return rc == expected_rc
+
+    def _monitor_node(self, node, start, deadline, abort):
+        """
+        Description:
+            Moves a node through its states until it is ready, it passes
+            its deadline or another node has failed.
+        Args:
+            node (str): The node filename.
+            start (float): The time monitoring started.
+            deadline (float): The time by which the node must be ready.
+            abort (threading.Event): Set when any node fails.
+        Returns:
+            bool. True if the node is ready.
+        """
+        node_ip = self.test.get_node_att(node, 'ipv4')
+        timeline = self.timeline[node]
+        stage_start = time.time()
+        for stage in self.get_stages(node):
+            stage_deadline = deadline
+            if stage in self.stage_timeouts:
+                stage_deadline = min(
+                    deadline, stage_start + self.stage_timeouts[stage] * 60)
+            while not self._check(node, node_ip, stage):
+                if abort.is_set():
+                    return False
+                if time.time() >= stage_deadline:
+                    self.failures[node] = stage
+                    abort.set()
+                    return False
+                abort.wait(self.poll_interval)
+            stage_start = time.time()
+            timeline.append((stage, stage_start - start))
+        return True
+
+    def wait_for_ready(self, timeout_mins=30):
+        """
+        Description:
+            Waits for the MS to go down and then monitors every node
+            concurrently until all of them are ready. Fails as soon as
+            one node passes its deadline.
+        Args:
+            timeout_mins (int): Minutes allowed for each node to become
+                                ready once the MS has gone down.
+        Returns:
+            dict. The timeline of each node, a list of
+                  (state, seconds since the MS went down) tuples.
+        """
+        # WAIT FOR THE MS NODE TO BECOME UNREACHABLE
+        ms_ip = self.test.get_node_att(self.ms_node, 'ipv4')
+        self.test.assertTrue(self.test.wait_for_ping(ms_ip, False,
+                                                     timeout_mins,
+                                                     retry_count=2),
+                             "Node has not gone down")
+        # WIPE ACTIVE SSH CONNECTIONS TO FORCE A RECONNECT
+        self.test.disconnect_all_nodes()
+
+        nodes = [self.ms_node] + self.peer_nodes
+        self.timeline = dict((node, []) for node in nodes)
+        self.failures = {}
+        abort = threading.Event()
+        start = time.time()
+        deadline = start + timeout_mins * 60
+        self.fanout.map(
+            lambda node: self._monitor_node(node, start, deadline, abort),
+            nodes)
+
+        for node in nodes:
+            self.test.log('info', 'Restore timeline of {0}: {1}'.format(
+                node, ', '.join(['{0} {1:.0f}s'.format(stage, secs)
+                                 for stage, secs in self.timeline[node]])))
+        self.test.assertEqual({}, self.failures,
+                              "Nodes not ready after restore, node: "
+                              "state not reached {0}".format(self.failures))
+        return self.timeline
@@ -0,0 +1,148 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Finds the disks seen by every node of a cluster that are
+            neither LVM disks nor assigned to a VxVM volume group, from
+            the "vxdisk -e -o alldgs list" output of any number of nodes,
+            with the local device name of each disk on each node.
+'''
+
+import re
+
+
+class SharedDisk(object):
+    """
+    A disk seen by several nodes.
+    """
+
+    __slots__ = ('name', 'devices')
+
+    def __init__(self, name):
+        """
+        Description:
+            Creates a shared disk.
+        Args:
+            name (str): The VxVM device name, e.g. emc_clariion0_127.
+        """
+        self.name = name
+        self.devices = {}
+
+    @property
+    def nodes(self):
+        """ The nodes the disk is seen by, sorted. """
+        return sorted(self.devices)
+
+    def find_by_id(self, by_id, nodes=None):
+        """
+        Description:
+            Finds the first node with a by-id link to the disk.
+        Args:
+            by_id (dict): The ByIdIndex of each node.
+            nodes (list): The nodes to try, in order; the nodes the disk
+                          is seen by if not given.
+        Returns:
+            tuple. The node, its device name and the LITP uuid of the
+                   disk, or None if no node has a link to it.
+        """
+        for node in nodes or self.nodes:
+            device = self.devices.get(node)
+            if device is None or node not in by_id:
+                continue
+            uuid = by_id[node].get_uuid(device)
+            if uuid is not None:
+                return node, device, uuid
+        return None
+
+    def __repr__(self):
+        return "SharedDisk({0} {1})".format(self.name, self.devices)
+
+
+class SharedDiskResolver(object):
+    """
+    Resolves the unassigned shared disks of a set of nodes.
+    """
+
+    HEADER = 'DEVICE'
+    # DISKS OF THESE TYPES ARE NEVER CANDIDATES
+    EXCLUDED_RE = re.compile('LVM|sliced')
+    # COLUMN OF THE OS NATIVE NAME WITH A TWO WORD STATUS, E.G. "online
+    # invalid"
+    DEVICE_COLUMN = 6
+
+    def __init__(self, vg_ids):
+        """
+        Description:
+            Creates a resolver.
+        Args:
+            vg_ids (list): The ids of the VxVM volume groups as they
+                           appear in the LITP model; a disk whose vxdisk
+                           line mentions one of them is assigned.
+        """
+        self.vg_ids = list(vg_ids)
+        self.assigned_re = re.compile('|'.join(
+            re.escape(vg_id) for vg_id in self.vg_ids)) \
+            if self.vg_ids else None
+
+    def is_free(self, line):
+        """
+        Description:
+            Checks whether a vxdisk line is a disk that is neither an LVM
+            or sliced disk nor assigned to a volume group.
+        Args:
+            line (str): A line of vxdisk list output.
+        Returns:
+            bool. True if the disk is free.
+        """
+        if self.HEADER in line or self.EXCLUDED_RE.search(line):
+            return False
+        return self.assigned_re is None or \
+            self.assigned_re.search(line) is None
+
+    def get_free_disks(self, lines):
+        """
+        Description:
+            Returns the free disks of a node in a single pass.
+        Args:
+            lines (list): The vxdisk -e -o alldgs list output of the node.
+        Returns:
+            dict. The local device name keyed by VxVM device name; the
+                  device name is None if the line has no such column.
+        """
+        disks = {}
+        for line in lines:
+            if not line.strip() or not self.is_free(line):
+                continue
+            name = line.split(":")[0].split(' ')[0]
+            fields = line.split()
+            disks.setdefault(name, fields[self.DEVICE_COLUMN]
+                             if len(fields) > self.DEVICE_COLUMN else None)
+        return disks
+
+    def resolve(self, nodes_disks):
+        """
+        Description:
+            Returns the free disks seen by every node.
+        Args:
+            nodes_disks (dict): The vxdisk output lines keyed by node.
+        Returns:
+            dict. The SharedDisk objects keyed by VxVM device name.
+        """
+        nodes_free = dict((node, self.get_free_disks(lines))
+                          for node, lines in nodes_disks.items())
+        if not nodes_free:
+            return {}
+        names = set.intersection(*[set(disks)
+                                   for disks in nodes_free.values()])
+        shared = {}
+        for name in names:
+            disk = SharedDisk(name)
+            for node, disks in nodes_free.items():
+                disk.devices[node] = disks[name]
+            shared[name] = disk
+        return shared
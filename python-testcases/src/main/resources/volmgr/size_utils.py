@@ -0,0 +1,306 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Size arithmetic shared by the volmgr testsets. Sizes are held
+            as an exact number of bytes in an immutable Size value and
+            parsed with a single compiled pattern whose results are
+            cached. Sizes are interned by byte count, so the arithmetic
+            and conversions of the sizes a test keeps using allocate
+            nothing.
+'''
+
+import re
+
+EXPONENTS = {'': 0, 'B': 0, 'K': 1, 'M': 2, 'G': 3, 'T': 4, 'P': 5}
+MULTIPLIERS = dict((unit, 1024 ** exp) for unit, exp in EXPONENTS.items())
+MULTIPLIERS.update((unit.lower(), mult) for unit, mult in
+                   list(MULTIPLIERS.items()))
+SECTOR_BYTES = 512
+
+# LITP SIZES ("10G"), LVS OUTPUT ("<10.00g") AND PLAIN BYTE COUNTS
+_SIZE_RE = re.compile(r'^\s*<?(\d+(?:\.\d*)?)\s*([KMGTPkmgtp]?)[Bb]?\s*$')
+_PARSE_CACHE = {}
+_SIZE_CACHE = {}
+_BYTES_CACHE = {}
+_PERCENT_CACHE = {}
+_CACHE_MAX = 4096
+
+
+def split_size(text):
+    """
+    Description:
+        Splits a size string into its numeric value and upper case unit.
+    Args:
+        text (str): The size, e.g. "10G", "512m" or "<1.50g".
+    Returns:
+        float, str. The numeric value and the unit, '' for bytes.
+    """
+    cached = _PARSE_CACHE.get(text)
+    if cached is not None:
+        return cached
+    match = _SIZE_RE.match(text)
+    if match is None:
+        raise ValueError("Invalid size: '{0}'".format(text))
+    value, unit = match.groups()
+    parsed = (float(value), unit.upper())
+    if len(_PARSE_CACHE) >= _CACHE_MAX:
+        _PARSE_CACHE.clear()
+    _PARSE_CACHE[text] = parsed
+    return parsed
+
+
+def smaller_unit(unit_x, unit_y):
+    """
+    Description:
+        Returns the smaller of two units. LITP sizes are integers so sums
+        are expressed in the smaller unit of their operands.
+    Args:
+        unit_x (str): A unit, e.g. "G".
+        unit_y (str): A unit, e.g. "M".
+    Returns:
+        str. The smaller unit.
+    """
+    if EXPONENTS[unit_x.upper()] <= EXPONENTS[unit_y.upper()]:
+        return unit_x.upper()
+    return unit_y.upper()
+
+
+def approx_equal(var_x, var_y, tolerance=0.01):
+    """
+    Description:
+        Compares two numbers allowing a relative difference of tolerance.
+    Args:
+        var_x (float): A number.
+        var_y (float): A number.
+        tolerance (float): The allowed relative difference.
+    Returns:
+        bool. True if the numbers are approximately equal.
+    """
+    return abs(var_x - var_y) <= 0.5 * tolerance * (var_x + var_y)
+
+
+class Size(object):
+    """
+    An immutable size with an exact number of bytes.
+    """
+
+    __slots__ = ('_bytes',)
+
+    def __init__(self, num_bytes=0):
+        """
+        Description:
+            Creates a size from a number of bytes.
+        Args:
+            num_bytes (int): The number of bytes.
+        """
+        _set_bytes(self, int(num_bytes))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Size is immutable")
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Description:
+            Creates a size from a string. A value without a unit is a
+            number of bytes.
+        Args:
+            text (str): The size, e.g. "10G", "512M" or "<1.50g".
+        Returns:
+            Size. The size.
+        """
+        size = _SIZE_CACHE.get(text)
+        if size is None:
+            value, unit = split_size(text)
+            size = cls.from_units(value, unit)
+            if len(_SIZE_CACHE) >= _CACHE_MAX:
+                _SIZE_CACHE.clear()
+            _SIZE_CACHE[text] = size
+        return size
+
+    @classmethod
+    def from_units(cls, value, unit):
+        """
+        Description:
+            Creates a size from a value in the given unit. Fractions of a
+            byte are truncated.
+        Args:
+            value (float): The value.
+            unit (str): The unit, e.g. "M".
+        Returns:
+            Size. The size.
+        """
+        return _new_size(int(float(value) * MULTIPLIERS[unit]))
+
+    @classmethod
+    def from_sectors(cls, sectors):
+        """
+        Description:
+            Creates a size from a number of 512 byte sectors, as reported
+            for VxVM plexes and volumes.
+        Args:
+            sectors (int): The number of sectors.
+        Returns:
+            Size. The size.
+        """
+        return _new_size(int(sectors) * SECTOR_BYTES)
+
+    @property
+    def bytes(self):
+        """ The exact number of bytes. """
+        return self._bytes
+
+    @property
+    def sectors(self):
+        """ The number of whole 512 byte sectors. """
+        return self._bytes // SECTOR_BYTES
+
+    def to_unit(self, unit):
+        """
+        Description:
+            Returns the size as a value in the given unit.
+        Args:
+            unit (str): The unit, e.g. "G".
+        Returns:
+            float. The value.
+        """
+        return self._bytes / float(MULTIPLIERS[unit])
+
+    def whole_units(self, unit):
+        """
+        Description:
+            Returns the size as a whole number of the given unit, any
+            fraction truncated. The division is done on integers so it is
+            exact for any size.
+        Args:
+            unit (str): The unit, e.g. "M".
+        Returns:
+            int. The value.
+        """
+        if self._bytes >= 0:
+            return self._bytes // MULTIPLIERS[unit]
+        return -(-self._bytes // MULTIPLIERS[unit])
+
+    def to_litp(self, unit):
+        """
+        Description:
+            Formats the size as a LITP size property in the given unit.
+            LITP sizes are integers so any fraction is truncated.
+        Args:
+            unit (str): The unit, e.g. "M".
+        Returns:
+            str. The size, e.g. "512M".
+        """
+        if self._bytes >= 0:
+            return str(self._bytes // MULTIPLIERS[unit]) + unit.upper()
+        return str(-(-self._bytes // MULTIPLIERS[unit])) + unit.upper()
+
+    def best_unit(self):
+        """
+        Description:
+            Returns the largest unit in which the size is a whole number.
+        Returns:
+            str. The unit.
+        """
+        for unit in ('P', 'T', 'G', 'M', 'K'):
+            if self._bytes % MULTIPLIERS[unit] == 0:
+                return unit
+        return ''
+
+    def percent(self, percentage, unit='M'):
+        """
+        Description:
+            Returns a percentage of the size truncated to a whole number of
+            the given unit, as LITP does when sizing snapshots.
+        Args:
+            percentage (str): The percentage, e.g. a snap_size value.
+            unit (str): The unit the result is truncated to.
+        Returns:
+            Size. The size.
+        """
+        key = (self._bytes, percentage, unit)
+        size = _PERCENT_CACHE.get(key)
+        if size is None:
+            multiplier = MULTIPLIERS[unit]
+            size = _new_size(int(self._bytes / float(multiplier) *
+                                 float(percentage) / 100) * multiplier)
+            if len(_PERCENT_CACHE) >= _CACHE_MAX:
+                _PERCENT_CACHE.clear()
+            _PERCENT_CACHE[key] = size
+        return size
+
+    def approx_equal(self, other, tolerance=0.01):
+        """
+        Description:
+            Compares two sizes allowing a relative difference of tolerance.
+        Args:
+            other (Size): The size to compare with.
+            tolerance (float): The allowed relative difference.
+        Returns:
+            bool. True if the sizes are approximately equal.
+        """
+        return approx_equal(self._bytes, other.bytes, tolerance)
+
+    def __add__(self, other):
+        return _new_size(self._bytes + other._bytes)
+
+    def __sub__(self, other):
+        return _new_size(self._bytes - other._bytes)
+
+    def __eq__(self, other):
+        return isinstance(other, Size) and self._bytes == other.bytes
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self._bytes < other.bytes
+
+    def __le__(self, other):
+        return self._bytes <= other.bytes
+
+    def __gt__(self, other):
+        return self._bytes > other.bytes
+
+    def __ge__(self, other):
+        return self._bytes >= other.bytes
+
+    def __hash__(self):
+        return hash(self._bytes)
+
+    def __repr__(self):
+        return "Size({0})".format(self._bytes)
+
+    def __str__(self):
+        return self.to_litp(self.best_unit())
+
+
+# SLOT SETTER USED BY __init__ SINCE __setattr__ REJECTS ALL ASSIGNMENTS
+_set_bytes = Size._bytes.__set__
+
+
+def _new_size(num_bytes):
+    """
+    Description:
+        Returns the interned size of an int number of bytes, created
+        without going through __init__, for the arithmetic and unit
+        conversions.
+    Args:
+        num_bytes (int): The number of bytes.
+    Returns:
+        Size. The size.
+    """
+    size = _BYTES_CACHE.get(num_bytes)
+    if size is None:
+        size = object.__new__(Size)
+        _set_bytes(size, num_bytes)
+        if len(_BYTES_CACHE) >= _CACHE_MAX:
+            _BYTES_CACHE.clear()
+        _BYTES_CACHE[num_bytes] = size
+    return size
@@ -0,0 +1,225 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Collects the "vxsnap list" output of every disk group on a
+            node in a single remote shell invocation and parses it into
+            a node -> disk group -> snapshot records map. Only the disk
+            groups imported on a node are listed there; the others, e.g.
+            LVM volume groups or a failover disk group deported on that
+            node, have no snapshots. The return code and standard error of
+            each listed disk group are framed in the output and asserted
+            as the per disk group commands were.
+'''
+
+from storage_utils import StorageUtils
+from node_fanout import NodeFanout
+from vx_topology import VxTopology
+
+
+class VxSnapRecord(object):
+    """
+    A single line of "vxsnap list" output.
+    """
+
+    __slots__ = ('name', 'disk_group', 'objtype', 'snaptype', 'parent',
+                 'node', 'line')
+
+    def __init__(self, line, disk_group, node=None):
+        """
+        Description:
+            Builds a record from a vxsnap list line.
+        Args:
+            line (str): The output line.
+            disk_group (str): The disk group the line was listed for.
+            node (str): The node the output was taken from.
+        """
+        fields = line.split()
+        self.name = fields[0]
+        self.disk_group = disk_group
+        self.objtype = fields[2] if len(fields) > 2 else None
+        self.snaptype = fields[3] if len(fields) > 3 else None
+        self.parent = fields[4] if len(fields) > 4 else None
+        self.node = node
+        self.line = line
+
+    def __repr__(self):
+        return "VxSnapRecord({0} dg={1} node={2})".format(
+            self.name, self.disk_group, self.node)
+
+
+class SnapshotInventory(object):
+    """
+    Snapshot inventory of the VxVM disk groups of a set of nodes.
+    """
+
+    DG_MARKER = '#DG:'
+    RC_MARKER = '#RC:'
+    ERR_MARKER = '#ERR:'
+    IMPORTED_VAR = 'VXDGS'
+    # grep RETURNS 1 WHEN NO LINE MATCHES
+    MAX_RC = 1
+
+    def __init__(self, test, fanout=None):
+        """
+        Description:
+            Creates an empty inventory bound to a test case.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            fanout (NodeFanout): Fan-out used to query the nodes; one is
+                                 created if not given.
+        """
+        self.test = test
+        self.storage = StorageUtils()
+        self.fanout = fanout or NodeFanout(test)
+        self.inventory = {}
+        self.nodes = []
+        self.dg_names = []
+        self.errors = {}
+
+    def get_inventory_cmd(self, dg_names, grep_args=None):
+        """
+        Description:
+            Builds a single shell command listing the snapshots of every
+            disk group imported on the node. The output of each disk group
+            is preceded by a marker line and followed by its return code;
+            its standard error lines are prefixed with another marker. A
+            disk group not imported is given an empty listing and a return
+            code of 0.
+        Args:
+            dg_names (list): The disk group names.
+            grep_args (str): Arguments of a grep the listing of each disk
+                             group is piped through.
+        Returns:
+            str. The command.
+        """
+        cmds = ["{0}=\" $({1} 2>/dev/null | awk '$1 != \"NAME\" "
+                "{{printf \"%s \", $1}}') \"".format(
+                    self.IMPORTED_VAR, VxTopology.VXDG_CMD)]
+        for dg_name in dg_names:
+            if grep_args is None:
+                vxsnap_cmd = self.storage.get_vxsnap_cmd(dg_name)
+            else:
+                vxsnap_cmd = self.storage.get_vxsnap_cmd(
+                    dg_name, grep_args=grep_args)
+            cmds.append(
+                "echo '{0}{1}'; case \"${5}\" in *\" {1} \"*) "
+                "{{ {{ {2}; echo \"{3}$?\"; }} 2>&1 1>&3 3>&- | "
+                "sed 's/^/{4}/'; }} 3>&1;; *) echo '{3}0';; esac".format(
+                    self.DG_MARKER, dg_name, vxsnap_cmd, self.RC_MARKER,
+                    self.ERR_MARKER, self.IMPORTED_VAR))
+        return "; ".join(cmds)
+
+    @staticmethod
+    def parse_inventory_output(lines, node=None):
+        """
+        Description:
+            Parses the output of the inventory command.
+        Args:
+            lines (list): Output of the command built by get_inventory_cmd.
+            node (str): The node the output was taken from.
+        Returns:
+            tuple. The records of each disk group keyed by disk group name,
+                   and the (return code, standard error lines) of each
+                   disk group keyed by disk group name.
+        """
+        dg_records = {}
+        dg_results = {}
+        disk_group = None
+        for line in lines:
+            if line.startswith(SnapshotInventory.DG_MARKER):
+                disk_group = line[len(SnapshotInventory.DG_MARKER):].strip()
+                dg_records.setdefault(disk_group, [])
+                dg_results.setdefault(disk_group, [None, []])
+                continue
+            if disk_group is None:
+                continue
+            if line.startswith(SnapshotInventory.RC_MARKER):
+                dg_results[disk_group][0] = int(
+                    line[len(SnapshotInventory.RC_MARKER):])
+                continue
+            if line.startswith(SnapshotInventory.ERR_MARKER):
+                dg_results[disk_group][1].append(
+                    line[len(SnapshotInventory.ERR_MARKER):])
+                continue
+            if not line.strip() or line.split()[0] == 'NAME':
+                continue
+            dg_records[disk_group].append(
+                VxSnapRecord(line, disk_group, node))
+        return dg_records, dict((disk_group, tuple(result)) for
+                                disk_group, result in dg_results.items())
+
+    def collect(self, nodes, dg_names, grep_args=None):
+        """
+        Description:
+            Collects the inventory of every disk group with one command
+            per node, run on all nodes concurrently. Asserts, for every
+            disk group imported on every node, that nothing was written to
+            standard error and that the return code is at most 1.
+        Args:
+            nodes (list): The node filenames.
+            dg_names (list): The disk group names; duplicates are ignored.
+            grep_args (str): Arguments of a grep the listing of each disk
+                             group is piped through on the nodes.
+        Returns:
+            dict. node -> disk group -> list of VxSnapRecord.
+        """
+        unique_dgs = []
+        for dg_name in dg_names:
+            if dg_name not in unique_dgs:
+                unique_dgs.append(dg_name)
+        self.dg_names = unique_dgs
+        self.nodes = []
+        for node in nodes:
+            if node not in self.nodes:
+                self.nodes.append(node)
+        results = self.fanout.run(
+            nodes, self.get_inventory_cmd(unique_dgs, grep_args), su_root=True)
+        self.inventory = {}
+        self.errors = {}
+        for node in self.nodes:
+            stdout, stderr, _ = results[node]
+            self.test.assertEqual([], stderr)
+            self.inventory[node], dg_results = \
+                self.parse_inventory_output(stdout, node)
+            for dg_name in unique_dgs:
+                ret_code, dg_stderr = dg_results.get(dg_name, (None, []))
+                self.test.assertTrue(ret_code is not None,
+                                     "No return code of disk group {0} on "
+                                     "{1}".format(dg_name, node))
+                if dg_stderr or ret_code > self.MAX_RC:
+                    self.errors[(node, dg_name)] = (ret_code, dg_stderr)
+        self.test.assertEqual({}, self.errors,
+                              "vxsnap list failed, (node, disk group): "
+                              "(rc, stderr) {0}".format(self.errors))
+        return self.inventory
+
+    def find(self, contains=None, nodes=None, dg_names=None):
+        """
+        Description:
+            Returns the records of the last collected inventory, ordered
+            by disk group and then node.
+        Args:
+            contains (str): Only return records whose line contains this
+                            text, as "grep" would.
+            nodes (list): Only return records from these nodes.
+            dg_names (list): Only return records of these disk groups.
+        Returns:
+            list. The matching VxSnapRecord objects.
+        """
+        records = []
+        for dg_name in self.dg_names:
+            if dg_names is not None and dg_name not in dg_names:
+                continue
+            for node in self.nodes:
+                if nodes is not None and node not in nodes:
+                    continue
+                for record in self.inventory[node].get(dg_name, []):
+                    if contains is None or contains in record.line:
+                        records.append(record)
+        return records
@@ -0,0 +1,384 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Names LITP gives to snapshot objects. The expected LVM
+            snapshot names of each node, and the expected VxVM snapshot
+            and cache object names of each disk group, are computed once
+            for a snapshot tag, so that a create, remove or restore is
+            verified with one set comparison against the observed
+            inventory.
+'''
+
+import re
+from size_utils import Size
+
+
+class SnapshotNames(object):
+    """
+    Expected snapshot object names for one snapshot tag.
+    """
+
+    LVM = 'lvm'
+    VXVM = 'vxvm'
+    CACHE = 'cache'
+    LVM_PREFIX = 'L_'
+    CACHE_PREFIX = 'LO'
+    FS_URL_RE = re.compile(r'/volume_groups/([^/]+)/file_systems/([^/]+)')
+    # FILE SYSTEMS OF THE MS ROOT VOLUME GROUP CREATED BY THE KICKSTART
+    # KEEP THEIR KICKSTART LV NAMES
+    KS_VG_ID = 'vg_root'
+    KS_MOUNT_POINTS = ('/', 'swap', '/home', '/var', '/var/log', '/var/www',
+                       '/software', '/var/lib/puppetdb', '/var/tmp',
+                       '/var/opt/rh')
+    # KICKSTART FILE SYSTEMS OF THE MS SNAPSHOTTED EVEN IF NOT MODELLED
+    KS_UNMODELLED_MOUNT_POINTS = ('/var/lib/puppetdb', '/var/tmp',
+                                  '/var/opt/rh')
+    SNAPSHOT_FS_TYPES = ('ext4', 'xfs', 'vxfs')
+    DEPLOYED_PATHS = ('/deployments/', '/ms/')
+
+    def __init__(self, model=None, tag='', identity=None):
+        """
+        Description:
+            Computes the expected names of the snapshots of every modelled
+            file system, or creates an empty set to add file systems to.
+        Args:
+            model (ModelSnapshot): Snapshot of the model. It must include
+                                   /ms for the MS file systems.
+            tag (str): The snapshot name given to create_snapshot -n, ''
+                       for the deployment snapshot.
+            identity (NodeIdentityIndex): Keys the LVM names by node
+                                          filename instead of hostname;
+                                          /ms need not be in the model.
+        """
+        self.tag = tag
+        self.identity = identity
+        self.lvm = {}
+        self.vxvm = {}
+        self.caches = {}
+        self.sizes = {}
+        if model is not None:
+            self.build(model)
+
+    @classmethod
+    def parse_fs_url(cls, url):
+        """
+        Description:
+            Returns the volume group and file system ids of a url.
+        Args:
+            url (str): The url of a file system.
+        Returns:
+            tuple. The volume group id and the file system id.
+        """
+        match = cls.FS_URL_RE.search(url)
+        if match is None:
+            raise ValueError("{0} is not a file system url".format(url))
+        return match.group(1), match.group(2)
+
+    @classmethod
+    def get_lv_name(cls, vg_id, fs_id, mount_point=None):
+        """
+        Description:
+            Returns the name of the logical volume of a file system.
+        Args:
+            vg_id (str): The id of the volume group item.
+            fs_id (str): The id of the file system item.
+            mount_point (str): The mount point of the file system; needed
+                               for the kickstart file systems of the MS.
+        Returns:
+            str. The LV name, e.g. vg1_root or lv_var_log.
+        """
+        if vg_id == cls.KS_VG_ID and mount_point in cls.KS_MOUNT_POINTS:
+            return cls.get_ks_lv_name(mount_point)
+        return '{0}_{1}'.format(vg_id, fs_id)
+
+    @staticmethod
+    def get_ks_lv_name(mount_point):
+        """
+        Description:
+            Returns the name of a kickstart logical volume of the MS.
+        Args:
+            mount_point (str): The mount point, or swap.
+        Returns:
+            str. The LV name, e.g. lv_root, lv_swap or lv_var_log.
+        """
+        if mount_point == '/':
+            return 'lv_root'
+        return 'lv_{0}'.format('_'.join(part for part in
+                                         mount_point.split('/') if part))
+
+    @classmethod
+    def get_lvm_name(cls, lv_name, tag=''):
+        """
+        Description:
+            Returns the name of the LVM snapshot of a logical volume.
+        Args:
+            lv_name (str): The LV name.
+            tag (str): The snapshot tag.
+        Returns:
+            str. The snapshot name, e.g. L_vg1_root_.
+        """
+        return '{0}{1}_{2}'.format(cls.LVM_PREFIX, lv_name, tag)
+
+    @classmethod
+    def get_vxvm_name(cls, fs_id, tag=''):
+        """
+        Description:
+            Returns the name of the VxVM snapshot of a file system.
+        Args:
+            fs_id (str): The id of the file system item.
+            tag (str): The snapshot tag.
+        Returns:
+            str. The snapshot name, e.g. L_fs1_.
+        """
+        return '{0}{1}_{2}'.format(cls.LVM_PREFIX, fs_id, tag)
+
+    @classmethod
+    def get_cache_name(cls, fs_id, tag=''):
+        """
+        Description:
+            Returns the name of the cache object of the VxVM snapshot of a
+            file system, as it appears in vxprint output.
+        Args:
+            fs_id (str): The id of the file system item.
+            tag (str): The snapshot tag.
+        Returns:
+            str. The cache object name, e.g. LOfs1_.
+        """
+        return '{0}{1}_{2}'.format(cls.CACHE_PREFIX, fs_id, tag)
+
+    @classmethod
+    def get_name_from_url(cls, url, vol_driver=LVM, tag='',
+                          mount_point=None):
+        """
+        Description:
+            Returns the snapshot name of the file system at a url.
+        Args:
+            url (str): The url of a file system.
+            vol_driver (str): The volume driver, lvm or vxvm.
+            tag (str): The snapshot tag.
+            mount_point (str): The mount point of the file system; needed
+                               for the kickstart file systems of the MS.
+        Returns:
+            str. The snapshot name.
+        """
+        vg_id, fs_id = cls.parse_fs_url(url)
+        if vol_driver == cls.LVM:
+            return cls.get_lvm_name(cls.get_lv_name(vg_id, fs_id,
+                                                    mount_point), tag)
+        return cls.get_vxvm_name(fs_id, tag)
+
+    def get_snap_percent(self, props):
+        """
+        Description:
+            Returns the snapshot size of a file system as a percentage of
+            its size: snap_size for the deployment snapshot and
+            backup_snap_size for a named snapshot.
+        Args:
+            props (dict): The properties of the file system.
+        Returns:
+            str. The percentage, or None if it is not modelled.
+        """
+        return props.get('backup_snap_size' if self.tag else 'snap_size')
+
+    def is_snapshotted(self, props):
+        """
+        Description:
+            Checks whether LITP snapshots a file system for the tag: only
+            mountable types are, and not if snap_external is set or the
+            snapshot size for the kind of snapshot is 0.
+        Args:
+            props (dict): The properties of the file system.
+        Returns:
+            bool. True if a snapshot is expected.
+        """
+        return props.get('type') in self.SNAPSHOT_FS_TYPES and \
+            props.get('snap_external') != 'true' and \
+            self.get_snap_percent(props) != '0'
+
+    def get_snap_size(self, props):
+        """
+        Description:
+            Returns the expected size of the snapshot of a file system,
+            truncated to whole megabytes as LITP does.
+        Args:
+            props (dict): The properties of the file system.
+        Returns:
+            Size. The size, or None if the sizes are not modelled.
+        """
+        percent = self.get_snap_percent(props)
+        if percent is None or 'size' not in props:
+            return None
+        return Size.parse(props['size']).percent(percent)
+
+    def _get_node(self, model, url):
+        """
+        Description:
+            Returns the key of the node a file system is deployed on.
+        Args:
+            model (ModelSnapshot): Snapshot of the model.
+            url (str): The url of the file system.
+        Returns:
+            str. The node hostname, or filename with an identity, or None
+                 if the file system is not below a node.
+        """
+        if self.identity is not None:
+            return self.identity.get_filename(url)
+        if url.startswith('/ms/'):
+            node_url = '/ms'
+        else:
+            node_url = model.get_node_url_from_child_url(url)
+        if node_url is None:
+            return None
+        return model.get_props_from_url(node_url, 'hostname')
+
+    def build(self, model):
+        """
+        Description:
+            Adds the snapshots of every deployed file system of a model.
+            LVM file systems are keyed by node; VxVM file systems by disk
+            group, as they move between the nodes of a cluster.
+        Args:
+            model (ModelSnapshot): Snapshot of the model.
+        """
+        for url in model.find('/', 'file-system', assert_not_empty=False):
+            if not url.startswith(self.DEPLOYED_PATHS):
+                continue
+            props = model.get_props_from_url(url)
+            if not self.is_snapshotted(props):
+                continue
+            vg_url = url.rsplit('/file_systems/', 1)[0]
+            sp_url = vg_url.rsplit('/volume_groups/', 1)[0]
+            vol_driver = model.get_props_from_url(
+                sp_url, 'volume_driver') or self.LVM
+            size = self.get_snap_size(props)
+            if vol_driver == self.VXVM:
+                self.add(model.get_props_from_url(
+                    vg_url, 'volume_group_name'), url, vol_driver, size=size)
+            else:
+                node = self._get_node(model, url)
+                if node is not None:
+                    self.add(node, url, mount_point=props.get('mount_point'),
+                             size=size)
+
+    def add(self, key, url, vol_driver=LVM, mount_point=None, size=None):
+        """
+        Description:
+            Adds the snapshot of a file system.
+        Args:
+            key (str): The node of an LVM file system, or the disk group
+                       of a VxVM file system.
+            url (str): The url of the file system.
+            vol_driver (str): The volume driver, lvm or vxvm.
+            mount_point (str): The mount point of the file system.
+            size (Size): The expected size of the LVM snapshot, or of the
+                         VxVM cache.
+        """
+        if vol_driver == self.LVM:
+            name = self.get_name_from_url(url, vol_driver, self.tag,
+                                          mount_point)
+            self.lvm.setdefault(key, set()).add(name)
+        else:
+            fs_id = self.parse_fs_url(url)[1]
+            self.vxvm.setdefault(key, set()).add(
+                self.get_vxvm_name(fs_id, self.tag))
+            name = self.get_cache_name(fs_id, self.tag)
+            self.caches.setdefault(key, set()).add(name)
+        if size is not None:
+            self.sizes[(key, name)] = size
+
+    def get_expected(self, kind=LVM):
+        """
+        Description:
+            Returns the expected names.
+        Args:
+            kind (str): lvm for the LVM snapshots, vxvm for the VxVM
+                        snapshots or cache for their cache objects.
+        Returns:
+            dict. The sets of names keyed by node or disk group.
+        """
+        if kind == self.LVM:
+            return self.lvm
+        if kind == self.VXVM:
+            return self.vxvm
+        return self.caches
+
+    @staticmethod
+    def get_observed_lvm(inventory):
+        """
+        Description:
+            Returns the LVM snapshot names of a collected inventory.
+        Args:
+            inventory (LvInventory): The collected inventory.
+        Returns:
+            dict. The sets of names keyed by node.
+        """
+        observed = dict((node, set()) for node in inventory.nodes)
+        for record in inventory.find(snapshots=True):
+            observed[record.node].add(record.lv_name)
+        return observed
+
+    @staticmethod
+    def get_observed_vxvm(vxprint):
+        """
+        Description:
+            Returns the VxVM volume and cache object names of a parsed
+            vxprint output.
+        Args:
+            vxprint (VxprintOutput): The parsed output.
+        Returns:
+            dict. The sets of names keyed by disk group.
+        """
+        observed = {}
+        for record in vxprint.records:
+            if record.record_type in (vxprint.VOLUME, vxprint.CACHE):
+                observed.setdefault(record.disk_group, set()).add(
+                    record.name)
+        return observed
+
+    @staticmethod
+    def compare(expected, observed):
+        """
+        Description:
+            Compares expected names with observed ones.
+        Args:
+            expected (dict): The sets of expected names by key.
+            observed (dict): The sets of observed names by key.
+        Returns:
+            dict, dict. The sorted missing and the sorted found expected
+                        names by key; keys with none are left out.
+        """
+        missing = {}
+        found = {}
+        for key, names in expected.items():
+            present = names & observed.get(key, set())
+            if names - present:
+                missing[key] = sorted(names - present)
+            if present:
+                found[key] = sorted(present)
+        return missing, found
+
+    def verify(self, test, observed, kind=LVM, present=True):
+        """
+        Description:
+            Asserts that all the expected snapshots exist, or that none
+            of them does.
+        Args:
+            test (GenericTest): The test case asserting.
+            observed (dict): The sets of observed names by key.
+            kind (str): The kind of names to verify, lvm, vxvm or cache.
+            present (bool): False to assert that none exists.
+        """
+        missing, found = self.compare(self.get_expected(kind), observed)
+        if present:
+            test.assertEqual({}, missing,
+                             "Snapshots missing: {0}".format(missing))
+        else:
+            test.assertEqual({}, found,
+                             "Snapshots unexpectedly found: {0}".format(
+                                 found))
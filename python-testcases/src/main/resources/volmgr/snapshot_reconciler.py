@@ -0,0 +1,402 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Reconciles the snapshots of a deployment. The snapshots
+            expected from the model and its snapshot items are compared
+            with the LVM and VxVM objects found on the nodes, and the MS if
+            asked, in one parallel sweep, and every missing, unexpected or
+            wrongly sized snapshot is reported at once.
+'''
+
+from model_snapshot import ModelSnapshot
+from node_identity import NodeIdentityIndex
+from node_fanout import NodeFanout
+from remote_session import RemoteSession
+from lv_inventory import LvInventory
+from vxprint_parser import VxprintOutput
+from snapshot_names import SnapshotNames
+from size_utils import Size
+
+
+class SnapshotMismatch(object):
+    """
+    A snapshot object that differs from the expected state.
+    """
+
+    __slots__ = ('kind', 'key', 'name', 'expected', 'observed')
+
+    def __init__(self, kind, key, name, expected=None, observed=None):
+        """
+        Description:
+            Creates a mismatch.
+        Args:
+            kind (str): lvm, vxvm or cache.
+            key (str): The node of an LVM snapshot, or the disk group of
+                       a VxVM one.
+            name (str): The snapshot or cache object name.
+            expected (Size): The expected size of a wrongly sized object.
+            observed (Size): The observed size of a wrongly sized object.
+        """
+        self.kind = kind
+        self.key = key
+        self.name = name
+        self.expected = expected
+        self.observed = observed
+
+    def __repr__(self):
+        if self.expected is None:
+            return "{0} {1} on {2}".format(self.kind, self.name, self.key)
+        return "{0} {1} on {2}: {3} instead of {4}".format(
+            self.kind, self.name, self.key, self.observed, self.expected)
+
+
+class SnapshotDiff(object):
+    """
+    The differences between the expected and the observed snapshots.
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Creates an empty diff.
+        """
+        self.missing = []
+        self.unexpected = []
+        self.wrong_size = []
+
+    @property
+    def is_clean(self):
+        """ True if the observed snapshots are the expected ones. """
+        return not (self.missing or self.unexpected or self.wrong_size)
+
+    def format(self):
+        """
+        Description:
+            Returns a report of every difference, one per line.
+        Returns:
+            str. The report, empty if the diff is clean.
+        """
+        lines = []
+        for title, mismatches in (('Missing', self.missing),
+                                  ('Unexpected', self.unexpected),
+                                  ('Wrong size', self.wrong_size)):
+            lines.extend("{0}: {1!r}".format(title, mismatch)
+                         for mismatch in mismatches)
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return "SnapshotDiff({0} missing, {1} unexpected, {2} wrong size)" \
+            .format(len(self.missing), len(self.unexpected),
+                    len(self.wrong_size))
+
+
+class SnapshotReconciler(object):
+    """
+    Compares the snapshots of a deployment with its model.
+    """
+
+    MODEL_PATHS = ('/deployments', '/infrastructure', '/ms', '/snapshots')
+    SNAPSHOT_TYPE = 'snapshot-base'
+    # THE ITEM OF THE DEPLOYMENT SNAPSHOT; OTHER ITEMS ARE NAMED SNAPSHOTS
+    DEPLOYMENT_SNAPSHOT_ID = 'snapshot'
+    VXPRINT_CMD = '/usr/sbin/vxprint -vt'
+    # LVM ROUNDS SNAPSHOTS UP TO WHOLE EXTENTS
+    SIZE_ALLOWANCE = Size.parse('4M')
+    SIZE_TOLERANCE = 0.01
+
+    def __init__(self, test, ms_node, nodes, fanout=None, identity=None):
+        """
+        Description:
+            Creates a reconciler for a deployment.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            ms_node (str): Filename of the management server.
+            nodes (list): Filenames of the managed nodes swept by default.
+            fanout (NodeFanout): Fan-out used to query the nodes; one is
+                                 created if not given.
+            identity (NodeIdentityIndex): Maps model nodes to filenames;
+                                          built from each reconciled model
+                                          if not given.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.nodes = list(nodes)
+        self.fanout = fanout or NodeFanout(test)
+        self.identity = identity
+
+    def get_expected(self, model, tags=None):
+        """
+        Description:
+            Returns the expected snapshot names of each snapshot item.
+        Args:
+            model (ModelSnapshot): Snapshot of the model, including /ms and
+                                   /snapshots.
+            tags (list): The tags to expect, '' for the deployment
+                         snapshot; the snapshot items of the model if not
+                         given.
+        Returns:
+            dict. The SnapshotNames keyed by tag.
+        """
+        if tags is None:
+            tags = ['' if url.rsplit('/', 1)[-1] ==
+                    self.DEPLOYMENT_SNAPSHOT_ID else url.rsplit('/', 1)[-1]
+                    for url in model.find('/snapshots', self.SNAPSHOT_TYPE,
+                                          assert_not_empty=False)]
+        identity = self.identity or NodeIdentityIndex(self.test,
+                                                      self.ms_node, model)
+        return dict((tag, SnapshotNames(model, tag, identity))
+                    for tag in tags)
+
+    def _collect_node(self, node):
+        """
+        Description:
+            Lists the logical volumes and VxVM objects of a node with one
+            root shell execution.
+        Args:
+            node (str): The node filename.
+        Returns:
+            list, list. The LvRecord of each volume and the vxprint output
+                        lines, none if VxVM is not installed.
+        """
+        lvs_res, vxprint_res = RemoteSession(self.test, node).run_commands(
+            [LvInventory.LVS_CMD, self.VXPRINT_CMD])
+        self.test.assertEqual(0, lvs_res.rc,
+                              "lvs failed on {0}: {1}".format(
+                                  node, lvs_res.stderr))
+        return LvInventory.parse_lvs_output(lvs_res.stdout, node), \
+            vxprint_res.stdout if vxprint_res.rc == 0 else []
+
+    def collect(self, nodes):
+        """
+        Description:
+            Collects the snapshot objects of the nodes concurrently.
+        Args:
+            nodes (list): The node filenames.
+        Returns:
+            dict, VxprintOutput. The LVM snapshot records keyed by name of
+                                 each node, and the vxprint output of all
+                                 the nodes.
+        """
+        results = self.fanout.map(self._collect_node, nodes)
+        lvm = dict((node, {}) for node in nodes)
+        vxprint = VxprintOutput()
+        for node in nodes:
+            records, vxprint_lines = results[node]
+            for record in records:
+                if record.is_snapshot and \
+                   record.lv_name.startswith(SnapshotNames.LVM_PREFIX):
+                    lvm[node][record.lv_name] = record
+            vxprint.add(vxprint_lines, node)
+        return lvm, vxprint
+
+    @staticmethod
+    def get_observed_vxvm(vxprint):
+        """
+        Description:
+            Returns the VxVM snapshot and cache object names found.
+        Args:
+            vxprint (VxprintOutput): The vxprint output of the nodes.
+        Returns:
+            dict. The sets of names keyed by disk group.
+        """
+        observed = {}
+        for record in vxprint.records:
+            if (record.record_type == vxprint.VOLUME and
+                    record.name.startswith(SnapshotNames.LVM_PREFIX)) or \
+               (record.record_type == vxprint.CACHE and
+                    record.name.startswith(SnapshotNames.CACHE_PREFIX)):
+                observed.setdefault(record.disk_group, set()).add(
+                    record.name)
+        return observed
+
+    def size_matches(self, expected, observed):
+        """
+        Description:
+            Checks an observed size against the expected one, allowing for
+            the rounding of the volume manager.
+        Args:
+            expected (Size): The expected size.
+            observed (Size): The observed size.
+        Returns:
+            bool. True if the sizes match.
+        """
+        allowance = max(self.SIZE_ALLOWANCE.bytes,
+                        expected.bytes * self.SIZE_TOLERANCE)
+        return abs(observed.bytes - expected.bytes) <= allowance
+
+    def get_ms_tolerated(self, tags):
+        """
+        Description:
+            Returns the snapshots of the kickstart volumes of the MS that
+            LITP takes whether they are modelled or not.
+        Args:
+            tags (list): The tags.
+        Returns:
+            set. The snapshot names.
+        """
+        lv_names = [SnapshotNames.get_ks_lv_name(mount_point) for mount_point
+                    in SnapshotNames.KS_UNMODELLED_MOUNT_POINTS]
+        return set(SnapshotNames.get_lvm_name(lv_name, tag)
+                   for lv_name in lv_names for tag in tags)
+
+    def reconcile(self, nodes=None, tags=None, model=None, include_ms=False):
+        """
+        Description:
+            Compares the snapshots expected from the model with those
+            found on the nodes. VxVM snapshots are looked for on whichever
+            node has their disk group imported, so every node of a cluster
+            with VxVM file systems should be swept.
+        Args:
+            nodes (list): The managed nodes to sweep, by default all of
+                          them.
+            tags (list): The tags to expect; see get_expected. Objects of
+                         other tags are then ignored.
+            model (ModelSnapshot): Snapshot of the model; a new one is
+                                   taken if not given.
+            include_ms (bool): Sweep the MS too. Snapshots of its
+                               unmodelled kickstart volumes are neither
+                               required nor reported.
+        Returns:
+            SnapshotDiff. The differences.
+        """
+        nodes = [node for node in (self.nodes if nodes is None else nodes)
+                 if node != self.ms_node]
+        if include_ms:
+            nodes.insert(0, self.ms_node)
+        model = model or ModelSnapshot(self.test, self.ms_node,
+                                       self.MODEL_PATHS)
+        expected = self.get_expected(model, tags)
+        lvm, vxprint = self.collect(nodes)
+        observed_vxvm = self.get_observed_vxvm(vxprint)
+        if tags is not None:
+            for node in nodes:
+                lvm[node] = dict((name, record)
+                                 for name, record in lvm[node].items()
+                                 if self.has_tag(name, tags))
+            for disk_group, names in observed_vxvm.items():
+                observed_vxvm[disk_group] = set(
+                    name for name in names if self.has_tag(name, tags))
+
+        diff = SnapshotDiff()
+        expected_lvm = {}
+        expected_vxvm = {}
+        sizes = {}
+        for names in expected.values():
+            for node, node_names in names.lvm.items():
+                if node in lvm:
+                    expected_lvm.setdefault(node, set()).update(node_names)
+            for kind in (SnapshotNames.VXVM, SnapshotNames.CACHE):
+                for disk_group, dg_names in names.get_expected(kind).items():
+                    expected_vxvm.setdefault(disk_group, set()).update(
+                        dg_names)
+            sizes.update(names.sizes)
+
+        if include_ms:
+            tolerated = self.get_ms_tolerated(expected) - \
+                expected_lvm.get(self.ms_node, set())
+            lvm[self.ms_node] = dict(
+                (name, record) for name, record in lvm[self.ms_node].items()
+                if name not in tolerated)
+
+        for node in nodes:
+            node_expected = expected_lvm.get(node, set())
+            for name in sorted(node_expected - set(lvm[node])):
+                diff.missing.append(SnapshotMismatch(SnapshotNames.LVM,
+                                                     node, name))
+            for name in sorted(set(lvm[node]) - node_expected):
+                diff.unexpected.append(SnapshotMismatch(SnapshotNames.LVM,
+                                                        node, name))
+            for name in sorted(node_expected & set(lvm[node])):
+                self._check_size(diff, SnapshotNames.LVM, node, name,
+                                 sizes.get((node, name)),
+                                 lvm[node][name].size)
+
+        for disk_group in sorted(set(expected_vxvm) | set(observed_vxvm)):
+            dg_expected = expected_vxvm.get(disk_group, set())
+            dg_observed = observed_vxvm.get(disk_group, set())
+            for name in sorted(dg_expected - dg_observed):
+                diff.missing.append(SnapshotMismatch(
+                    self.get_vxvm_kind(name), disk_group, name))
+            for name in sorted(dg_observed - dg_expected):
+                diff.unexpected.append(SnapshotMismatch(
+                    self.get_vxvm_kind(name), disk_group, name))
+            for name in sorted(dg_expected & dg_observed):
+                if not name.startswith(SnapshotNames.CACHE_PREFIX):
+                    continue
+                volume = vxprint.get_cache_volume(name, disk_group)
+                if volume is not None and volume.length is not None:
+                    self._check_size(diff, SnapshotNames.CACHE, disk_group,
+                                     name, sizes.get((disk_group, name)),
+                                     Size.from_sectors(volume.length))
+        self.test.log('info', 'Snapshot reconciliation of {0}: {1!r}'.format(
+            ', '.join(nodes), diff))
+        return diff
+
+    @staticmethod
+    def has_tag(name, tags):
+        """
+        Description:
+            Checks whether a snapshot object belongs to one of the tags.
+        Args:
+            name (str): The snapshot or cache object name.
+            tags (list): The tags, '' for the deployment snapshot.
+        Returns:
+            bool. True if the name ends with one of the tags.
+        """
+        return any(name.endswith('_' + tag) for tag in tags)
+
+    @staticmethod
+    def get_vxvm_kind(name):
+        """
+        Description:
+            Returns the kind of a VxVM snapshot object from its name.
+        Args:
+            name (str): The snapshot or cache object name.
+        Returns:
+            str. vxvm or cache.
+        """
+        if name.startswith(SnapshotNames.CACHE_PREFIX):
+            return SnapshotNames.CACHE
+        return SnapshotNames.VXVM
+
+    def _check_size(self, diff, kind, key, name, expected, observed):
+        """
+        Description:
+            Adds a wrong size mismatch to a diff if the sizes differ.
+        Args:
+            diff (SnapshotDiff): The diff.
+            kind (str): lvm or cache.
+            key (str): The node or disk group.
+            name (str): The snapshot or cache object name.
+            expected (Size): The expected size, None if not modelled.
+            observed (Size): The observed size.
+        """
+        if expected is not None and not self.size_matches(expected,
+                                                          observed):
+            diff.wrong_size.append(SnapshotMismatch(kind, key, name,
+                                                    expected, observed))
+
+    def verify(self, nodes=None, tags=None, model=None, include_ms=False):
+        """
+        Description:
+            Asserts that the snapshots found are exactly the expected ones,
+            reporting every difference.
+        Args:
+            nodes (list): The managed nodes to sweep; see reconcile.
+            tags (list): The tags to expect; see get_expected.
+            model (ModelSnapshot): Snapshot of the model.
+            include_ms (bool): Sweep the MS too; see reconcile.
+        Returns:
+            SnapshotDiff. The clean diff.
+        """
+        diff = self.reconcile(nodes, tags, model, include_ms)
+        self.test.assertTrue(diff.is_clean,
+                             "Snapshots differ from the model:\n{0}".format(
+                                 diff.format()))
+        return diff
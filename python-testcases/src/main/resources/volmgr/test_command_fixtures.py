@@ -0,0 +1,59 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Offline replay of a recorded LVM and VxVM sweep of two peer
+            nodes. Runs without a deployment or the LITP test library:
+
+                python -m unittest test_command_fixtures
+
+            The archive in fixtures/ was written by CommandFixtures in
+            record mode; record it again on a deployment with the same
+            nodes if the sweep commands change.
+'''
+
+import os
+from command_fixtures import OfflineTest
+from lv_inventory import LvInventory
+from vx_topology import VxTopology
+
+
+class VolmgrSweepReplay(OfflineTest):
+    """
+    Replays the sweep of node1, whose root volume group has a deployment
+    snapshot, and node2, which imports the VxVM disk group vxvg1.
+    """
+
+    FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'fixtures')
+    NODES = ['node1', 'node2']
+
+    def test_01_p_sweep_lvm_and_vxvm(self):
+        """
+        Description:
+            Collects the LVs and the VxVM topology of both nodes from the
+            archive and checks the parsed records.
+        """
+        inventory = LvInventory(self)
+        inventory.collect(self.NODES)
+        root = inventory.get('node1', 'lv_root', 'vg_root')
+        self.assertEqual('/', root.mount_point)
+        self.assertEqual('ext4', root.fs_type)
+        self.assertTrue(root.is_origin)
+        self.assertEqual(
+            ['L_lv_root_'],
+            [record.lv_name for record in inventory.find(
+                nodes=['node1'], origin='lv_root', snapshots=True)])
+        self.assertEqual('swap', inventory.get('node2', 'lv_swap').fs_type)
+
+        topology = VxTopology(self, self.NODES)
+        self.assertEqual('node2', topology.get_owner('vxvg1'))
+        volume = topology.get_volume('vxvg1', 'vxfs1')
+        self.assertEqual('/jump', volume.mount_point)
+        self.assertEqual('ACTIVE', volume.state)
+        self.assertEqual([], topology.get_disk_groups('node1'))
@@ -0,0 +1,90 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Parsing of RemoteSession framed scripts run by a local bash,
+            with separate and with merged stdout and stderr. Runs without
+            a deployment or the LITP test library:
+
+                python -m unittest test_remote_session
+'''
+
+import subprocess
+import unittest
+from remote_session import RemoteSession
+
+
+class RemoteSessionFraming(unittest.TestCase):
+    """
+    Frames a few commands, runs the script and parses its output.
+    """
+
+    CMDS = ['echo out1; echo err1 >&2',
+            'echo out2; exit 3',
+            'echo err3 >&2; false']
+
+    def setUp(self):
+        """Setup a session whose commands are framed only"""
+        self.session = RemoteSession(None, 'node1')
+
+    def run_script(self, script):
+        """
+        Description:
+            Runs a script with bash.
+        Args:
+            script (str): The script.
+        Returns:
+            list, list. The stdout and stderr lines.
+        """
+        proc = subprocess.Popen(['bash', '-c', script],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        stdout, stderr = proc.communicate()
+        return stdout.decode().splitlines(), stderr.decode().splitlines()
+
+    def test_01_p_parse_separate_streams(self):
+        """
+        Description:
+            Each command gets its own stdout, stderr and return code.
+        """
+        stdout, stderr = self.run_script(
+            self.session.frame_commands(self.CMDS))
+        results = self.session.parse_framed_output(stdout, stderr,
+                                                   len(self.CMDS))
+        self.assertEqual([(['out1'], ['err1'], 0), (['out2'], [], 3),
+                          ([], ['err3'], 1)],
+                         [tuple(result) for result in results])
+
+    def test_02_p_parse_merged_streams(self):
+        """
+        Description:
+            With stderr merged into stdout, as through the su_root pty,
+            the stderr markers do not break the parse and the return
+            codes are still read.
+        """
+        stdout, stderr = self.run_script('{{ {0}; }} 2>&1'.format(
+            self.session.frame_commands(self.CMDS)))
+        self.assertEqual([], stderr)
+        results = self.session.parse_framed_output(stdout, stderr,
+                                                   len(self.CMDS))
+        self.assertEqual([(['out1', 'err1'], [], 0), (['out2'], [], 3),
+                          (['err3'], [], 1)],
+                         [tuple(result) for result in results])
+
+    def test_03_n_parse_incomplete_frame(self):
+        """
+        Description:
+            A command whose end marker is missing, e.g. because the
+            execution timed out, has no result.
+        """
+        stdout, stderr = self.run_script(
+            self.session.frame_commands(self.CMDS))
+        results = self.session.parse_framed_output(stdout[:-2], stderr,
+                                                   len(self.CMDS))
+        self.assertEqual(None, results[2])
+        self.assertEqual((['out2'], [], 3), tuple(results[1]))
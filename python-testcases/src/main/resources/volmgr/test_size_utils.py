@@ -0,0 +1,135 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Properties of size_utils.Size checked on seeded random sizes.
+            Runs without a deployment or the LITP test library:
+
+                python -m unittest test_size_utils
+'''
+
+import random
+import unittest
+from size_utils import Size, EXPONENTS, SECTOR_BYTES
+
+UNITS = ['K', 'M', 'G', 'T']
+
+
+class SizeProperties(unittest.TestCase):
+    """
+    Invariants of Size over many random LITP sizes.
+    """
+
+    COUNT = 2000
+    SEED = 2067
+
+    def setUp(self):
+        """Setup the random LITP sizes, the same on every run"""
+        rand = random.Random(self.SEED)
+        self.sizes = [('{0}{1}'.format(rand.randint(0, 100000), unit), unit)
+                      for unit in [rand.choice(UNITS)
+                                   for _ in range(self.COUNT)]]
+        self.pairs = list(zip(self.sizes, self.sizes[1:] + self.sizes[:1]))
+        self.rand = rand
+
+    def test_01_p_parse_and_format_round_trip(self):
+        """
+        Description:
+            A LITP size parses to its exact number of bytes, formats back
+            to the same text in its unit and in its best unit, and its unit
+            is case insensitive.
+        """
+        for text, unit in self.sizes:
+            size = Size.parse(text)
+            self.assertEqual(int(text[:-1]) * 1024 ** EXPONENTS[unit],
+                             size.bytes, text)
+            self.assertEqual(text, size.to_litp(unit))
+            self.assertEqual(size, Size.parse(str(size)), text)
+            self.assertEqual(size, Size.parse(text.lower()), text)
+
+    def test_02_p_add_and_subtract(self):
+        """
+        Description:
+            Sums and differences are exact: (a + b) - b == a.
+        """
+        for (text_x, _), (text_y, _) in self.pairs:
+            size_x = Size.parse(text_x)
+            size_y = Size.parse(text_y)
+            self.assertEqual(size_x.bytes + size_y.bytes,
+                             (size_x + size_y).bytes)
+            self.assertEqual(size_x, (size_x + size_y) - size_y)
+
+    def test_03_p_order_and_hash_follow_bytes(self):
+        """
+        Description:
+            Comparisons and hashes agree with the byte counts.
+        """
+        for (text_x, _), (text_y, _) in self.pairs:
+            size_x = Size.parse(text_x)
+            size_y = Size.parse(text_y)
+            self.assertEqual(size_x.bytes < size_y.bytes, size_x < size_y)
+            self.assertEqual(size_x.bytes <= size_y.bytes, size_x <= size_y)
+            self.assertEqual(size_x.bytes == size_y.bytes, size_x == size_y)
+            self.assertEqual(size_x.bytes != size_y.bytes, size_x != size_y)
+            self.assertEqual(size_x.bytes, Size(size_x.bytes).bytes)
+            self.assertEqual(hash(size_x), hash(Size(size_x.bytes)))
+
+    def test_04_p_sectors_round_trip(self):
+        """
+        Description:
+            LITP sizes are whole numbers of sectors.
+        """
+        for text, _ in self.sizes:
+            size = Size.parse(text)
+            self.assertEqual(size.bytes, size.sectors * SECTOR_BYTES)
+            self.assertEqual(size, Size.from_sectors(size.sectors))
+
+    def test_05_p_percent_is_bounded_whole_and_monotonic(self):
+        """
+        Description:
+            A percentage of a size lies between zero and the size, is a
+            whole number of megabytes and grows with the percentage.
+        """
+        for text, _ in self.sizes:
+            size = Size.parse(text)
+            low, high = sorted([self.rand.randint(0, 100),
+                                self.rand.randint(0, 100)])
+            snap = size.percent(str(low))
+            self.assertTrue(Size() <= snap <= size, (text, low, snap))
+            self.assertEqual(0, snap.bytes % Size.parse('1M').bytes)
+            self.assertTrue(snap <= size.percent(str(high)), (text, low))
+
+    def test_06_p_whole_units_are_exact(self):
+        """
+        Description:
+            Whole units truncate towards zero without losing precision,
+            even beyond the precision of a float.
+        """
+        huge = Size(2 ** 60 + 1)
+        self.assertEqual(2 ** 50, huge.whole_units('K'))
+        self.assertEqual('1073741824G', huge.to_litp('G'))
+        self.assertEqual(1, Size.parse('2047M').whole_units('G'))
+        self.assertEqual(-1, (Size() - Size.parse('2047M')).whole_units('G'))
+        self.assertEqual('-1G', (Size() - Size.parse('2047M')).to_litp('G'))
+
+    def test_07_n_parse_invalid_size(self):
+        """
+        Description:
+            Text that is not a size is rejected.
+        """
+        for text in ('', 'G', '10X', '-1G', '1.2.3M', '10 GB B'):
+            self.assertRaises(ValueError, Size.parse, text)
+
+    def test_08_n_size_is_immutable(self):
+        """
+        Description:
+            A size cannot be modified, so interned sizes are safe to share.
+        """
+        size = Size.parse('1G')
+        self.assertRaises(AttributeError, setattr, size, '_bytes', 1)
+        self.assertEqual(Size.parse('1024M'), size)
@@ -13,17 +13,22 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 import test_constants
 from storage_utils import StorageUtils
+from lv_inventory import LvInventory
+from snapshot_names import SnapshotNames
 
 
-class Story10830(GenericTest):
+class Story10830(InstrumentedTestMixin, GenericTest):
     """
     As a LITP architect I want snapshot plans to only use snapshot model
     context with idemopotent tasks so that I have no mco agents for task
     creation. (LVM)
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """
         Description:
@@ -190,8 +195,8 @@ class Story10830(GenericTest):
             if vol['type'] == "xfs":
                 url = vol['path']
                 vol_grp_name = vol['volume_group_name']
-                snap_name = self.get_snapshot_name_from_url(url,
-                        name=snap_name)
+                snap_name = SnapshotNames.get_name_from_url(url,
+                        tag=snap_name)
                 node = vol['node_name']
                 lvsnap_location = "/dev/{0}/{1}".format(vol_grp_name,
                         snap_name)
@@ -231,37 +236,6 @@ class Story10830(GenericTest):
 
         return file_sys_dict
 
-    @staticmethod
-    def get_snapshot_name_from_url(url, vol_driver='lvm', name=''):
-        """
-        Description:
-            Function to compile the snapshot name of the file-system at
-            the provided url.
-
-        Args:
-            url (str): url to a file system object.
-            vol_driver (str): The volume driver under test, lbm or vxvm.
-            name (str): user specified name to include in snapshots.
-
-        Returns:
-            The snapshot name.
-        """
-        str_list = url.split('/')
-        index = str_list.index('volume_groups')
-        fs_id = str_list[index + 3]
-        if vol_driver == 'lvm':
-            vg_id = str_list[index + 1]
-            if name != '':
-                return "L_{0}_{1}_{2}".format(vg_id, fs_id, name)
-
-            return "L_{0}_{1}_".format(vg_id, fs_id)
-
-        else:
-            if name != '':
-                return "L_{0}_{1}".format(fs_id, name)
-
-            return "L_{0}_".format(fs_id)
-
     @attr('all', 'revert', 'story10830', 'story10830_tc03')
     def test_03_n_restore_snap_presence_chk_fail_when_snap_missing(self):
         '''
@@ -307,33 +281,14 @@ class Story10830(GenericTest):
             file_sys_dict (dict): Identifies the snapshots
             snap_name (str): Any specific name tag assigned.
         """
+        names = SnapshotNames(tag=snap_name)
         for vol in file_sys_dict:
             if vol['type'] == "xfs":
-                compiled_snap_name = self.get_snapshot_name_from_url(
-                        vol['path'], 'lvm', snap_name)
-
-                node = vol['node_name']
-                self.verify_snaps_on_node(node, compiled_snap_name)
+                names.add(vol['node_name'], vol['path'])
 
-    def verify_snaps_on_node(self, node, snap_name):
-        """
-        Description:
-            Verifies that the list of snapshots
-            have indeed been created on the specified node.
-        Args:
-            node (str): The node on which the check is to be
-                        performed.
-            snap_name (str): The snap for which to check.
-        """
-        lvscan_cmd = self.storage.get_lvscan_cmd()
-        stdout, _, _ = self.run_command(node, lvscan_cmd, su_root=True)
-        combined_lvscan_output = \
-                "".join(stdout).replace(' ', '').replace('\t',
-                                                         '').replace('\n', '')
-        self.assertTrue(
-                "ACTIVESnapshot'/dev/vg_root/{0}'".format(snap_name)
-                in combined_lvscan_output,
-                "ACTIVESnapshot'/dev/vg_root/{0}'".format(snap_name))
+        inventory = LvInventory(self)
+        inventory.collect(sorted(names.lvm))
+        names.verify(self, SnapshotNames.get_observed_lvm(inventory))
 
     @attr('all', 'revert', 'story10830', 'story10830_tc07')
     def test_07_n_restore_snap_presence_chk_fail_when_node_unreach(self):
@@ -404,8 +359,7 @@ class Story10830(GenericTest):
         '''
         self.remove_all_snapshots(self.ms_node)
 
-        log_path = test_constants.GEN_SYSTEM_LOG_PATH
-        log_len = self.get_file_len(self.ms_node, log_path)
+        self.log_watcher.mark()
 
         self.log('info', 'Create a deployment snapshot')
         self.execute_and_wait_createsnapshot(self.ms_node)
@@ -425,8 +379,7 @@ class Story10830(GenericTest):
         # Verify log message
         log_msg = "Node \\\"{0}\\\" not currently " \
                    "reachable. Continuing.".format(self.mn_nodes[0])
-        self.assertTrue(self.wait_for_log_msg(self.ms_node, log_msg,
-            log_len=log_len))
+        self.assertTrue(self.wait_for_log_msg(self.ms_node, log_msg))
 
         self.poweron_peer_node(self.ms_node, self.mn_nodes[0])
         self.manual_snap_clean(self.mn_nodes[0])
@@ -527,8 +480,8 @@ class Story10830(GenericTest):
         for vol in file_sys_dict:
             if vol['type'] == "xfs":
                 url = vol['path']
-                full_snap_name = self.get_snapshot_name_from_url(url,
-                                     name=snap_name)
+                full_snap_name = SnapshotNames.get_name_from_url(url,
+                                     tag=snap_name)
 
                 # Make sure the chosen volume isn't the root directory
                 if full_snap_name == "L_lv_root_":
@@ -13,14 +13,24 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from model_journal import ModelJournal
+from node_identity import NodeIdentityIndex
 import test_constants
-import time
+from model_snapshot import ModelSnapshot
+from node_fanout import NodeFanout
+from disk_by_id import ByIdIndex
+from shared_disks import SharedDiskResolver
+from vx_topology import VxTopology
+from vxprint_parser import VxprintOutput
+from snapshot_names import SnapshotNames
+from plan_model import PlanModel
+from power_orchestrator import PowerOrchestrator
 import os
 from redhat_cmd_utils import RHCmdUtils
-import re
 
 
-class Story10831(GenericTest):
+class Story10831(InstrumentedTestMixin, GenericTest):
     """
     As a LITP architect I want snapshot plans to use
     snapshot model context with idempotent tasks so
@@ -28,6 +38,8 @@ class Story10831(GenericTest):
     peer nodes (VXVM)
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """
         Description:
@@ -45,9 +57,17 @@ class Story10831(GenericTest):
 
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.journal = ModelJournal(self, self.ms_node)
+        self.journal.start()
+        self.identity = NodeIdentityIndex(self, self.ms_node)
         self.node_urls = self.find(self.ms_node, "/deployments", "node")
         self.node_urls.sort()
         self.mn_nodes = self.get_managed_node_filenames()
+        self.fanout = NodeFanout(self)
+        self.topology = VxTopology(self, self.mn_nodes, self.fanout,
+                                   self.identity)
+        self.power = PowerOrchestrator(self, self.ms_node,
+                                       identity=self.identity)
         # Current assumption is that only 1 VCS cluster will exist
         self.vcs_cluster_url = self.find(self.ms_node,
                                          "/deployments", "vcs-cluster")[-1]
@@ -75,42 +95,47 @@ class Story10831(GenericTest):
         """
         Description:
             Function to retrieve a dictionary of the file systems which
-            reside below each node.
+            reside below each node. The LITP model is read once into a
+            ModelSnapshot and all lookups are served from it.
         Args:
             vol_driver (str): The volume driver under test, lvm or vxvm.
         Returns:
             dict. A dictionary of all the file systems below each node.
         """
-        storage_profiles = self.get_storage_profile_paths(self.ms_node,
-                                                          vol_driver,
-                                                          "/deployments")
+        model = ModelSnapshot(self, self.ms_node)
+        storage_profiles = model.get_storage_profile_paths(vol_driver,
+                                                           "/deployments")
         all_file_systems = []
         file_sys_dict = {}
         for storage_profile in storage_profiles:
             volume_groups = \
-            self.get_all_vol_grps_from_storage_profile(storage_profile)
+            self.get_all_vol_grps_from_storage_profile(storage_profile, model)
             for volume_group in volume_groups:
                 all_file_systems.extend(self.get_all_file_sys_from_vol_grp(
-                                        volume_group))
+                                        volume_group, model))
         for file_sys in all_file_systems:
             file_sys_dict = \
-            self.compile_dict(file_sys, file_sys_dict, vol_driver)
+            self.compile_dict(file_sys, file_sys_dict, vol_driver, model)
         return file_sys_dict
 
-    def get_all_vol_grps_from_storage_profile(self, url):
+    def get_all_vol_grps_from_storage_profile(self, url, model=None):
         """
         Description:
             Function to retrieve all of the volume group object residing
             below the provided storage profile url.
         Args:
             url (str): A url to a storage profile object.
+            model (ModelSnapshot): Snapshot of the model to search; the
+                                   LITP model is queried if not given.
         Returns:
             list. A list of all of the volume group objects found.
         """
+        if model:
+            return model.find(url, "volume-group")
         stdout = self.find(self.ms_node, url, "volume-group")
         return stdout
 
-    def compile_dict(self, url, fs_dict, vol_driver='lvm'):
+    def compile_dict(self, url, fs_dict, vol_driver='lvm', model=None):
         """
         Description:
             Function to compile a dictionary identifying the file systems
@@ -122,24 +147,23 @@ class Story10831(GenericTest):
             fs_dict (dict): The dictionary to be populated.
             vol_driver (str): The volume driver of the storage profile parent;
                               Could be lvm or vxvm.
+            model (ModelSnapshot): Snapshot of the model; one is taken
+                                   if not given.
         Returns:
             dict. A dictionary of all the file systems below each node.
         """
+        if model is None:
+            model = ModelSnapshot(self, self.ms_node)
         if vol_driver == 'lvm':
-            url_list = url.split('/')
-            node_index = url_list.index('nodes')
-            # LIST COMPREHENSION TO COMPILE NODE URL FROM CHILD URL PROVIDED
-            node_url = \
-            "".join(["/" + x for x in url_list[:node_index + 2] if x != ''])
-
-            fs_dict = self.populate_dict(url, node_url, fs_dict)
+            node_url = model.get_node_url_from_child_url(url)
+            fs_dict = self.populate_dict(url, node_url, fs_dict, model)
         else:
             for node_url in self.node_urls:
-                fs_dict = self.populate_dict(url, node_url, fs_dict)
+                fs_dict = self.populate_dict(url, node_url, fs_dict, model)
 
         return fs_dict
 
-    def populate_dict(self, fs_url, node_url, fs_dict):
+    def populate_dict(self, fs_url, node_url, fs_dict, model=None):
         """
         Description:
             Function to populate a dictionary identifying the file systems
@@ -149,37 +173,41 @@ class Story10831(GenericTest):
             fs_url (str): A url of the file system object.
             node_url (str): A url of the node object.
             dict (dict): The dictionary to be populated.
+            model (ModelSnapshot): Snapshot of the model; one is taken
+                                   if not given.
         Returns:
             dict. A dictionary of all the file systems below each node.
         """
-        hostname = self.get_props_from_url(self.ms_node, node_url, 'hostname')
+        if model is None:
+            model = ModelSnapshot(self, self.ms_node)
+        hostname = model.get_props_from_url(node_url, 'hostname')
 
         if hostname not in fs_dict.keys():
             fs_dict[hostname] = {}
-        stdout = \
-        self.get_props_from_url(self.ms_node, fs_url)
-        snap_external = 'false'
-        if 'snap_external' in stdout:
-            snap_external = \
-            self.get_props_from_url(self.ms_node, fs_url, 'snap_external')
+        props = model.get_props_from_url(fs_url)
+        snap_external = props.get('snap_external', 'false')
         if snap_external not in fs_dict[hostname].keys():
             fs_dict[hostname][snap_external] = {}
-        stdout = self.get_props_from_url(self.ms_node, fs_url, 'type')
-        if stdout not in fs_dict[hostname][snap_external].keys():
-            fs_dict[hostname][snap_external][stdout] = []
-        fs_dict[hostname][snap_external][stdout].append(fs_url)
+        fs_type = props.get('type')
+        if fs_type not in fs_dict[hostname][snap_external].keys():
+            fs_dict[hostname][snap_external][fs_type] = []
+        fs_dict[hostname][snap_external][fs_type].append(fs_url)
         return fs_dict
 
-    def get_all_file_sys_from_vol_grp(self, url):
+    def get_all_file_sys_from_vol_grp(self, url, model=None):
         """
         Description:
             Function to retrieve all of the file system objects residing
             below the provided volume group object.
         Args:
             url (str): A url of the volume group object.
+            model (ModelSnapshot): Snapshot of the model to search; the
+                                   LITP model is queried if not given.
         Returns:
             list. A list of all the file system objects found.
         """
+        if model:
+            return model.find(url, "file-system")
         stdout = self.find(self.ms_node, url, "file-system")
         return stdout
 
@@ -196,58 +224,50 @@ class Story10831(GenericTest):
             lvm_tasks (bool): Defines whether lvm snaps should be
                               present.
         """
-        combined_plan_output = self.combine_plan_output(stdout)
+        plan = PlanModel(stdout)
 
-        self.assertTrue("CheckVxVMsnapshotsarevalid"
-                        in combined_plan_output)
+        self.assertTrue(plan.has_task("Check VxVM snapshots are valid"))
         if lvm_tasks == True:
 
-            self.assertTrue('CheckLVMsnapshotsonnode(s)'
-                            in combined_plan_output)
+            self.assertTrue(plan.has_task('Check LVM snapshots on node(s)'))
 
-            self.assertTrue('arevalid'
-                            in combined_plan_output)
+            self.assertTrue(plan.has_task('are valid'))
 
         if '-f' in args:
-            self.assertFalse("Checkthatanactivenode" \
-                             "existsforeachVxVMvolumegroup"
-                             in combined_plan_output)
-            self.assertFalse("CheckVxVMsnapshotsarepresent"
-                             in combined_plan_output)
+            self.assertFalse(plan.has_task("Check that an active node "
+                                           "exists for each VxVM volume "
+                                           "group"))
+            self.assertFalse(plan.has_task("Check VxVM snapshots are "
+                                           "present"))
             if lvm_tasks == True:
-                self.assertFalse('Checkpeernode(s)'
-                                 in combined_plan_output)
-                self.assertFalse('withallLVMsnapshotspresent'
-                                 in combined_plan_output)
-                self.assertTrue('Restartandwaitfornodes'
-                                in combined_plan_output)
+                self.assertFalse(plan.has_task('Check peer node(s)'))
+                self.assertFalse(plan.has_task('with all LVM snapshots '
+                                               'present'))
+                self.assertTrue(plan.has_task('Restart and wait for nodes'))
         else:
 
-            self.assertTrue("Checkthatallnodesarereachable" \
-                            "andanactivenodeexistsforeachVxVMvolumegroup"
-                            in combined_plan_output)
+            self.assertTrue(plan.has_task("Check that all nodes are "
+                                          "reachable and an active node "
+                                          "exists for each VxVM volume "
+                                          "group"))
 
-            self.assertTrue("CheckVxVMsnapshotsarepresent"
-                            in combined_plan_output)
+            self.assertTrue(plan.has_task("Check VxVM snapshots are "
+                                          "present"))
             if lvm_tasks == True:
 
-                self.assertTrue('Checkpeernode(s)'
-                                in combined_plan_output)
+                self.assertTrue(plan.has_task('Check peer node(s)'))
 
-                self.assertTrue('withallLVMsnapshotspresent'
-                                in combined_plan_output)
+                self.assertTrue(plan.has_task('with all LVM snapshots '
+                                              'present'))
 
-                self.assertTrue('Restartnode(s)'
-                                in combined_plan_output)
+                self.assertTrue(plan.has_task('Restart node(s)'))
 
                 for node in self.mn_nodes:
                     wait_for_node_text = \
-                    'Waitfornode"{0}"torestart'.format(node)
-                    self.assertTrue(wait_for_node_text
-                                    in combined_plan_output)
+                    'Wait for node "{0}" to restart'.format(node)
+                    self.assertTrue(plan.has_task(wait_for_node_text))
 
-        self.assertTrue("RestoreVxVMdeploymentsnapshot"
-                        in combined_plan_output)
+        self.assertTrue(plan.has_task("Restore VxVM deployment snapshot"))
 
     @staticmethod
     def combine_plan_output(stdout):
@@ -266,37 +286,6 @@ class Story10831(GenericTest):
                                             '').replace('\n',
                                                         '')
 
-    @staticmethod
-    def get_snapshot_name_from_url(url, vol_driver='lvm', name=''):
-        """
-        Description:
-            Function to compile the snapshot name of the file-system at
-            the provided url.
-
-        Args:
-            url (str): url to a file system object.
-            vol_driver (str): The volume driver under test, lvm or vxvm.
-            name (str): user specified name to include in snapshots.
-
-        Returns:
-            The snapshot name.
-        """
-        str_list = url.split('/')
-        index = str_list.index('volume_groups')
-        fs_id = str_list[index + 3]
-        if vol_driver == 'lvm':
-            vg_id = str_list[index + 1]
-            if name != '':
-                return "L_{0}_{1}_{2}".format(vg_id, fs_id, name)
-
-            return "L_{0}_{1}_".format(vg_id, fs_id)
-
-        else:
-            if name != '':
-                return "L_{0}_{1}".format(fs_id, name)
-
-            return "L_{0}_".format(fs_id)
-
     def compile_list_of_file_sys(self, file_sys_dict, fs_type='ext4',
                                       search_type='false'):
         """
@@ -355,7 +344,7 @@ class Story10831(GenericTest):
         # set snap_external to true to avoid creation of task
         # 'Check peer nodes "node2" and "node1" are reachable'
         for fsystem in fss:
-            self.backup_path_props(self.ms_node, fsystem['path'])
+            self.journal.track(fsystem['path'])
             self.execute_cli_update_cmd(self.ms_node, fsystem['path'],
                     props='snap_external=true')
 
@@ -386,8 +375,8 @@ class Story10831(GenericTest):
 
         ilo_ipadd = None
         fss_vxvm = self.get_all_volumes(self.ms_node)
-        node = self.get_vx_disk_node(self.ms_node,
-        disk_group=fss_vxvm[0]['volume_group_name'])
+        node = self.get_active_node_for_vol_grp(
+            fss_vxvm[0]['volume_group_name'])
         cmd = self.sto.get_vxsnap_cmd(fss_vxvm[0]['volume_group_name'],
                 grep_args="L_")
         try:
@@ -526,10 +515,7 @@ class Story10831(GenericTest):
             self.execute_and_wait_createsnapshot(self.ms_node)
 
             self.log('info', 'Shutdown all nodes')
-            for node in self.mn_nodes:
-                ilo_ipadd = self.get_node_ilo_ip(self.ms_node, node)
-                self.poweroff_peer_node(self.ms_node, node,
-                                        ilo_ip=ilo_ipadd)
+            self.power.power_off(self.mn_nodes)
 
             self.log("info", "Run remove_snapshot")
             self.execute_cli_removesnapshot_cmd(self.ms_node)
@@ -541,10 +527,7 @@ class Story10831(GenericTest):
 
         finally:
             # RESTART THE NODES
-            for node in self.mn_nodes:
-                ilo_ipadd = self.get_node_ilo_ip(self.ms_node, node)
-                self.poweron_peer_node(self.ms_node, node,
-                                       ilo_ip=ilo_ipadd)
+            self.power.power_on(self.mn_nodes)
 
             vx_disk_node = None
             counter = 0
@@ -554,7 +537,7 @@ class Story10831(GenericTest):
                     vx_disk_node = self.get_vx_disk_node(self.ms_node)
                 except AssertionError:
                     pass
-                time.sleep(10)
+                self.fixtures.sleep(10)
                 counter += 1
 
         # deleting the property of vcs_seed_threshold
@@ -644,28 +627,32 @@ class Story10831(GenericTest):
         self.log("info", "Run restore snapshot -f")
         self.execute_and_wait_restore_snapshot(self.ms_node, args="-f")
 
-    def verify_vxsnap_present(self, file_sys_url, chk_for_absence=False):
+    def verify_vxsnaps_present(self, file_sys_urls, chk_for_absence=False):
         """
         Description:
             Function to verify that the expected vxvm snapshots
-            are present on the nodes.
+            are present on the nodes. The vxprint output of the active
+            node of each volume group is read once.
         Args:
-            file_sys_url (str): The url to the vxvm fs
+            file_sys_urls (list): The urls to the vxvm fs
             chk_for_absence (bool): Flag to state whether to check
                                     snap exists or not.
         """
-        snapshot_name = \
-        self.get_snapshot_name_from_url(file_sys_url, 'vxvm')
-        vol_grp_url = self.get_vol_grp_from_vxfs_fs_url(file_sys_url)
-        vol_grp_id = self.get_vol_grp_id_from_url(vol_grp_url)
-        active_node = self.get_active_node_for_vol_grp(vol_grp_id)
-        vxprint_output = self.get_vxprint_console_output(active_node)
-        combined_vxp_output = \
-        self.combine_plan_output(vxprint_output)
-        if not chk_for_absence:
-            self.assertTrue(snapshot_name in combined_vxp_output)
-        else:
-            self.assertFalse(snapshot_name in combined_vxp_output)
+        names = SnapshotNames()
+        for file_sys_url in file_sys_urls:
+            vol_grp_url = self.get_vol_grp_from_vxfs_fs_url(file_sys_url)
+            names.add(self.get_vol_grp_id_from_url(vol_grp_url),
+                      file_sys_url, SnapshotNames.VXVM)
+
+        observed = {}
+        for vol_grp_id in names.vxvm:
+            active_node = self.get_active_node_for_vol_grp(vol_grp_id)
+            vxprint = VxprintOutput(
+                self.get_vxprint_console_output(active_node), active_node)
+            observed[vol_grp_id] = set(record.name
+                                       for record in vxprint.records)
+        names.verify(self, observed, SnapshotNames.VXVM,
+                     present=not chk_for_absence)
 
     @attr('manual-test', 'non-revert', 'story10831',
           'story10831_tc12', 'kgb-physical')
@@ -720,8 +707,7 @@ class Story10831(GenericTest):
             nodes = file_sys_dict.keys()
             node = nodes[0]
             file_sys_urls = file_sys_dict[node]['false']['vxfs']
-            for file_sys_url in file_sys_urls:
-                self.verify_vxsnap_present(file_sys_url)
+            self.verify_vxsnaps_present(file_sys_urls)
 
             self.log("info", "Starting action 5")
             active_node = self.get_active_node_for_vol_grp(vg_id)
@@ -744,10 +730,10 @@ class Story10831(GenericTest):
                             test_constants.PLAN_FAILED))
             stdout, _, _ = \
             self.execute_cli_showplan_cmd(self.ms_node)
-            failed_task = \
-            "Failed/snapshots/snapshotCheckVxVMsnapshotsarevalid"
-            combined_plan_output = self.combine_plan_output(stdout)
-            self.assertTrue(failed_task in combined_plan_output)
+            plan = PlanModel(stdout)
+            self.assertTrue(plan.has_task("Check VxVM snapshots are valid",
+                                          path="/snapshots/snapshot",
+                                          status="Failed"))
 
             self.log("info", "Starting action 7")
             self.chk_restore_plan_tasks(stdout, args="-f",
@@ -781,7 +767,7 @@ class Story10831(GenericTest):
             snap_invalidated = True
             return counter, snap_invalidated
         else:
-            time.sleep(5)
+            self.fixtures.sleep(5)
             counter += 1
         return counter, snap_invalidated
 
@@ -848,8 +834,7 @@ class Story10831(GenericTest):
             nodes = file_sys_dict.keys()
             node = nodes[0]
             file_sys_urls = file_sys_dict[node]['false']['vxfs']
-            for file_sys_url in file_sys_urls:
-                self.verify_vxsnap_present(file_sys_url)
+            self.verify_vxsnaps_present(file_sys_urls)
 
             self.log("info", "Starting action 6")
             active_node = self.get_active_node_for_vol_grp(vg_id)
@@ -902,7 +887,7 @@ class Story10831(GenericTest):
                     self.get_active_node_for_vol_grp(vol_grp_id,
                                                      assert_not_found=False)
                     counter += 1
-                    time.sleep(10)
+                    self.fixtures.sleep(10)
 
     def manually_create_snap(self, vg_id, fs_url):
         """
@@ -1055,10 +1040,10 @@ class Story10831(GenericTest):
         fss = self.get_all_volumes(self.ms_node)
         self.assertTrue(len(fss) > 0)
 
-        active_node = self.get_vx_disk_node(self.ms_node,
-                disk_group=fss[0]['volume_group_name'])
+        active_node = self.get_active_node_for_vol_grp(
+            fss[0]['volume_group_name'])
         url = fss[0]['path']
-        snapshot_name = self.get_snapshot_name_from_url(url, 'vxvm')
+        snapshot_name = SnapshotNames.get_name_from_url(url, 'vxvm')
         vol_grp_id = fss[0]['volume_group_name']
         cmd = \
         "/opt/VRTS/bin/vxedit -g {0} -rf rm {1}".format(vol_grp_id,
@@ -1151,17 +1136,6 @@ class Story10831(GenericTest):
         split_url = url.split('/')
         return split_url[-1]
 
-    @staticmethod
-    def get_vxdg_list(args=""):
-        """
-        Function to pass options to vxdg list command.
-        Args:
-            args (str): The optional argument to be passed.
-        Returns:
-            str. The command with or without the optional argument.
-        """
-        return "/sbin/vxdg {0} list".format(args)
-
     def get_active_node_for_vol_grp(self, vol_grp, assert_not_found=True):
         """
         Function to get the active node from the output of vxdg command.
@@ -1172,24 +1146,12 @@ class Story10831(GenericTest):
         Returns:
             str. The name of the active node.
         """
-        active_node_found = False
-        for node in self.mn_nodes:
-            # CHECK THAT NODE IS ONLINE BEFORE CONTINUING
-            node_ip = self.get_node_att(node, 'ipv4')
-            node_up = \
-            self.wait_for_ping(node_ip, timeout_mins=1)
-            if node_up:
-                stdout, _, _ = \
-                self.run_command(node,
-                                 self.get_vxdg_list(), su_root=True)
-                updated_stdout = []
-                for item in stdout:
-                    split_list_item = item.split(" ")
-                    updated_stdout.extend(split_list_item)
-                if vol_grp in updated_stdout:
-                    return node
+        node = self.topology.get_owner(vol_grp, verify=True)
         if assert_not_found:
-            self.assertTrue(active_node_found)
+            self.assertNotEqual(None, node,
+                                "Disk group {0} is not imported on any "
+                                "node".format(vol_grp))
+        return node
 
     def create_new_file_system(self, file_sys_dict):
         """
@@ -1224,26 +1186,22 @@ class Story10831(GenericTest):
         uuid_dict = self.get_free_disk_uuids(vg_ids)
         sys_urls = []
         for node in self.mn_nodes:
-            node_url = \
-            self.get_node_url_from_filename(self.ms_node,
-                                            node)
+            node_url = self.identity.get_url(node)
             sys_urls.append(
                 self.deref_inherited_path(self.ms_node,
                                           node_url + "/system"))
-        nodes = uuid_dict.keys()[0]
+        # USE A DISK OF THE FIRST NODE ON WHICH A UUID HAS BEEN FOUND
+        disk_node = None
         disk = None
-        uuid = None
-        size = None
-        if uuid_dict[nodes[0]] != {}:
-            disk = uuid_dict[nodes[0]][0]
-            uuid = uuid_dict[disk]
-            self.log("info", "Using disk {0}".format(disk))
-            size = self.get_disk_size(self.mn_nodes[0], disk)
-        else:
-            disk = uuid_dict[nodes[1]][0]
-            uuid = uuid_dict[disk]
-            self.log("info", "Using disk {0}".format(disk))
-            size = self.get_disk_size(self.mn_nodes[1], disk)
+        for node in self.mn_nodes:
+            if uuid_dict[node]:
+                disk_node = node
+                disk = sorted(uuid_dict[node])[0]
+                break
+        self.assertNotEqual(None, disk, "No free shared disk found")
+        uuid = uuid_dict[disk_node][disk]
+        self.log("info", "Using disk {0} of {1}".format(disk, disk_node))
+        size = self.get_disk_size(disk_node, disk)
         disk_name = "hd10831"
         props = \
         "name={0} bootable=false uuid={1} size={2}".format(disk_name,
@@ -1361,8 +1319,7 @@ class Story10831(GenericTest):
         """
         node_ids = []
         for node in nodes:
-            node_url = \
-            self.get_node_url_from_filename(self.ms_node, node)
+            node_url = self.identity.get_url(node)
             node_ids.append(self.get_id_from_end_of_url(node_url))
         return node_ids
 
@@ -1432,221 +1389,44 @@ class Story10831(GenericTest):
             volg_grp_ids (list): A list of names of all of the volume group
                                  id's as they appear in the LITP model.
         Returns:
-            dict. A dictionary with Key of the disk name and value of the uuid.
+            dict. For every node, the uuid keyed by local disk name of the
+                  disks whose by-id entry was found on that node.
         """
         cmd = self.get_vxdisk_list("-e -o alldgs")
-        nodes_disks = {}
-        for node in self.mn_nodes:
-            stdout, _, _ = \
-            self.run_command(node, cmd, su_root=True)
-            nodes_disks[node] = stdout
+        results = self.fanout.run(self.mn_nodes, cmd, su_root=True)
+        nodes_disks = dict((node, results[node].stdout)
+                           for node in self.mn_nodes)
         self.log("info", "Compiling list of disks")
-        disks_list = self.compile_all_nodes_disks(nodes_disks, volg_grp_ids)
-        # ASSERT THAT NO UNASSIGNED SHARED DISKS EXISTS.
-        self.assertNotEqual([], disks_list)
-        shared_disks = set(disks_list[0] & disks_list[1])
+        shared_disks = \
+            SharedDiskResolver(volg_grp_ids).resolve(nodes_disks)
 
         # ASSERT THAT AT LEAST ONE SHARED DISK HAS BEEN FOUND
-        self.assertNotEqual(0, len(shared_disks))
-        self.log("info",
-                 "Retrieve the local disk names for the shared disks")
-        # ["sdg"]
-        # {"emc_clariion0_127": "sdg"}
-        disk_names_node1 = \
-        self.get_local_disks_from_vxvm_for_shared_disks(
-                                            nodes_disks[self.mn_nodes[0]],
-                                            shared_disks)
-        # ["sdn"]
-        # {"emc_clariion0_127": "sdn"}
-        disk_names_node2 = \
-        self.get_local_disks_from_vxvm_for_shared_disks(
-                                            nodes_disks[self.mn_nodes[1]],
-                                            shared_disks)
-
-        self.log("info",
-        "Local disk names - node 1: {0}".format(
-                        ", ".join([disk_names_node1[disk] for disk
-                                  in disk_names_node1])))
-
-        self.log("info",
-        "Local disk names - node 2: {0}".format(
-                        ", ".join([disk_names_node2[disk] for disk
-                                  in disk_names_node2])))
-
-        cmd = "/bin/ls -la /dev/disk/by-id"
-        stdout, _, _ = self.run_command(self.mn_nodes[0], cmd, su_root=True)
-
-        # IF A BY-ID ENTRY IS NOT FOUND FOR A SHARED DISK ON THIS
-        # NODE THEN THE OTHER NODE NEEDS TO BE CHECKED
-        relevant_entries, relevant_dict, unfound_disks = \
-        self.retrieve_relevant_disk_by_id_entries(disk_names_node1,
-                                                  stdout)
-
-        # IF ANY DISKS WERE NOT FOUND IN BY-ID THEN CHECK THIS
-        # OTHER NODE.
-        unfound_disk_names = {}
-        if unfound_disks != []:
-            for disk_name in unfound_disks:
-                if disk_name in disk_names_node2.keys():
-                    unfound_disk_names[disk_name] = \
-                    disk_names_node2[disk_name]
-                    continue
-                else:
-                    self.log("info",
-                             "No entry has been found on" \
-                             " either node for {0}".format(disk_name))
-                    self.assertTrue(False)
+        self.assertNotEqual({}, shared_disks)
+        for node in self.mn_nodes:
             self.log("info",
-                     "Checking other node for " \
-                     "unfound disks {0}".format(", ".join(
-                                     unfound_disk_names[disk_name]
-                                     for disk_name in unfound_disk_names)))
-            stdout, _, _ = \
-            self.run_command(self.mn_nodes[1], cmd, su_root=True)
-            relevant_entries_unfound, relevant_dict_unfound, unfound_disks = \
-            self.retrieve_relevant_disk_by_id_entries(unfound_disk_names,
-                                                      stdout)
-
-            self.assertNotEqual([], relevant_entries_unfound)
-            self.assertNotEqual({}, relevant_dict_unfound)
-        self.assertEqual([], unfound_disks)
+                     "Local disk names - {0}: {1}".format(node, ", ".join(
+                         str(disk.devices[node])
+                         for disk in shared_disks.values())))
+
+        # LIST BY-ID ON ALL NODES AT ONCE; IF A BY-ID ENTRY IS NOT FOUND
+        # FOR A SHARED DISK ON THE FIRST NODE THEN THE NEXT NODE IS USED
+        by_id = ByIdIndex.collect(self.fanout, self.mn_nodes)
+        uuid_dict = dict((node, {}) for node in self.mn_nodes)
         scsi_entries = []
-        scsi_dict = {}
-        for entry in relevant_entries:
-            split_list = entry.split(" ")
-            tidied_list = [x for x in split_list if x != ""]
-            scsi_entries.append(tidied_list[8])
-            scsi_dict[relevant_dict[entry]] = tidied_list[8]
+        for disk_name, disk in sorted(shared_disks.items()):
+            found = disk.find_by_id(by_id, self.mn_nodes)
+            self.assertNotEqual(None, found,
+                                "No entry has been found on any node "
+                                "for {0}".format(disk_name))
+            node, linux_name, uuid = found
+            scsi_entries.append(by_id[node].get_link(linux_name))
+            uuid_dict[node][linux_name] = uuid
         self.assertNotEqual([], scsi_entries)
         self.log("info",
                  "Relevant entries: \n {0}".format(
                   "\n ".join([scsi_disk for scsi_disk
                               in scsi_entries])))
-        self.assertNotEqual({}, scsi_dict)
-
-        if relevant_entries_unfound != []:
-            scsi_entries_for_unfound = []
-            scsi_dict_for_unfound = {}
-            for entry in relevant_entries_unfound:
-                split_list = entry.split(" ")
-                tidied_list = [x for x in split_list if x != ""]
-                scsi_entries_for_unfound.append(tidied_list[8])
-                scsi_dict_for_unfound[relevant_dict_unfound[entry]] = \
-                tidied_list[8]
-            self.assertNotEqual([], scsi_entries_for_unfound)
-            self.log("info",
-                     "Relevant entries on other node: \n {0}".format(
-                      "\n ".join([scsi_disk for scsi_disk
-                                  in scsi_entries_for_unfound])))
-            self.assertNotEqual({}, scsi_dict_for_unfound)
-        uuid_dict = {self.mn_nodes[0]: {}, self.mn_nodes[1]: {}}
-        for disk in scsi_dict.keys():
-            uuid_dict[self.mn_nodes[0]][disk] = \
-            self.strip_uuid_from_scsi_entry(scsi_dict[disk])
-
-        for disk in scsi_dict_for_unfound.keys():
-            uuid_dict[self.mn_nodes[1]][disk] = \
-            self.strip_uuid_from_scsi_entry(scsi_dict_for_unfound[disk])
-
-        self.assertNotEqual({self.mn_nodes[0]: {}, self.mn_nodes[1]: {}},
+
+        self.assertNotEqual(dict((node, {}) for node in self.mn_nodes),
                             uuid_dict)
         return uuid_dict
-
-    @staticmethod
-    def retrieve_relevant_disk_by_id_entries(disk_names_dict,
-                                             by_id_stdout):
-        """
-        Description:
-            Strips the relevant entries from the by-id entry
-        Args:
-            disk_names_dict (dict): key emc name, value linux name.
-            by_id_stdout (list): the output of an ls la of by-id
-        Returns:
-            list. dict. list.
-        """
-        relevant_entries = []
-        relevant_dict = {}
-        unfound_disks = []
-        for disk in disk_names_dict.keys():
-            disk_found = False
-            linux_name = disk_names_dict[disk]
-            for line in by_id_stdout:
-                if re.search(linux_name + "$",
-                             line) and not re.search("wwn",
-                                                     line):
-                    relevant_entries.append(line)
-                    relevant_dict[line] = linux_name
-                    disk_found = True
-                    break
-            if disk_found == False:
-                unfound_disks.append(disk)
-        return relevant_entries, relevant_dict, unfound_disks
-
-    @staticmethod
-    def compile_all_nodes_disks(nodes_disks, vg_ids):
-        """
-        Description:
-            Function to get all the disks on the nodes which have not
-            been designated for use with LVM, or assigned to a vxvm volume
-            group.
-        Args:
-            nodes_disks (list): List of all the shared disks.
-            vg_ids (list): The ids of all the volume groups of type vxvm as
-                           they appear in the LITP model.
-        Returns:
-            list. A list of disk names as they appear in the vxdisk console.
-        """
-        disks_list = []
-        for node in nodes_disks.keys():
-            disks = []
-            node_disks = nodes_disks[node]
-            for disk_entry in node_disks:
-                if "DEVICE" in disk_entry or "LVM" in disk_entry:
-                    continue
-                if "sliced" in disk_entry:
-                    continue
-                # CHECK TO ENSURE THAT THE DISK ISN'T ALREADY ASSIGNED TO A
-                # VOLUME GROUP.
-                disk_assigned = [str for vg in vg_ids if vg in disk_entry]
-                if disk_assigned != []:
-                    continue
-                disk = disk_entry.split(":")[0].split(' ')[0]
-                if disk not in disks:
-                    disks.append(disk)
-            disks_list.append(set(disks))
-        return disks_list
-
-    @staticmethod
-    def strip_uuid_from_scsi_entry(scsi_entry):
-        """
-        Description:
-            Function to strip the uuid value used in LITP from the Linux
-            disk representation.
-        Args:
-            scsi_entry (str): The Linux representation of the disk.
-        Returns
-            str. The uuid used by LITP during the disk object creation.
-        """
-        return scsi_entry.split("-")[1][1:]
-
-    @staticmethod
-    def get_local_disks_from_vxvm_for_shared_disks(vxdisk_console,
-                                                   shared_disks):
-        """
-        Description:
-            Function to strip the Linux disk names from the vxvm console.
-        Args:
-            vxdisk_console (list): The output of the vxdisk list console.
-            shared_disks (list): The name of the shared disks as they appear
-                                 in the vxdisk console output.
-        Returns:
-        dict. key emc name : val - The Linux names of the shared disks.
-        """
-        entries = [entry for entry in vxdisk_console
-                   for disk in shared_disks if disk in entry]
-        disk_names = {}
-        for entry in entries:
-            split_list = entry.split(" ")
-            tidied_list = [x for x in split_list if x != ""]
-            disk_names[tidied_list[0]] = tidied_list[6]
-        return disk_names
@@ -14,14 +14,17 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 import test_constants
 from storage_utils import StorageUtils
 from redhat_cmd_utils import RHCmdUtils
+from lv_inventory import LvInventory
+from snapshot_names import SnapshotNames
 import time
 import os
 
 
-class Story111665(GenericTest):
+class Story111665(InstrumentedTestMixin, GenericTest):
     """
     As a LITP user, I want to model the LVM file systems in the root volume
     group which are defined in the MS kickstart so that I can resize them
@@ -143,43 +146,6 @@ class Story111665(GenericTest):
         """
         return url.split('/')[-1]
 
-    def get_snapshot_name_from_url(self, url, vol_driver='lvm', name=''):
-        """
-        Description:
-            Function to compile the snapshot name of the file-system at
-            the provided url.
-
-        Args:
-            url (str): url to a file system object.
-            vol_driver (str): The volume driver under test, lvm or vxvm.
-            name (str): user specified name to include in snapshots.
-
-        Returns:
-            The snapshot name.
-        """
-        str_list = url.split('/')
-        index = str_list.index('volume_groups')
-        fs_id = str_list[index + 3]
-        fs_lv = self.get_volume_name(url)
-
-        if vol_driver == 'lvm':
-            vg_id = str_list[index + 1]
-            if name != '':
-                if vg_id == 'vg_root':
-                    return "L_{0}_{1}".format(fs_lv, name)
-                else:
-                    return "L_{0}_{1}_{2}".format(vg_id, fs_id, name)
-            else:
-                if vg_id == 'vg_root':
-                    return "L_{0}_".format(fs_lv)
-                else:
-                    return "L_{0}_{1}_".format(vg_id, fs_id)
-        else:
-            if name != '':
-                return "L_{0}_{1}".format(fs_id, name)
-
-            return "L_{0}_".format(fs_id)
-
     def get_volume_name(self, fs_url):
         """
         Description:
@@ -190,25 +156,9 @@ class Story111665(GenericTest):
         Returns:
             str.
         """
-        vol_name = ''
-        ks_mps = ['/', 'swap', '/home', '/var', '/var/log', '/var/www',
-                  '/software']
-        vg_url = \
-            self.find_parent_path_from_item_type(self.ms_node, 'volume-group',
-                                                fs_url)
+        vg_id, fs_id = SnapshotNames.parse_fs_url(fs_url)
         fs_mp = self.get_props_from_url(self.ms_node, fs_url, 'mount_point')
-        vg_id = self.get_id_from_end_of_url(vg_url)
-
-        if vg_id == 'vg_root' and fs_mp in ks_mps:
-            if fs_mp == '/':
-                vol_name = "lv_root"
-            else:
-                vol_name = "lv{0}".format("_".join(fs_mp.split('/')))
-        else:
-            fs_id = self.get_id_from_end_of_url(fs_url)
-            vol_name = "{0}_{1}".format(vg_id, fs_id)
-
-        return vol_name
+        return SnapshotNames.get_lv_name(vg_id, fs_id, fs_mp)
 
     def get_root_volume_group_url(self, url):
         '''
@@ -307,15 +257,16 @@ class Story111665(GenericTest):
             negative_chk(bool): flag on whether to check for
                                 snaps existance.
         """
-        lvs_cmd = self.storage.get_lvs_cmd()
+        names = SnapshotNames()
         for fs_url in node_fs_urls:
-            snap_name = self.get_snapshot_name_from_url(fs_url)
-            stdout, _, _ = \
-            self.run_command(self.ms_node, lvs_cmd, su_root=True)
-            if not negative_chk:
-                self.assertTrue(self.is_text_in_list(snap_name, stdout))
-            else:
-                self.assertFalse(self.is_text_in_list(snap_name, stdout))
+            mount_point = self.get_props_from_url(self.ms_node, fs_url,
+                                                  'mount_point')
+            names.add(self.ms_node, fs_url, mount_point=mount_point)
+
+        inventory = LvInventory(self)
+        inventory.collect([self.ms_node])
+        names.verify(self, SnapshotNames.get_observed_lvm(inventory),
+                     present=not negative_chk)
 
     def _verify_snap_sizes(self, ks_fss, snap_name):
         """
@@ -325,8 +276,9 @@ class Story111665(GenericTest):
         fsystem = self.get_lv_info_on_node(self.ms_node)
 
         for modelled_fs in ks_fss.values():
-            snapshot_name = self.get_snapshot_name_from_url(modelled_fs['url'],
-                    name=snap_name)
+            snapshot_name = SnapshotNames.get_name_from_url(
+                modelled_fs['url'], tag=snap_name,
+                mount_point=modelled_fs['mount_point'])
             snap_details = fsystem[snapshot_name]
             actual_size = float(snap_details['COW_TABLE_SIZE_MB'])
 
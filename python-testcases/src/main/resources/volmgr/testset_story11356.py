@@ -15,21 +15,28 @@ program(s) have been supplied.
             Agile: STORY-11356
 """
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from model_batch import ModelUpdateBatch
+from model_journal import ModelJournal
 import test_constants
 
 
-class Story11356(GenericTest):
+class Story11356(InstrumentedTestMixin, GenericTest):
     """
     As a LITP user I want to extend my disk and the VxVM volumes that are on it
     so that I can increase capacity.
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         # 1. Call super class setup
         super(Story11356, self).setUp()
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.journal = ModelJournal(self, self.ms_node)
+        self.journal.start()
         self.mn_nodes = self.get_managed_node_filenames()
         self.all_nodes = [self.ms_node] + self.mn_nodes
 
@@ -84,11 +91,14 @@ class Story11356(GenericTest):
 
         unit = current_size[-1]
         number = int(current_size[:-1])
+        new_size = '{0}{1}'.format(number + 1, unit)
 
+        batch = ModelUpdateBatch(self, self.ms_node, journal=self.journal)
         for disk in disks_to_update:
-            self.backup_path_props(self.ms_node, disk)
-            self.execute_cli_update_cmd(self.ms_node, disk,
-                    props='size={0}{1}'.format(number + 1, unit))
+            self.journal.track(disk)
+            batch.queue(disk, {'size': new_size},
+                        current={'size': current_size})
+        batch.apply()
 
         self.log('info', "2. Replace vxdisk on all nodes with dummy vxdisk")
 
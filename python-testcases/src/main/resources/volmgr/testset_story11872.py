@@ -19,23 +19,29 @@ program(s) have been supplied.
 import os
 import re
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from node_identity import NodeIdentityIndex
+from plan_model import PlanModel
 from redhat_cmd_utils import RHCmdUtils
 import test_constants
 
 
-class Story11872(GenericTest):
+class Story11872(InstrumentedTestMixin, GenericTest):
     """
         As a LITP user I want to be able to control the order in which
         clusters are rebooted during a snapshot restore plan so
         I can ensure my deployment successfully starts up
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         # 1. Call super class setup
         super(Story11872, self).setUp()
         # 2. Set up variables used in the test
         self.ms1 = self.get_management_node_filename()
+        self.identity = NodeIdentityIndex(self, self.ms1)
         self.rhcmd = RHCmdUtils()
         self.dummy_package = 'ERIClitpstory11872_CXP1234567'
         self.dummy_rpm = ('{0}-1.0.1-SNAPSHOT20160115113155.noarch.rpm'.
@@ -151,19 +157,17 @@ class Story11872(GenericTest):
             desc (str) : String to look for on task description
             log (bool) : Specify wheter to dump log or not
         """
-        plan_dict = self.cli.parse_plan_output(plan_output)
+        plan = PlanModel(plan_output)
         task_urls = []
-        for phase_index, phase in sorted(plan_dict.iteritems()):
-            for task_index, task in sorted(phase.iteritems()):
-                if len([x for x in task['DESC'] if desc in x]) > 0:
-                    if log:
-                        self.log('info', 'Phase {0} - Task {1}'.
-                                 format(phase_index, task_index))
-                        for description in task['DESC']:
-                            self.log('info', description)
-
-                    if '/ms' not in task['DESC'][0]:
-                        task_urls.append(task['DESC'][0])
+        for task in plan.find_tasks(desc):
+            if log:
+                self.log('info', 'Phase {0} - Task {1}'.
+                         format(task.phase, task.index))
+                self.log('info', task.path)
+                self.log('info', task.description)
+
+            if '/ms' not in task.path:
+                task_urls.append(task.path)
         return task_urls
 
     def _run_deployment_expansion_plan(self, nodes_to_expand):
@@ -250,6 +254,7 @@ class Story11872(GenericTest):
             self.log('info',
             'Run plan and wait for it to complete the expansion')
             self._run_deployment_expansion_plan(nodes_to_expand)
+            self.identity.invalidate()
 
     def _delete_dependency_list(self, clusters):
         """
@@ -541,8 +546,7 @@ class Story11872(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
-        start_log = self.get_file_len(self.ms1,
-                                      test_constants.GEN_SYSTEM_LOG_PATH)
+        self.log_watcher.mark()
 
         self.log('info', 'Configure a 3 clusters environment')
         c1_url, c2_url, c3_url, c4_url = self._expand_cluster(
@@ -563,13 +567,13 @@ class Story11872(GenericTest):
         self.execute_and_wait_createsnapshot(self.ms1, add_to_cleanup=False)
 
         self.assertTrue(self.wait_for_log_msg(self.ms1,
-                        "WARNING: Order of clusters is invalid.",
-                        log_len=start_log), "Log not found")
+                        "WARNING: Order of clusters is invalid."),
+                        "Log not found")
 
         self.log('info', 'Restore snapshot,'
                          ' capture plan tasks and stop plan immediately')
         self._restore_model_expect_sequence([c1_url, c2_url, c3_url, c4_url])
 
         self.assertTrue(self.wait_for_log_msg(self.ms1,
-                        "WARNING: Order of clusters is invalid.",
-                        log_len=start_log), "Log not found")
+                        "WARNING: Order of clusters is invalid."),
+                        "Log not found")
@@ -14,12 +14,17 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from node_identity import NodeIdentityIndex
 import test_constants
 from storage_utils import StorageUtils
 from redhat_cmd_utils import RHCmdUtils
+from lv_inventory import LvInventory
+from snapshot_names import SnapshotNames
+from size_utils import Size
 
 
-class Story12270(GenericTest):
+class Story12270(InstrumentedTestMixin, GenericTest):
     """
     As a LITP user I want to create an unmounted file system on an LV so
     that it can be mounted in a VM.
@@ -45,6 +50,7 @@ class Story12270(GenericTest):
 
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.identity = NodeIdentityIndex(self, self.ms_node)
         self.mn_nodes = self.get_managed_node_filenames()
         self.ms_url = self.find(self.ms_node, '/', 'ms', exact_match=True)
         self.node_urls = self.find(self.ms_node, "/deployments", "node")
@@ -113,9 +119,8 @@ class Story12270(GenericTest):
             negative_chk (bool): flag to whether to check for
                                  mount point creation.
         """
-        lvs_cmd = self.storage.get_lvs_cmd()
-        vol_details, _, _ =\
-        self.run_command(node, lvs_cmd, su_root=True)
+        inventory = LvInventory(self)
+        inventory.collect([node])
         if is_ms:
             vg_name = "vg_root"
             fs_name = fs_url.split('/')[-1]
@@ -130,22 +135,10 @@ class Story12270(GenericTest):
                                 "volume_group_name")
 
         # ENSURE THE VOLUME HAS BEEN CREATED
-        vol_found = False
-        vol_size_correct = False
-        for line in vol_details:
-            split_lines = line.split(" ")
-            tidied_list = [x for x in split_lines if x != '']
-            if volume_name in tidied_list:
-                vol_found = True
-                # CHECK THE SIZE OF THE VOLUME
-                node_vol_size = tidied_list[3]
-                formatted_size = \
-                size[:-1] + ".00" + size[-1:].lower()
-                if formatted_size == node_vol_size:
-                    vol_size_correct = True
-                break
-        self.assertTrue(vol_found)
-        self.assertTrue(vol_size_correct)
+        lvol = inventory.get(node, volume_name, vg_name)
+        self.assertTrue(lvol is not None)
+        # CHECK THE SIZE OF THE VOLUME
+        self.assertEqual(Size.parse(size), lvol.size)
 
         # ENSURE THE MOUNT POINT HAS BEEN CREATED AND
         # ENSURE THE FILE SYSTEM HAS BEEN CREATED
@@ -154,18 +147,7 @@ class Story12270(GenericTest):
             self.list_dir_contents(node, '/', su_root=True)
             found = \
             self.is_filesystem_mounted(node, mount_point)
-            fs_listing = \
-            "/dev/mapper/{0}-{1}".format(vg_name, volume_name)
-            df_cmd = self.rhcmd.get_df_cmd("-Th")
-            fs_details, _, _ =\
-            self.run_command(node, df_cmd, su_root=True)
-            fs_found = False
-            for line in fs_details:
-                split_lines = line.split(" ")
-                tidied_list = [x for x in split_lines if x != '']
-                if fs_listing in tidied_list:
-                    fs_found = True
-                    break
+            fs_found = lvol.mount_point is not None
             if not negative_chk:
                 self.assertTrue(self.is_text_in_list(mount_point[1:],
                                                      dir_list))
@@ -184,37 +166,6 @@ class Story12270(GenericTest):
         """
         return url.split('/')[-1]
 
-    @staticmethod
-    def get_snapshot_name_from_url(url, vol_driver='lvm', name=''):
-        """
-        Description:
-            Function to compile the snapshot name of the file-system at
-            the provided url.
-
-        Args:
-            url (str): url to a file system object.
-            vol_driver (str): The volume driver under test, lvm or vxvm.
-            name (str): user specified name to include in snapshots.
-
-        Returns:
-            The snapshot name.
-        """
-        str_list = url.split('/')
-        index = str_list.index('volume_groups')
-        fs_id = str_list[index + 3]
-        if vol_driver == 'lvm':
-            vg_id = str_list[index + 1]
-            if name != '':
-                return "L_{0}_{1}_{2}".format(vg_id, fs_id, name)
-
-            return "L_{0}_{1}_".format(vg_id, fs_id)
-
-        else:
-            if name != '':
-                return "L_{0}_{1}".format(fs_id, name)
-
-            return "L_{0}_".format(fs_id)
-
     def manually_remove_snap(self, fs_url, snap_name=""):
         """
         Description:
@@ -243,7 +194,7 @@ class Story12270(GenericTest):
             str.
         """
         snapshot_name = \
-        self.get_snapshot_name_from_url(fs_url, 'lvm', snap_name)
+        SnapshotNames.get_name_from_url(fs_url, 'lvm', snap_name)
         return "/dev/vg_root/{0}".format(snapshot_name)
 
     def get_node_file_from_fs_url(self, fs_url):
@@ -256,9 +207,7 @@ class Story12270(GenericTest):
         Returns:
             str.
         """
-        node_url = self.find_parent_path_from_item_type(self.ms_node, 'node',
-                                                        fs_url)
-        return self.get_node_filename_from_url(self.ms_node, node_url)
+        return self.identity.get_filename(fs_url)
 
     def verify_snaps_taken(self, node_fs_urls, negative_chk=False,
             is_ms=False):
@@ -272,19 +221,18 @@ class Story12270(GenericTest):
                                 snaps existance.
             is_ms(bool): verify on ms
         """
-        lvs_cmd = self.storage.get_lvs_cmd()
+        names = SnapshotNames()
         for fs_url in node_fs_urls:
             if is_ms:
                 node = self.ms_node
             else:
                 node = self.get_node_file_from_fs_url(fs_url)
-            snap_name = self.get_snapshot_name_from_url(fs_url)
-            stdout, _, _ = \
-            self.run_command(node, lvs_cmd, su_root=True)
-            if not negative_chk:
-                self.assertTrue(self.is_text_in_list(snap_name, stdout))
-            else:
-                self.assertFalse(self.is_text_in_list(snap_name, stdout))
+            names.add(node, fs_url)
+
+        inventory = LvInventory(self)
+        inventory.collect(sorted(names.lvm))
+        names.verify(self, SnapshotNames.get_observed_lvm(inventory),
+                     present=not negative_chk)
 
     def manually_remove_snap_ms(self, fs_url, snap_name=""):
         """
@@ -588,7 +536,7 @@ class Story12270(GenericTest):
         file_path = self.join_paths("/{0}".format(file_system_name_3_mount),
                                     "dummy.txt")
         for node_url in self.node_urls:
-            node = self.get_node_filename_from_url(self.ms_node, node_url)
+            node = self.identity.get_filename(node_url)
             create_success = self.create_file_on_node(node, file_path,
                                                       ["", ""],
                                                       su_root=True)
@@ -602,7 +550,7 @@ class Story12270(GenericTest):
         for node_url in self.node_urls:
             fs_url = "{0}/storage_profile/volume_groups/{1}" \
                      "/file_systems/{2}".format(node_url, vg_id, 'fs3')
-            node = self.get_node_filename_from_url(self.ms_node, node_url)
+            node = self.identity.get_filename(node_url)
             size = self.get_props_from_url(self.ms_node, fs_url,
                 filter_prop="size")
             self.verify_fs(node, fs_url, size,
@@ -621,7 +569,7 @@ class Story12270(GenericTest):
         for node_url in self.node_urls:
             fs_url = "{0}/storage_profile/volume_groups/{1}" \
                      "/file_systems/{2}".format(node_url, vg_id, 'fs3')
-            node = self.get_node_filename_from_url(self.ms_node, node_url)
+            node = self.identity.get_filename(node_url)
             size = self.get_props_from_url(self.ms_node, fs_url,
                 filter_prop="size")
             self.verify_fs(node, fs_url, size, file_system_name_3_mount)
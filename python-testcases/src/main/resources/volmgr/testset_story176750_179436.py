@@ -25,12 +25,20 @@ program(s) have been supplied.
             merged together as they go hand-in-hand.
 """
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 import test_constants as const
 from storage_utils import StorageUtils
 from vcs_utils import VCSUtils
+from node_fanout import NodeFanout
+from vx_topology import VxTopology
+from plan_model import PlanModel
+from snapshot_names import SnapshotNames
+from snapshot_reconciler import SnapshotReconciler
+from vcs_state import VcsState
+from power_orchestrator import PowerOrchestrator
 
 
-class Story176750(GenericTest):
+class Story176750(InstrumentedTestMixin, GenericTest):
     """
         As a LITP User I want to create named snapshots using the Volmgr
         Plugin when no more than 1 node has failed per cluster
@@ -48,8 +56,14 @@ class Story176750(GenericTest):
 
         self.storage = StorageUtils()
         self.vcs = VCSUtils()
+        self.fanout = NodeFanout(self)
         self.ms_node = self.get_management_node_filename()
         self.mn_nodes = self.get_managed_node_filenames()
+        self.topology = VxTopology(self, self.mn_nodes, self.fanout,
+                                   ping=False)
+        self.reconciler = SnapshotReconciler(self, self.ms_node,
+                                             self.mn_nodes, self.fanout)
+        self.power = PowerOrchestrator(self, self.ms_node)
         self.node_urls = self.find(self.ms_node, "/deployments", "node")
         self.snap_name = "ombs"
         self.offline_node = self.mn_nodes[0]
@@ -66,39 +80,36 @@ class Story176750(GenericTest):
     def _extract_plan_data(self):
         """
         Description:
-            Extract task URL paths and task descriptions from the plan.
+            Parse the current plan into a PlanModel.
         Returns:
-            task_paths (list), task_descs (list): List of
-                URL paths, and list of messages, in the plan.
+            PlanModel. The tasks of the plan indexed by node, path and
+                description.
         """
-        plan_tasks = self.get_full_list_of_tasks(self.ms_node)
-        task_paths = []
-        task_descs = []
-        for tasks in plan_tasks:
-            # Save each tasks path
-            task_paths.append(tasks['PATH'])
-            # Save each task description
-            task_descs.append(tasks['MESSAGE'])
-
-        return task_paths, task_descs
-
-    def _check_node_in_plan(self, node, plan_tasks, expect_present=True):
+        plan_output, _, _ = self.execute_cli_showplan_cmd(self.ms_node)
+        return PlanModel(plan_output)
+
+    def _check_node_in_plan(self, node, plan, expect_present=True):
         """
         Description:
             Checks if a node is present in a plan. Can
             also assert that it is not present.
         Args:
-            node (str): The node to check it's presence/absence.
-            plan_tasks (list): List of URL paths in a plan.
+            node (str): The node url, or the node name as it appears in
+                task descriptions, to check it's presence/absence.
+            plan (PlanModel): The parsed plan.
         Kwargs:
             expect_present (bool): Whether the node is
                 expected to be in the plan. Default is True.
         """
+        if node.startswith('/'):
+            node_tasks = plan.tasks_below(node)
+        else:
+            node_tasks = plan.mentions(node)
         if expect_present:
-            self.assertTrue(any(node in x for x in plan_tasks),
-                            "{0} not found in plan".format(node))
+            self.assertNotEqual([], node_tasks,
+                                "{0} not found in plan".format(node))
         else:
-            self.assertFalse(any(node in x for x in plan_tasks),
+            self.assertEqual([], node_tasks,
                              "{0} unexpectedly found in plan".format(node))
 
     def _force_remove_snapshot(self):
@@ -119,22 +130,14 @@ class Story176750(GenericTest):
         """
         Description:
             Asserts that all nodes in the given list are pingable.
-            If any node is not pingable, powering on the node is attempted.
+            Nodes that are not pingable are powered on together.
         Args:
             node_list (list): List of nodes to check.
         Kwargs:
             env (str): 'P' if the environment is physical (default) or
                 'C' if it is a cloud environment.
         """
-        if env == 'P':
-            for node in node_list:
-                node_ip = self.get_node_ilo_ip(self.ms_node, node)
-                if not self.is_ip_pingable(self.ms_node, node):
-                    self.poweron_peer_node(self.ms_node, node, ilo_ip=node_ip)
-        else:
-            for node in node_list:
-                if not self.is_ip_pingable(self.ms_node, node):
-                    self.poweron_peer_node(self.ms_node, node)
+        self.power.ensure_up(node_list, ilo=(env == 'P'))
 
     def _snap_action(self, action, exclude_node=None):
         """
@@ -172,8 +175,9 @@ class Story176750(GenericTest):
         # Execute a lvs command, grepping for the named snapshot
         lvs_grep = self.storage.get_lvs_cmd(grep_args=self.snap_name)
 
+        results = self.fanout.run(node_list, lvs_grep, su_root=True)
         for node in node_list:
-            _, _, rc = self.run_command(node, lvs_grep, su_root=True)
+            rc = results[node].rc
 
             if expect_positive:
                 # ombs snapshots should have been found so return code is 0
@@ -184,65 +188,70 @@ class Story176750(GenericTest):
                 self.assertNotEqual(0, rc, "{0} unexpectedly found on node "
                                            "{1}".format(self.snap_name, node))
 
-    def _check_lvm_task(self, node_list, task_descs, action):
+    def _check_lvm_task(self, node_list, plan, action):
         """
         Description:
             Asserts that there is a LVM task in
             the plan for each node in the given list.
         Args:
             node_list (list): List of nodes to assert are present.
-            task_descs (list): List of task descriptions to check.
+            plan (PlanModel): The parsed plan.
             action (str): "Create" for create_snapshot plans tasks, "Remove"
                 for remove_snapshot plan tasks. Strings are case-sensitive.
         """
-        snapshot_name = "L_vg1_root_{0}".format(self.snap_name)
+        snapshot_name = SnapshotNames.get_lvm_name(
+            SnapshotNames.get_lv_name('vg1', 'root'), self.snap_name)
         for node in node_list:
-            self._check_node_in_plan(node, task_descs, True)
+            self._check_node_in_plan(node, plan, True)
             lvm_task = '{0} LVM named backup snapshot "{1}" on ' \
                        'node "{2}"'.format(action, snapshot_name, node)
-            self.assertTrue(any(lvm_task in x for x in task_descs))
+            self.assertTrue(plan.has_task(lvm_task))
 
-    def _check_vxvm_task(self, vg_list, task_descs):
+    def _check_vxvm_task(self, vg_list, plan):
         """
         Description:
             Asserts that there is a VxVM task in the
             plan for each volume group in the given list.
         Args:
             vg_list (list): List of volume groups to check for.
-            task_descs (list): List of task descriptions to check
+            plan (PlanModel): The parsed plan.
         """
         for vg_name in vg_list:
-            self.assertTrue(any(vg_name in x for x in task_descs),
-                            "{0} not found in plan".format(vg_name))
+            self.assertNotEqual([], plan.mentions(vg_name),
+                                "{0} not found in plan".format(vg_name))
 
-    def _vxdg_list(self, node):
+    def _vxdg_list(self, node, refresh=False):
         """
         Description:
             Returns a list of volume groups enabled on the specified node.
             Returns None if no VGs are enabled.
         Args:
             node (str): Node to check what volume groups are enabled on it.
+        Kwargs:
+            refresh (bool): Query the node again instead of using the
+                topology read since the last failover or switch.
         """
-        cmd = "/sbin/vxdg list"
-        std_out, std_err, rc = self.run_command(node, cmd, su_root=True)
+        if refresh:
+            self.topology.refresh([node])
+        disk_groups = self.topology.get_disk_groups(node)
+        std_err, rc = self.topology.errors[node]
         self.assertEqual([], std_err)
         self.assertEqual(0, rc)
 
         volume_group_list = []
-        if len(std_out) > 1:
+        if disk_groups:
             # If VGs found to be running on node
-            for vol_grp in std_out[1:]:
-                vg_name, state, _ = vol_grp.split()
-                self.assertEqual("enabled", state,
+            for disk_group in disk_groups:
+                self.assertEqual("enabled", disk_group.state,
                                  "Volume group {0} not in expected 'enabled' "
-                                 "state on node {1}.".format(vg_name, node))
-                if vg_name != "no_snap":
-                    volume_group_list.append(vg_name)
+                                 "state on node {1}.".format(disk_group.name,
+                                                             node))
+                if disk_group.name != "no_snap":
+                    volume_group_list.append(disk_group.name)
         else:
             return None
 
-        # Return the list of volume groups enabled on the
-        # given node, omitting the description line in the output
+        # Return the list of volume groups enabled on the given node
         return volume_group_list
 
     def _get_all_volume_groups(self):
@@ -293,8 +302,9 @@ class Story176750(GenericTest):
         """
         enabled_vgs = []  # List of all enabled VGs
         node_vgs = {}  # Dictionary of nodes and the VGs enabled on them
+        # Query all the nodes in parallel, then read the VGs from memory
+        self.topology.refresh(node_list)
         for node in node_list:
-            # Find the volume groups active on the node
             vol_grps_on_node = self._vxdg_list(node)
             if vol_grps_on_node:
                 enabled_vgs.append(vol_grps_on_node)
@@ -306,28 +316,6 @@ class Story176750(GenericTest):
 
         return enabled_vgs, node_vgs
 
-    def _check_service_parallel(self, node, service_name):
-        """
-        Description:
-            Checks if the given service group is parallel or failover.
-        Args:
-            node (str): Node to run hagrp command on.
-            service_name (str): Service group to check.
-        Returns:
-            (int): 1 if service group is a parallel service.
-            (int): 0 if service group is a failover service.
-        """
-        parallel_cmd = self.vcs.get_hagrp_cmd(
-                    '-display {0} | grep Parallel'.format(service_name))
-        std_out, _, _ = self.run_command(node, parallel_cmd, su_root=True)
-        value = std_out[0].split()[-1]
-        self.assertTrue(value == '0' or value == '1',
-                        "Unexpected Parallel value ({0}) returned for service "
-                        "{1} on node {2}.".format(value, service_name, node))
-
-        # Return 1 if parallel, 0 if failover
-        return int(value)
-
     def _switch_services_one_node(self, online_node):
         """
         Description:
@@ -335,29 +323,14 @@ class Story176750(GenericTest):
         Args:
             online_node (str): Node to ensure all service groups are running on
         """
-        # Ensure no SGs are in STARTING/STOPPING state
-        self.wait_for_all_starting_vcs_groups(online_node)
-
-        # Get list of all service groups
-        hagrp_state_cmd = self.vcs.get_hagrp_state_cmd()
-        service_groups, _, _ = self.run_command(
-            online_node, hagrp_state_cmd, su_root=True)
-
-        for group in service_groups[1:]:
-            group_name, _, group_system, group_value = group.split()
-
-            # Check if SG is failover
-            if not self._check_service_parallel(online_node, group_name):
-                # Check if the SG is active on the specified node
-                if "ONLINE" in group_value and group_system != online_node:
-                    # If the SG is not online on the specified
-                    # node, switch it over to this node
-                    switch_cmd = self.vcs.get_hagrp_cmd(
-                        '-switch {0} -to {1}'.format(group_name, online_node))
-                    self.run_command(online_node, switch_cmd, su_root=True)
-
-        # Ensure no SGs are in STARTING/STOPPING state
-        self.wait_for_all_starting_vcs_groups(online_node)
+        # Read all SGs at once, switch the failover SGs online elsewhere
+        # in one batch and wait for all of them together
+        switched = VcsState(self, online_node, self.vcs).switch_to(
+            online_node)
+        self.log('info', 'Switched service groups {0} to {1}'.format(
+            switched, online_node))
+        # The disk groups have moved with the switched service groups
+        self.topology.invalidate()
 
     @attr('kgb-physical', 'revert', 'story176750', 'story176750_tc06')
     def test_06_p_snap_healthy_nodes(self):
@@ -439,7 +412,7 @@ class Story176750(GenericTest):
 
         # Get all enabled volume groups and map
         # them to the nodes that they are active on
-        enabled_vgs, node_vgs = self._find_vgs_on_nodes(self.mn_nodes)
+        enabled_vgs, _ = self._find_vgs_on_nodes(self.mn_nodes)
         self.log('info', '4. Assert that all VGs are enabled '
                          'on the node(s).')
         self.assertEqual(set(all_vgs), set(enabled_vgs))
@@ -450,33 +423,29 @@ class Story176750(GenericTest):
         self._snap_action("Create")
 
         # Extract paths and descriptions from the plan
-        task_paths, task_descs = self._extract_plan_data()
+        plan = self._extract_plan_data()
 
         self.log('info', '6. Ensure that all nodes are referenced in the plan')
         for node in self.node_urls:
-            self._check_node_in_plan(node, task_paths, True)
+            self._check_node_in_plan(node, plan, True)
 
         self.log('info', '7. Check that the plan contains '
                          'a LVM task for each node.')
-        self._check_lvm_task(self.mn_nodes, task_descs, action="Create")
+        self._check_lvm_task(self.mn_nodes, plan, action="Create")
 
         self.log('info', '8. Check that the plan contains a '
                          'VxVM task for each volume group.')
-        self._check_vxvm_task(all_vgs, task_descs)
+        self._check_vxvm_task(all_vgs, plan)
 
         self.log('info', '9. Ensure that the plan runs to completion.')
         self.assertEqual(True, self.wait_for_plan_state(
             self.ms_node, const.PLAN_COMPLETE),
                          "Plan did not complete successfully.")
 
-        self.log('info', '10. Assert that LVM snapshot '
-                         'was created on all nodes.')
-        self._lvm_snap_exists(self.mn_nodes)
-
+        self.log('info', '10. Assert that LVM snapshots were created on '
+                         'all nodes, with the modelled sizes.')
         self.log('info', '11. Assert that all VxVM snapshots were created.')
-        for node, vol_grps in node_vgs.iteritems():
-            for vol_grp in vol_grps:
-                self._check_vxvm_snaps_exist(node, vol_grp)
+        self.reconciler.verify()
 
         self.log('info', 'Beginning test for "Remove snapshot legacy LVM".')
 
@@ -484,19 +453,19 @@ class Story176750(GenericTest):
         self._snap_action("Remove")
 
         # Extract paths and descriptions from the plan
-        task_paths, task_descs = self._extract_plan_data()
+        plan = self._extract_plan_data()
 
         self.log('info', '13. Ensure all nodes are referenced in the plan')
         for node in self.node_urls:
-            self._check_node_in_plan(node, task_paths, True)
+            self._check_node_in_plan(node, plan, True)
 
         self.log('info', '14. Check that the plan contains '
                          'a LVM task for each node.')
-        self._check_lvm_task(self.mn_nodes, task_descs, action="Remove")
+        self._check_lvm_task(self.mn_nodes, plan, action="Remove")
 
         self.log('info', '15. Check that the plan contains a '
                          'VxVM task for each volume group.')
-        self._check_vxvm_task(all_vgs, task_descs)
+        self._check_vxvm_task(all_vgs, plan)
 
         self.log('info', '16. Ensure that the plan runs to completion.')
         self.assertEqual(True, self.wait_for_plan_state(
@@ -504,13 +473,8 @@ class Story176750(GenericTest):
                          "Plan did not complete successfully.")
 
         self.log('info', '17. Assert that snapshot was removed from all nodes')
-        self._lvm_snap_exists(self.mn_nodes, False)
-
         self.log('info', '18. Assert that all VxVM snapshots were removed.')
-        for node, vol_grps in node_vgs.iteritems():
-            for vol_grp in vol_grps:
-                self._check_vxvm_snaps_exist(
-                    node, vol_grp, expect_present=False)
+        self.reconciler.verify()
 
         self.log('info', 'Beginning test for "Create snapshot excluding '
                          'healthy node where VxVM is not mounted".')
@@ -533,25 +497,25 @@ class Story176750(GenericTest):
         self._snap_action("Create", self.offline_node)
 
         # Extract paths and descriptions from the plan
-        task_paths, task_descs = self._extract_plan_data()
+        plan = self._extract_plan_data()
 
         self.log('info', '24. Ensure that the excluded node is '
                          'not referenced in the plan.')
-        self._check_node_in_plan(self.offline_url, task_paths, False)
-        self._check_node_in_plan(self.offline_node, task_descs, False)
+        self._check_node_in_plan(self.offline_url, plan, False)
+        self._check_node_in_plan(self.offline_node, plan, False)
 
         self.log('info', '25. Ensure that the included '
                          'nodes are referenced in the plan.')
         for node in self.node_urls[1:]:
-            self._check_node_in_plan(node, task_paths, True)
+            self._check_node_in_plan(node, plan, True)
 
         self.log('info', '26. Check that the plan contains '
                          'a LVM task for each included node.')
-        self._check_lvm_task(self.mn_nodes[1:], task_descs, "Create")
+        self._check_lvm_task(self.mn_nodes[1:], plan, "Create")
 
         self.log('info', '27. Check that the plan contains a '
                          'VxVM task for each volume group.')
-        self._check_vxvm_task(all_vgs, task_descs)
+        self._check_vxvm_task(all_vgs, plan)
 
         self.log('info', '28. Ensure that the plan runs to completion.')
         self.assertEqual(True, self.wait_for_plan_state(
@@ -573,25 +537,25 @@ class Story176750(GenericTest):
         self._snap_action("Remove", self.offline_node)
 
         # Extract paths and descriptions from the plan
-        task_paths, task_descs = self._extract_plan_data()
+        plan = self._extract_plan_data()
 
         self.log('info', '32. Ensure that the excluded node is '
                          'not referenced in the plan.')
-        self._check_node_in_plan(self.offline_url, task_paths, False)
-        self._check_node_in_plan(self.offline_node, task_descs, False)
+        self._check_node_in_plan(self.offline_url, plan, False)
+        self._check_node_in_plan(self.offline_node, plan, False)
 
         self.log('info', '33. Ensure that the included '
                          'nodes are referenced in the plan.')
         for node in self.node_urls[1:]:
-            self._check_node_in_plan(node, task_paths, True)
+            self._check_node_in_plan(node, plan, True)
 
         self.log('info', '34. Check that the plan contains '
                          'a LVM task for each included node.')
-        self._check_lvm_task(self.mn_nodes[1:], task_descs, "Remove")
+        self._check_lvm_task(self.mn_nodes[1:], plan, "Remove")
 
         self.log('info', '35. Check that the plan contains a '
                          'VxVM task for each volume group.')
-        self._check_vxvm_task(all_vgs, task_descs)
+        self._check_vxvm_task(all_vgs, plan)
 
         self.log('info', '36. Ensure that the plan runs to completion.')
         self.assertEqual(True, self.wait_for_plan_state(
@@ -666,21 +630,21 @@ class Story176750(GenericTest):
             self._snap_action("Create", self.offline_node)
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '6. Ensure that the non-SSHable node is '
                              'not referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, False)
-            self._check_node_in_plan(self.offline_node, task_descs, False)
+            self._check_node_in_plan(self.offline_url, plan, False)
+            self._check_node_in_plan(self.offline_node, plan, False)
 
             self.log('info', '7. Ensure that the SSHABLE '
                              'nodes are referenced in the plan.')
             for node in self.node_urls[1:]:
-                self._check_node_in_plan(node, task_paths, True)
+                self._check_node_in_plan(node, plan, True)
 
             self.log('info', '8. Check that the plan contains '
                              'a LVM task for each SSHABLE node.')
-            self._check_lvm_task(self.mn_nodes[1:], task_descs, "Create")
+            self._check_lvm_task(self.mn_nodes[1:], plan, "Create")
 
             self.log('info', '9. Ensure that the plan runs to completion.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -698,21 +662,21 @@ class Story176750(GenericTest):
             self._snap_action("Remove", self.offline_node)
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '12. Ensure that the non-SSHable node is '
                              'not referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, False)
-            self._check_node_in_plan(self.offline_node, task_descs, False)
+            self._check_node_in_plan(self.offline_url, plan, False)
+            self._check_node_in_plan(self.offline_node, plan, False)
 
             self.log('info', '13. Ensure that the SSHABLE '
                              'nodes are referenced in the plan.')
             for node in self.node_urls[1:]:
-                self._check_node_in_plan(node, task_paths, True)
+                self._check_node_in_plan(node, plan, True)
 
             self.log('info', '14. Check that the plan contains '
                              'a LVM task for each SSHABLE node.')
-            self._check_lvm_task(self.mn_nodes[1:], task_descs, "Remove")
+            self._check_lvm_task(self.mn_nodes[1:], plan, "Remove")
 
             self.log('info', '15. Ensure that the plan runs to completion.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -809,21 +773,21 @@ class Story176750(GenericTest):
             self._snap_action("Create", self.mn_nodes[1])
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '5. Ensure that the corrupted '
                              'node is referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, True)
-            self._check_node_in_plan(self.offline_node, task_descs, True)
+            self._check_node_in_plan(self.offline_url, plan, True)
+            self._check_node_in_plan(self.offline_node, plan, True)
 
             self.log('info', '6. Check that the plan contains '
                              'a LVM task for the corrupted node.')
-            self._check_lvm_task([self.offline_node], task_descs, "Create")
+            self._check_lvm_task([self.offline_node], plan, "Create")
 
             self.log('info', '7. Ensure that the healthy node is '
                              'not referenced in the plan.')
-            self._check_node_in_plan(self.node_urls[1], task_paths, False)
-            self._check_node_in_plan(self.mn_nodes[1], task_descs, False)
+            self._check_node_in_plan(self.node_urls[1], plan, False)
+            self._check_node_in_plan(self.mn_nodes[1], plan, False)
 
             self.log('info', '8. Ensure that the plan fails.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -892,21 +856,21 @@ class Story176750(GenericTest):
             self._snap_action("Remove", self.mn_nodes[1])
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '20. Ensure that the corrupted '
                              'node is referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, True)
-            self._check_node_in_plan(self.offline_node, task_descs, True)
+            self._check_node_in_plan(self.offline_url, plan, True)
+            self._check_node_in_plan(self.offline_node, plan, True)
 
             self.log('info', '21. Check that the plan contains '
                              'a LVM task for the corrupted node.')
-            self._check_lvm_task([self.offline_node], task_descs, "Remove")
+            self._check_lvm_task([self.offline_node], plan, "Remove")
 
             self.log('info', '22. Ensure that the healthy node is '
                              'not referenced in the plan.')
-            self._check_node_in_plan(self.node_urls[1], task_paths, False)
-            self._check_node_in_plan(self.mn_nodes[1], task_descs, False)
+            self._check_node_in_plan(self.node_urls[1], plan, False)
+            self._check_node_in_plan(self.mn_nodes[1], plan, False)
 
             self.log('info', '23. Ensure that the plan fails.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -930,7 +894,7 @@ class Story176750(GenericTest):
 
             self.log('info', '27. Ensuring at least one volume '
                              'group is active on the included node.')
-            if self._vxdg_list(self.online_nodes[0]) is None:
+            if self._vxdg_list(self.online_nodes[0], refresh=True) is None:
                 self._switch_services_one_node(self.online_nodes[0])
 
             self.log('info', '28. Move vxsnap on the node so '
@@ -1109,27 +1073,25 @@ class Story176750(GenericTest):
             self._snap_action("Create", self.offline_node)
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '7. Ensure that the offline node is '
                              'not referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, False)
-            self._check_node_in_plan(self.offline_node, task_descs, False)
+            self._check_node_in_plan(self.offline_url, plan, False)
+            self._check_node_in_plan(self.offline_node, plan, False)
 
             self.log('info', '8. Ensure that the healthy '
                              'nodes are referenced in the plan.')
             for node in self.node_urls[1:]:
-                self._check_node_in_plan(node, task_paths, True)
+                self._check_node_in_plan(node, plan, True)
 
             self.log('info', '9. Check that the plan contains '
                              'a LVM task for each healthy node.')
-            self._check_lvm_task(self.mn_nodes[1:], task_descs, "Create")
+            self._check_lvm_task(self.mn_nodes[1:], plan, "Create")
 
             self.log('info', '10. Check that the plan contains a '
                              'VxVM task for each volume group.')
-            for vg_name in all_vgs:
-                self.assertTrue(any(vg_name in x for x in task_descs),
-                                "{0} not found in plan".format(vg_name))
+            self._check_vxvm_task(all_vgs, plan)
 
             self.log('info', '11. Ensure that the plan runs to completion.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -1153,27 +1115,25 @@ class Story176750(GenericTest):
             self._snap_action("Remove", self.offline_node)
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '15. Ensure that the offline node is '
                              'not referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, False)
-            self._check_node_in_plan(self.offline_url, task_descs, False)
+            self._check_node_in_plan(self.offline_url, plan, False)
+            self._check_node_in_plan(self.offline_url, plan, False)
 
             self.log('info', '16. Ensure that the healthy '
                              'nodes are referenced in the plan.')
             for node in self.node_urls[1:]:
-                self._check_node_in_plan(node, task_paths, True)
+                self._check_node_in_plan(node, plan, True)
 
             self.log('info', '17. Check that the plan contains '
                              'a LVM task for each healthy node.')
-            self._check_lvm_task(self.mn_nodes[1:], task_descs, "Remove")
+            self._check_lvm_task(self.mn_nodes[1:], plan, "Remove")
 
             self.log('info', '18. Check that the plan contains a '
                              'VxVM task for each volume group.')
-            for vg_name in all_vgs:
-                self.assertTrue(any(vg_name in x for x in task_descs),
-                                "{0} not found in plan".format(vg_name))
+            self._check_vxvm_task(all_vgs, plan)
 
             self.log('info', '19. Ensure that the plan runs to completion.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -1198,12 +1158,12 @@ class Story176750(GenericTest):
             self._snap_action("Create")
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '23. Ensure that the offline node is '
                              'referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, True)
-            self._check_node_in_plan(self.offline_node, task_descs, True)
+            self._check_node_in_plan(self.offline_url, plan, True)
+            self._check_node_in_plan(self.offline_node, plan, True)
 
             self.log('info', '24. Ensure that the plan fails.')
             self.assertEqual(True, self.wait_for_plan_state(
@@ -1217,12 +1177,12 @@ class Story176750(GenericTest):
             self._snap_action("Remove")
 
             # Extract paths and descriptions from the plan
-            task_paths, task_descs = self._extract_plan_data()
+            plan = self._extract_plan_data()
 
             self.log('info', '26. Ensure that the offline node is '
                              'referenced in the plan.')
-            self._check_node_in_plan(self.offline_url, task_paths, True)
-            self._check_node_in_plan(self.offline_node, task_descs, True)
+            self._check_node_in_plan(self.offline_url, plan, True)
+            self._check_node_in_plan(self.offline_node, plan, True)
 
             self.log('info', '27. Ensure that the plan fails.')
             self.assertEqual(True, self.wait_for_plan_state(
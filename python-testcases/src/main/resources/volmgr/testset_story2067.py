@@ -13,13 +13,17 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 from litp_cli_utils import CLIUtils
 from storage_utils import StorageUtils
+from lv_inventory import LvInventory
+from size_utils import Size
+from model_batch import ModelUpdateBatch
 import test_constants
 from math import fabs
 
 
-class Story2067(GenericTest):
+class Story2067(InstrumentedTestMixin, GenericTest):
     """
     As a LITP User I want to increase the size of a
     LVM Logical Volume  and the filesystem that lives
@@ -44,6 +48,7 @@ class Story2067(GenericTest):
 
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.size_batch = ModelUpdateBatch(self, self.ms_node)
         self.test_nodes = self.get_managed_node_filenames()
         self.test_nodes.sort()
         self.cli = CLIUtils()
@@ -69,10 +74,7 @@ class Story2067(GenericTest):
         else returns the given size
         """
         if "G" in size:
-            value, _ = size.split("G")
-            value = int(value)
-            value += 1
-            size = str(value) + "G"
+            size = (Size.parse(size) + Size.parse("1G")).to_litp("G")
 
         return size
 
@@ -83,11 +85,8 @@ class Story2067(GenericTest):
         else returns the given size
         """
         if "M" in size:
-            value, _ = size.split("M")
-            value = int(value)
             # Must be multiple of 4MB and at least 0.01GB
-            value += 12
-            size = str(value) + "M"
+            size = (Size.parse(size) + Size.parse("12M")).to_litp("M")
 
         return size
 
@@ -97,18 +96,16 @@ class Story2067(GenericTest):
         Converts given size to G
         """
         if "M" in size:
-            value, _ = size.split("M")
-            value = int(value)
-            value /= 1024
-            size = str(value) + "G"
+            size = Size.parse(size).to_litp("G")
 
         return size
 
     def force_initial_size_unit(self, fs_path, wanted_unit, current_size):
         """
         If test specification is convert from G to M or viceversa
-        and current size doesnt fulfil, force a change to
-        have what test needs.
+        and current size doesnt fulfil, queue a change to
+        have what test needs. The change is deployed with the
+        size update that follows it.
         """
         if wanted_unit not in current_size:
             if 'M' in current_size:
@@ -116,17 +113,8 @@ class Story2067(GenericTest):
             else:
                 converted_size = str(self.storage_utils.convert_gb_to_mb(
                         current_size)) + "M"
-            self.execute_cli_update_cmd(self.ms_node, fs_path,
-                                    "size={0}".format(converted_size))
-
-            self.execute_cli_createplan_cmd(self.ms_node)
-            self.execute_cli_runplan_cmd(self.ms_node)
-            self.assertTrue(self.wait_for_plan_state(self.ms_node,
-                                        test_constants.PLAN_COMPLETE))
-
-            std_out, _, _ = self.execute_cli_show_cmd(self.ms_node, fs_path)
-            self.assertTrue(self.is_text_in_list("size: {0}".\
-                                        format(converted_size), std_out))
+            self.size_batch.queue(fs_path, {'size': converted_size},
+                                  current={'size': current_size})
 
             current_size = converted_size
 
@@ -172,67 +160,39 @@ class Story2067(GenericTest):
             result[node_name] = size
         return result
 
+    def _get_real_fs_size(self, node, mount_point):
+        '''
+        Returns (as a Size) the size of the logical volume which is mounted
+        on given mount point on given node.
+        '''
+        # Queries what an LV (and hence, filesystem) size is on disk.
+        # Used to verify that applied model sizes reflect reality.
+        inventory = LvInventory(self)
+        inventory.collect([node])
+        lvol = inventory.get_by_mount_point(node, mount_point)
+        if lvol is None:
+            return None
+        return lvol.size
+
     def _get_real_fs_size_gb(self, node, mount_point):
         '''
         Returns (as a float representing GB) the size of the logical volume
         which is mounted on given mount point on given node.
         '''
-        # Queries what an LV (and hence, filesystem) size is on disk.
-        # Used to verify that applied model sizes reflect reality.
-        std_out, _, _ = self.run_command(
-            node, 'df -h -P -l', su_root=True
-            )
-        for str_line in std_out[1:]:
-            tokens = str_line.split()
-            if tokens[5] == mount_point:
-                std_out_2, _, _ = self.run_command(
-                    node,
-                    '/sbin/lvs -o size --noheadings {0}'.format(tokens[0]),
-                    su_root=True
-                    )
-                size_str = std_out_2[0].strip()
-                if size_str[-1] == 'g':
-                    return float(size_str[:-1])
-                elif size_str[-1] == 'm':
-                    return float(size_str[:-1]) / 1024.0
-                else:
-                    return float(size_str[:-1]) * 1024.0
-        return None
+        size = self._get_real_fs_size(node, mount_point)
+        if size is None:
+            return None
+        return size.to_unit('G')
 
     def _get_real_fs_size_mb(self, node, mount_point):
         '''
         Returns (as an Int representing MB) the size of the logical volume
         which is mounted on given mount point on given node.
         '''
-        # Queries what an LV (and hence, filesystem) size is on disk.
-        # Used to verify that applied model sizes reflect reality.
-        std_out, _, _ = self.run_command(
-            node, 'df -h -P -l', su_root=True
-            )
-        for str_line in std_out[1:]:
-            tokens = str_line.split()
-            if tokens[5] == mount_point:
-                std_out_2, _, _ = self.run_command(
-                    node,
-                    '/sbin/lvs -o size --noheadings {0}'.format(tokens[0]),
-                    su_root=True
-                    )
-                size_str = std_out_2[0].strip()
-                if size_str[-1] == 'm':
-                    return int(size_str[:-1])
-                elif size_str[-1] == 'g':
-                    size_str = size_str[:-1]
-                    split_str = size_str.split('.')
-                    change_str = "0." + split_str[1]
-                    return (int(split_str[0]) * 1024) + \
-                           (int(float(change_str) * 1024))
-                else:
-                    size_str = size_str[:-1]
-                    split_str = size_str.split('.')
-                    change_str = "0." + split_str[1]
-                    return (int(split_str[0]) * 1024) + \
-                           (int(float(change_str) * 1024))
-        return None
+        size = self._get_real_fs_size(node, mount_point)
+        if size is None:
+            return None
+        return int(size.to_unit('M'))
 
     def create_test_mount_point(self):
         """
@@ -394,12 +354,10 @@ class Story2067(GenericTest):
                                                      current_size=node1_size)
 
         node1_modified_size = self.increase_size_mb(node_original_size)
-        self.execute_cli_update_cmd(self.ms_node, node1_fs_url,
-                                  "size={0}".format(node1_modified_size))
+        self.size_batch.queue(node1_fs_url, {'size': node1_modified_size})
 
         self.log('info', 'Create and run the plan')
-        self.run_and_check_plan(self.ms_node, test_constants.PLAN_COMPLETE,
-                plan_timeout_mins=600)
+        self.size_batch.commit(plan_timeout_mins=600)
 
         #source should not be changed
         std_out, _, _ = self.execute_cli_show_cmd(self.ms_node,
@@ -499,12 +457,10 @@ class Story2067(GenericTest):
         size_gb = self.convert_to_gb(base_fs_original_size)
         size = self.increase_size_gb(size_gb)
 
-        self.execute_cli_update_cmd(self.ms_node, file_sys_infras,
-                                "size={0}".format(size))
+        self.size_batch.queue(file_sys_infras, {'size': size})
 
         self.log('info', 'Create and run the plan')
-        self.run_and_check_plan(self.ms_node, test_constants.PLAN_COMPLETE,
-                plan_timeout_mins=600)
+        self.size_batch.commit(plan_timeout_mins=600)
 
         std_out, _, _ = self.execute_cli_show_cmd(self.ms_node,
                                                     file_sys_infras)
@@ -608,12 +564,10 @@ class Story2067(GenericTest):
                                                      current_size=node1_size)
 
         node1_modified_size = self.increase_size_mb(node_original_size)
-        self.execute_cli_update_cmd(self.ms_node, node1_fs_url,
-                                  "size={0}".format(node1_modified_size))
+        self.size_batch.queue(node1_fs_url, {'size': node1_modified_size})
 
         self.log('info', 'Create and run the plan')
-        self.run_and_check_plan(self.ms_node, test_constants.PLAN_COMPLETE,
-                plan_timeout_mins=600)
+        self.size_batch.commit(plan_timeout_mins=600)
 
         #verify source item size is not changed
         std_out, _, _ = self.execute_cli_show_cmd(self.ms_node,
@@ -14,14 +14,18 @@ program(s) have been supplied.
             Agile: STORY-2115
 """
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 from storage_utils import StorageUtils
+from size_utils import approx_equal
+from lv_inventory import LvInventory
+from grub_state import GrubState
 import test_constants
 import time
 import math
 import re
 
 
-class Story2115(GenericTest):
+class Story2115(InstrumentedTestMixin, GenericTest):
     """
     As a LITP admin I want to snapshot LVM volumes present in my
     deployment when I am doing maintenance operations so that I can revert
@@ -32,6 +36,8 @@ class Story2115(GenericTest):
     maps to test_02_p_list_logical_volumes_ms in LITPCDS-12294.
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         super(Story2115, self).setUp()
@@ -41,6 +47,7 @@ class Story2115(GenericTest):
         self.all_nodes = self.ms_nodes + self.mn_nodes
         self.timeout_mins = 10
         self.storage = StorageUtils()
+        self.grub = GrubState(self)
 
     def tearDown(self):
         """Runs for every test"""
@@ -68,22 +75,15 @@ class Story2115(GenericTest):
         ms_lv_snap_found = []
         ms_lv_found = []
 
-        lvs_cmd = self.storage.get_lvs_cmd(grep_args=r"-v 'swi\|LSize'")
         # Get the logical volumes
+        inventory = LvInventory(self)
+        inventory.collect(self.all_nodes)
         lvols = []
-        for node in self.all_nodes:
-            # Get the logical volumes
-            lvs_out, err, ret_code = self.run_command(node, lvs_cmd,
-                                                      su_root=True)
-            self.assertEqual([], err)
-            self.assertTrue(ret_code < 2)
-            if lvs_out:
-                log_vols = self.storage.parse_lvs_stdout(lvs_out)
-                for log_vol in log_vols:
-                    self.log("info", "lv_name is {0}".format(log_vol['LV']))
-                    lvols.append([node, log_vol['LV']])
-                    if node == self.ms_node:
-                        ms_lv_found.append(log_vol['LV'])
+        for lvol in inventory.find(snapshots=False):
+            self.log("info", "lv_name is {0}".format(lvol.lv_name))
+            lvols.append(lvol)
+            if lvol.node == self.ms_node:
+                ms_lv_found.append(lvol.lv_name)
 
         # Verify that each logial volume has a snapshot, except for 'swap'
         # and 'software'. var/log is snapshot only if it name snapshot
@@ -92,22 +92,17 @@ class Story2115(GenericTest):
             expect_snapshot = True
             no_snap_list = ['swap', 'var_log', 'software']
             for lvname in no_snap_list:
-                if lvname in lvol[1]:
+                if lvname in lvol.lv_name:
                     # no snapshots for swap , var_log and software
                     expect_snapshot = False
 
             # Verify that there is a corresponding snapshot for all LVs
-            cmd_args = "swi | grep {0}".format(lvol[1])
-            cmd = self.storage.get_lvs_cmd(grep_args=cmd_args)
-            lvs_out, err, ret_code = self.run_command(lvol[0], cmd,
-                                                      su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(expect_snapshot,
-                    self.is_text_in_list(lvol[1], lvs_out))
-            self.assertNotEqual(expect_snapshot, ret_code)
-
-            if expect_snapshot and lvol[0] == self.ms_node:
-                ms_lv_snap_found.append(lvol[1])
+            snapshots = inventory.find([lvol.node], vg_name=lvol.vg_name,
+                                       origin=lvol.lv_name, snapshots=True)
+            self.assertEqual(expect_snapshot, bool(snapshots))
+
+            if expect_snapshot and lvol.node == self.ms_node:
+                ms_lv_snap_found.append(lvol.lv_name)
 
         # Verify the lv on the ms is according to LITPCDS-12294
         self.assertEqual(set(ms_lv_to_check), set(ms_lv_found))
@@ -123,12 +118,13 @@ class Story2115(GenericTest):
         Results:
             stdmsg, stderr
         """
-        cmp_cmd = "cmp {0} {0}.backup".format(test_constants.GRUB_CONFIG_FILE)
+        grub_file = test_constants.GRUB_CONFIG_FILE
+        self.grub.collect(self.all_nodes,
+                          [grub_file, GrubState.get_backup_path(grub_file)])
         for node in self.all_nodes:
-            out, err, ret_code = self.run_command(node, cmp_cmd, su_root=True)
-            self.assertEqual([], err)
-            self.assertTrue(ret_code < 2)
-            self.assertEqual([], out)
+            self.assertTrue(self.grub.matches_backup(node, grub_file),
+                            "{0} not backed up on {1}".format(grub_file,
+                                                              node))
 
     def _get_model_file_systems(self):
         """
@@ -201,57 +197,26 @@ class Story2115(GenericTest):
             'size': '2G'
         """
         fsystems = []
+        inventory = LvInventory(self)
+        inventory.collect(self.mn_nodes)
 
         for node in self.mn_nodes:
             hostname = self.get_node_att(node, "hostname")
-
-            cmd = self.storage.get_lvdisplay_cmd("-c")
-            out, err, ret_code = self.run_command(node, cmd,
-                                                  su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(0, ret_code)
-            for line in out:
-                fsystem = [hostname]
-                f_vol_output = line.strip().split(':')
-                lv_path = f_vol_output[0]
-
-                # Get the LV Name
-                cmd = self.storage.get_lvdisplay_cmd(lvdisplay_args=lv_path,
-                                                       grep_args="\"LV Name\"")
-                out, err, ret_code = self.run_command(node, cmd,
-                                                      su_root=True)
-                self.assertEqual([], err)
-                self.assertEqual(0, ret_code)
-                fsystem.append(out[0].split()[2])
-
-                # Get the FS type from the block ID command
-                cmd = '/sbin/blkid -s TYPE -o value {0}'.format(lv_path)
-                out, err, ret_code = self.run_command(node, cmd,
-                                                      su_root=True)
-                self.assertEqual([], err)
-                self.assertEqual(0, ret_code)
-                fsystem.append(out[0])
-
-                # Get the LV Size
-                fs_name = lv_path.split("/")[-1]
-                lvs_cmd = r"/sbin/lvs --units g | grep {0}".format(fs_name)
-                out, err, ret_code = self.run_command(node, lvs_cmd,
-                                                      su_root=True)
-                self.assertEqual([], err)
-                self.assertTrue(ret_code < 2)
-                if out:
-                    lv_size = float(out[0].split()[3][:-1]) * 1024
-                    self.log("info", "{0} size = {1}".format(fs_name, lv_size))
-                    fsystem.append(lv_size)
-
-                fsystems.append(fsystem)
+            for lvol in inventory.find([node]):
+                # The FS type from the block ID probe
+                self.assertNotEqual(None, lvol.fs_type)
+                lv_size = lvol.size.to_unit("M")
+                self.log("info", "{0} size = {1}".format(lvol.lv_name,
+                                                         lv_size))
+                fsystems.append([hostname, lvol.lv_name, lvol.fs_type,
+                                 lv_size])
 
         return fsystems
 
     @staticmethod
     def _approx_equal(var_x, var_y, tolerance=0.01):
         """ Approximate comparison. """
-        return abs(var_x - var_y) <= 0.5 * tolerance * (var_x + var_y)
+        return approx_equal(var_x, var_y, tolerance)
 
     @attr('all', 'revert', 'story2115', 'story2115_tc01')
     def test_01_p_user_can_create_snapshots_for_all_logical_volumes(self):
@@ -13,12 +13,14 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from node_identity import NodeIdentityIndex
 import test_constants
 from storage_utils import StorageUtils
 from redhat_cmd_utils import RHCmdUtils
 
 
-class Story216609(GenericTest):
+class Story216609(InstrumentedTestMixin, GenericTest):
     """
     As a LITP user, I want the ability specify nested paths for mount_point
     in the model, so that I have a convenient way of attaching LVM file
@@ -42,6 +44,7 @@ class Story216609(GenericTest):
 
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.identity = NodeIdentityIndex(self, self.ms_node)
         self.mn_nodes = self.get_managed_node_filenames()
         self.node_urls = self.find(self.ms_node, "/deployments", "node")
         self.node_urls.sort()
@@ -190,9 +193,7 @@ class Story216609(GenericTest):
         Returns:
             str.
         """
-        node_url = self.find_parent_path_from_item_type(self.ms_node, 'node',
-                                                        fs_url)
-        return self.get_node_filename_from_url(self.ms_node, node_url)
+        return self.identity.get_filename(fs_url)
 
     def verify_properties(self, node_fs_urls):
         """
@@ -310,7 +311,7 @@ class Story216609(GenericTest):
                 .format(node_url, vg_id, 'nested_fs1')
             "{0}/storage_profile/volume_groups/{1}/file_systems/{2}" \
                 .format(node_url, vg_id, 'nested_fs2')
-            self.get_node_filename_from_url(self.ms_node, node_url)
+            self.identity.get_filename(node_url)
         self.log("info", "New fs with nested mount paths created")
         self.run_command(self.ms_node,
                          "df -h",
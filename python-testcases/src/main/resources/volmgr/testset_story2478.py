@@ -13,12 +13,15 @@ program(s) have been supplied.
             Agile: STORY-2478
 """
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from log_watcher import LogWatcher
 from redhat_cmd_utils import RHCmdUtils
 from storage_utils import StorageUtils
+from grub_state import GrubState
 import test_constants
 
 
-class Story2478(GenericTest):
+class Story2478(InstrumentedTestMixin, GenericTest):
     """
     As an administrator I want to remove a LVM snapshot that I no longer
     require.
@@ -31,11 +34,13 @@ class Story2478(GenericTest):
         # 2. Set up variables used in the test
         self.ms_nodes = self.get_management_node_filenames()
         self.ms_node = self.ms_nodes[0]
+        self.log_watcher = LogWatcher(self, self.ms_node)
         self.mn_nodes = self.get_managed_node_filenames()
         self.all_nodes = self.ms_nodes + self.mn_nodes
         self.timeout_mins = 10
         self.rhcmd = RHCmdUtils()
         self.storage = StorageUtils()
+        self.grub = GrubState(self)
 
     def tearDown(self):
         """Runs for every test"""
@@ -68,18 +73,19 @@ class Story2478(GenericTest):
 
         return sshots
 
-    def _grub_bkup_exist(self, node):
+    def _grub_bkup_exist(self, nodes):
         """
         Description:
             Check if grub backup exists.
         Actions:
-                1. Verify that a grub.conf is backed_up.
+                1. Verify that a grub.conf is backed_up on each node.
         Results:
-            Boolean, True if exists or False otherwise
+            dict, True if exists or False otherwise, keyed by node
         """
-        grub_bkup = test_constants.GRUB_CONFIG_FILE + ".backup"
-        # Returns a boolean, True if exists or False otherwise
-        return self.remote_path_exists(node, grub_bkup, su_root=True)
+        grub_bkup = GrubState.get_backup_path(test_constants.GRUB_CONFIG_FILE)
+        self.grub.collect(nodes, [grub_bkup])
+        return dict((node, self.grub.exists(node, grub_bkup))
+                    for node in nodes)
 
     def _create_package_inheritance(self, node_url, package_name, package_url):
         """
@@ -201,8 +207,9 @@ class Story2478(GenericTest):
         self._snapshot_all_nodes()
 
         # Verify that the grub backup exists.
+        grub_bkups = self._grub_bkup_exist(self.all_nodes)
         for node in self.all_nodes:
-            self.assertTrue(self._grub_bkup_exist(node))
+            self.assertTrue(grub_bkups[node])
 
         self.log('info', 'Add a package on a node')
         # Create a package (telnet)
@@ -277,8 +284,9 @@ class Story2478(GenericTest):
         self.assertFalse(self._snapshot_item_exists())
 
         # Verify that the grub backup is gone.
+        grub_bkups = self._grub_bkup_exist(self.all_nodes)
         for node in self.all_nodes:
-            self.assertFalse(self._grub_bkup_exist(node))
+            self.assertFalse(grub_bkups[node])
 
         # Verify that the package is not added.
         chk_pkg_cmd = self.rhcmd.check_pkg_installed(['telnet'])
@@ -312,8 +320,7 @@ class Story2478(GenericTest):
         @tms_execution_type: Automated
         """
         # Store the current message log length.
-        log_path = test_constants.GEN_SYSTEM_LOG_PATH
-        log_len = self.get_file_len(self.ms_node, log_path)
+        self.log_watcher.mark()
         node = self.mn_nodes[-1]
 
         # Create a snapshot of all nodes
@@ -364,20 +371,11 @@ class Story2478(GenericTest):
             # Verify that the message log contains a message indicating why
             #     the snapshot failed to delete.
             log_msg = "execution expired"
-            curr_log_pos = self.get_file_len(self.ms_node, log_path)
-            test_logs_len = curr_log_pos - log_len
-
-            # Run grep on the server logs related to this test
-            cmd = self.rhcmd.get_grep_file_cmd(log_path, log_msg,
-                                               file_access_cmd="tail -n {0}"
-                                               .format(test_logs_len))
-            out, err, ret_code = self.run_command(self.ms_node,
-                                                  cmd,
-                                                  su_root=True)
 
-            self.assertEqual(0, ret_code)
-            self.assertEqual([], err)
-            self.assertTrue(self.is_text_in_list(log_msg, out))
+            # Search the server logs related to this test
+            match = self.log_watcher.wait_for([log_msg], timeout_sec=10)
+            self.assertNotEqual(None, match,
+                                "{0} not found in log".format(log_msg))
         finally:
             # Move lvremove to the proper location
             cmd = self.rhcmd.get_move_cmd((lvremove_path + "_old"),
@@ -12,16 +12,19 @@ program(s) have been supplied.
             delete a VXVM snapshot when the specific commands are executed.
 """
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 from storage_utils import StorageUtils
 import test_constants
 
 
-class Story2481(GenericTest):
+class Story2481(InstrumentedTestMixin, GenericTest):
     """
     As a LITP User I want to create and delete a VXVM snapshot when the
     specific commands are executed.
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         # 1. Call super class setup
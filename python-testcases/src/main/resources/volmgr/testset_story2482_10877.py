@@ -18,30 +18,37 @@ program(s) have been supplied.
 """
 import time
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from model_journal import ModelJournal
+from restore_monitor import RestoreMonitor
+from grub_state import GrubState
 from litp_cli_utils import CLIUtils
-from redhat_cmd_utils import RHCmdUtils
 from storage_utils import StorageUtils
 import test_constants
 
 
-class Story2482(GenericTest):
+class Story2482(InstrumentedTestMixin, GenericTest):
     """
     As a LITP User I want to restore to a LVM snapshot that I have already
     taken, so that my system is in a known good state.
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         # 1. Call super class setup
         super(Story2482, self).setUp()
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.journal = ModelJournal(self, self.ms_node)
+        self.journal.start()
         self.mn_nodes = self.get_managed_node_filenames()
         self.all_nodes = self.mn_nodes + [self.ms_node]
         self.timeout_mins = 7
         self.cli = CLIUtils()
-        self.rhcmd = RHCmdUtils()
         self.storage = StorageUtils()
+        self.grub = GrubState(self)
 
     def tearDown(self):
         """Runs for every test"""
@@ -141,34 +148,11 @@ class Story2482(GenericTest):
         """
             verify restore snapshot completes
         """
-        # Wait for the MS node to become unreachable
-        ms_ip = self.get_node_att(self.ms_node, 'ipv4')
-        self.assertTrue(self.wait_for_ping(ms_ip, False, timeout_mins,
-                                           retry_count=2),
-                        "Node has not gone down")
-
-        # Wipe active SSH connections to force a reconnect
-        self.disconnect_all_nodes()
-
-        # Wait for MS to be reachable again after reboot
-        self.assertTrue(self.wait_for_node_up(self.ms_node))
-        # Wait for litpd service to be running
-        service_command = self.rhc.get_service_running_cmd('litpd')
-        self.assertTrue(self.wait_for_cmd(self.ms_node,
-                                          service_command,
-                                          0,
-                                          timeout_mins=5),
-                        "litpd service is not online")
-        # Wait for nodes to be reachable
-        for node in self.mn_nodes:
-            self.assertTrue(self.wait_for_node_up(node))
-
-        # Waiting for snapshot to merge
-        self.log('info', 'Waiting for snapshot to merge')
-        cmd = "/sbin/lvs | /bin/awk '{print $3}' | /bin/grep 'Owi'"
-        for node in self.mn_nodes + [self.ms_node]:
-            self.assertTrue(self.wait_for_cmd(node, cmd, 1,
-                              timeout_mins=timeout_mins, su_root=True))
+        # Wait for the MS node to become unreachable, then for the MS and
+        # all peer nodes to be reachable, litpd to be running and the
+        # snapshots to be merged
+        monitor = RestoreMonitor(self, self.ms_node, self.mn_nodes)
+        monitor.wait_for_ready(timeout_mins)
 
         self.execute_cli_showplan_cmd(self.ms_node)
         # Turn on debug
@@ -210,14 +194,11 @@ class Story2482(GenericTest):
     def _verify_grub_timestamp(self, nodes, grub_timestamp):
         """ Verify that the active grub file contains the timestamp """
         grub_file = test_constants.GRUB_CONFIG_FILE
-        cmd = self.rhcmd.get_grep_file_cmd(grub_file, grub_timestamp)
+        self.grub.collect(nodes, [grub_file])
         for node in nodes:
-            out, err, ret_code = self.run_command(node,
-                                                  cmd,
-                                                  su_root=True)
-            self.assertEqual(0, ret_code)
-            self.assertEqual([], err)
-            self.assertTrue(self.is_text_in_list(grub_timestamp, out))
+            self.assertTrue(self.grub.exists(node, grub_file))
+            self.assertTrue(self.grub.contains(node, grub_timestamp,
+                                               grub_file))
 
     def _cleanup_after_failed_restore(self):
         """
@@ -520,7 +501,7 @@ class Story2482(GenericTest):
 
         self.log('info',
                 'Set the snap_size of root fs on a managed node to be 1.')
-        self.backup_path_props(self.ms_node, fsystem['path'])
+        self.journal.track(fsystem['path'])
         self.execute_cli_update_cmd(self.ms_node,
                                     fsystem['path'],
                                     "snap_size=1")
@@ -548,7 +529,7 @@ class Story2482(GenericTest):
                 out, _, _ = self.run_command(fsystem['node_name'],
                         "/sbin/vgscan", default_asserts=True, su_root=True)
                 count -= 1
-                time.sleep(1)
+                self.fixtures.sleep(1)
 
             self.log('info', 'Run the litp restore_snapshot command')
             self.execute_cli_restoresnapshot_cmd(self.ms_node)
@@ -15,31 +15,40 @@ program(s) have been supplied.
 """
 import time
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from node_identity import NodeIdentityIndex
 from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
 from storage_utils import StorageUtils
+from snapshot_inventory import SnapshotInventory
+from grub_state import GrubState
 from vcs_utils import VCSUtils
 from rest_utils import RestUtils
 import test_constants
 
 
-class Story2777(GenericTest):
+class Story2777(InstrumentedTestMixin, GenericTest):
     """
     As a LITP User I want to restore to a VxVM snapshot that I have already
     taken, so that my system is in a known good state.
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         # 1. Call super class setup
         super(Story2777, self).setUp()
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.identity = NodeIdentityIndex(self, self.ms_node)
         self.mn_nodes = self.get_managed_node_filenames()
         self.timeout_mins = 10
         self.cli = CLIUtils()
         self.rhcmd = RHCmdUtils()
         self.storage = StorageUtils()
+        self.snapshot_inventory = SnapshotInventory(self)
+        self.grub = GrubState(self)
         self.vcs = VCSUtils()
         ms_ip = self.get_node_att(self.ms_node, 'ipv4')
         self.rest = RestUtils(ms_ip)
@@ -77,9 +86,10 @@ class Story2777(GenericTest):
     def _verify_grub_timestamp(self, nodes, grub_timestamp):
         """ Verify that the active grub file contains the timestamp """
         grub_file = test_constants.GRUB_CONFIG_FILE
+        self.grub.collect(nodes, [grub_file])
         for node in nodes:
-            out = self.get_file_contents(node, grub_file, su_root=True)
-            self.assertTrue(self.is_text_in_list(grub_timestamp, out))
+            self.assertTrue(self.grub.contains(node, grub_timestamp,
+                                               grub_file))
 
     def _set_lvm_snapshots(self, state):
         """
@@ -125,16 +135,10 @@ class Story2777(GenericTest):
             [volume['volume_group_name'] for volume
                 in self.get_all_volumes(self.ms_node)]
 
-        for dg_name in dg_names:
-            cmd = self.storage.get_vxsnap_cmd(dg_name, grep_args=grep_args)
-            for node in nodes:
-                out, err, ret_code = self.run_command(node, cmd, su_root=True)
-                self.assertEqual([], err)
-                self.assertTrue(ret_code < 2)
-                if out:
-                    for line in out:
-                        if '_snapshot' in line:
-                            sshots.append(line.split(" ")[0])
+        self.snapshot_inventory.collect(nodes, dg_names, grep_args)
+        for record in self.snapshot_inventory.find(grep_args):
+            if '_snapshot' in record.line:
+                sshots.append(record.name)
         return sshots
 
     def _create_package_inheritance(self, node_url, package_name, package_url):
@@ -213,8 +217,7 @@ class Story2777(GenericTest):
                 "/marker2777_{0}".format(timestamp)
 
             for node in self.mn_nodes:
-                node_in_file = \
-                    self.get_node_url_from_filename(self.ms_node, node)
+                node_in_file = self.identity.get_url(node)
                 if node_in_file in file_sys_dict['path']:
 
                     self.assertTrue(node,
@@ -268,8 +271,7 @@ class Story2777(GenericTest):
             file_path = file_sys_dict['mount_point'] + \
                 "/marker2777_{0}".format(timestamp)
             for node in self.mn_nodes:
-                node_in_file = \
-                    self.get_node_url_from_filename(self.ms_node, node)
+                node_in_file = self.identity.get_url(node)
                 if node_in_file in file_sys_dict['path']:
                     self.assertFalse(
                         self.remote_path_exists(node,
@@ -401,7 +403,7 @@ class Story2777(GenericTest):
                     _, _, rc = \
                         self.run_command(node, hastatus_cmd,
                                          su_root=True)
-                    time.sleep(10)
+                    self.fixtures.sleep(10)
                     timeout += 10
 
     @attr('all', 'revert', 'story2777', 'story2777_tc03',
@@ -452,8 +454,7 @@ class Story2777(GenericTest):
             #LVM
 
             lvm_node = self.mn_nodes[-1]
-            lvm_found_node_url = \
-                self.get_node_url_from_filename(self.ms_node, lvm_node)
+            lvm_found_node_url = self.identity.get_url(lvm_node)
 
             lvm_vg_id = \
                 (x['vg_item_id'] for x in
@@ -491,7 +492,7 @@ class Story2777(GenericTest):
             timestamp = self._mark_vxvm_file_system(fss, mark_file)
 
             log_path = test_constants.GEN_SYSTEM_LOG_PATH
-            log_len = self.get_file_len(self.ms_node, log_path)
+            self.log_watcher.mark()
 
             self.log('info', 'Create a snapshot of all nodes.')
             self.execute_and_wait_createsnapshot(self.ms_node)
@@ -503,9 +504,7 @@ class Story2777(GenericTest):
 
             self.log('info', 'Create/Inherit a package (telnet)')
             package_url = self._create_package("telnet", True)
-            found_node_url = \
-                self.get_node_url_from_filename(self.ms_node,
-                                                vx_node)
+            found_node_url = self.identity.get_url(vx_node)
             self._create_package_inheritance(found_node_url, "telnet",
                                              package_url)
 
@@ -522,8 +521,7 @@ class Story2777(GenericTest):
             self.log('info', 'Check litp logs contains info about '
                      'restore_snapshot.')
             log_msg = ("Restore_Snapshot Plan created")
-            self.assertTrue(self.wait_for_log_msg(self.ms_node, log_msg,
-                                                  log_len=log_len))
+            self.assertTrue(self.wait_for_log_msg(self.ms_node, log_msg))
 
             self.log('info',
                      'Verify that a plan on "Failed" state is found after '
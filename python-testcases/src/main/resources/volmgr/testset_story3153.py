@@ -14,9 +14,11 @@ program(s) have been supplied.
 
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from node_identity import NodeIdentityIndex
 
 
-class Story3153(GenericTest):
+class Story3153(InstrumentedTestMixin, GenericTest):
 
     '''
     As a LITP Plugin developer, I want the LVM configuration created
@@ -38,6 +40,7 @@ class Story3153(GenericTest):
         # 1. Call super class setup
         super(Story3153, self).setUp()
         self.test_node = self.get_management_node_filename()
+        self.identity = NodeIdentityIndex(self, self.test_node)
 
     def tearDown(self):
         """
@@ -115,8 +118,7 @@ class Story3153(GenericTest):
                 self.log("info", "ROOT VG: {0}".format(vg_name))
 
                 # RUN PVDISPLAY ON EACH NODE
-                test_node = self.get_node_filename_from_url(self.test_node,
-                                                            node_path)
+                test_node = self.identity.get_filename(node_path)
                 self.assertFalse(test_node is None)
                 cmd = "/sbin/vgdisplay | grep 'VG Name'"
                 stdout, stderr, exit_code = \
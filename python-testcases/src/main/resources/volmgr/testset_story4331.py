@@ -13,12 +13,22 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from model_journal import ModelJournal
 import test_constants
+from model_snapshot import ModelSnapshot
+from node_fanout import NodeFanout
+from disk_by_id import ByIdIndex
+from shared_disks import SharedDiskResolver
+from vx_topology import VxTopology
+from vxprint_parser import VxprintOutput
+from snapshot_names import SnapshotNames
+from size_utils import Size
 import math
 import re
 
 
-class Story4331(GenericTest):
+class Story4331(InstrumentedTestMixin, GenericTest):
     """
     As a LITP user, I want to support more than 1 Physical Device in a VxVM
     Volume Group (Disk Group), so that I can increase the available disk space
@@ -41,7 +51,12 @@ class Story4331(GenericTest):
 
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.journal = ModelJournal(self, self.ms_node)
+        self.journal.start()
         self.test_nodes = self.get_managed_node_filenames()
+        self.fanout = NodeFanout(self)
+        self.topology = VxTopology(self, self.test_nodes, self.fanout,
+                                   ping=False)
 
         self.node_urls = self.find(self.ms_node, "/deployments", "node")
         self.node_urls.sort()
@@ -99,21 +114,6 @@ class Story4331(GenericTest):
                 type_url_list.extend(type_urls)
         return type_url_list
 
-    @staticmethod
-    def get_fs_cache_name(fs_id, snap_name):
-        """
-        Function to compile the VCS cache name as it would appear in the
-        vxprint command output.
-        Args:
-            fs_id (str): id of the fs url.
-            snap_name (str): Name assigned to the snapshot.
-        Return:
-            str. The name of the snapshot cache as it appears in the console.
-        """
-        if snap_name == '':
-            return "LO{0}_".format(fs_id)
-        return "LO{0}_{1}".format(fs_id, snap_name)
-
     def verify_fs_cache(self, fs_urls, snap_name, expective_positive=True):
         """
         Function to verify the cache sizes created.
@@ -134,40 +134,42 @@ class Story4331(GenericTest):
             self.get_snap_plex_size(self.get_fs_size(fs_url),
                                     self.get_fs_snap_size(fs_url))
             fs_dict[fs_id]["cache_name"] = \
-            self.get_fs_cache_name(fs_id, snap_name)
+            SnapshotNames.get_cache_name(fs_id, snap_name)
 
-        console = self.get_vxprint_console_output()
+        vxprint = self.get_vxprint_output()
 
         for fs_id in fs_dict.keys():
-            self.assertTrue(self.is_text_in_list(fs_id, console))
+            volume = vxprint.get_volume(fs_id)
+            self.assertNotEqual(None, volume,
+                                "Volume {0} not found".format(fs_id))
             # VERIFY THAT THE CORRECT NUMBER OF PLEXES EXIST FOR THE FS
-            fs_index = \
-            [i for i, s in enumerate(console) if " {0} ".format(fs_id) in s][0]
-            self.assertTrue(fs_dict[fs_id]["size"] in console[fs_index])
+            self.assertEqual(fs_dict[fs_id]["size"], str(volume.length))
             # VERIFY THAT THE CORRECT NUMBER OF PLEXES EXIST FOR THE CACHE
-            cache_index = \
-            [i for i, s in enumerate(console)
-            if "{0}".format(fs_dict[fs_id]["cache_name"]) in s]
+            cache_name = fs_dict[fs_id]["cache_name"]
             if expective_positive == True:
-                self.assertTrue(fs_dict[fs_id]["snap_size"]
-                                in console[cache_index[0]])
+                cache_volume = vxprint.get_cache_volume(cache_name,
+                                                        volume.disk_group)
+                self.assertNotEqual(None, cache_volume,
+                                    "Cache {0} not found".format(cache_name))
+                self.assertEqual(fs_dict[fs_id]["snap_size"],
+                                 str(cache_volume.length))
             else:
-                self.assertEqual([], cache_index)
+                self.assertFalse(vxprint.has_cache(cache_name,
+                                                   volume.disk_group))
 
-    def get_vxprint_console_output(self):
+    def get_vxprint_output(self):
         """
-        Function to get the console output of vxprint.
+        Function to get the parsed vxprint output of all nodes.
         Returns:
-            str. The vxprint -vt console output.
+            VxprintOutput. The vxprint -vt records of all nodes.
         """
         # 6 FROM TEST BELOW
-        console_output = []
+        vxprint = VxprintOutput()
+        results = self.fanout.run(self.test_nodes, '/usr/sbin/vxprint -vt',
+                                  su_root=True)
         for node in self.test_nodes:
-            stdout, _, _ = \
-            self.run_command(node,
-                             '/usr/sbin/vxprint -vt', su_root=True)
-            console_output.extend(stdout)
-        return console_output
+            vxprint.add(results[node].stdout, node)
+        return vxprint
 
     def get_fs_size(self, fs_url):
         """
@@ -179,12 +181,7 @@ class Story4331(GenericTest):
         """
         fs_props = \
         self.get_props_from_url(self.ms_node, fs_url)
-        fs_size = fs_props["size"]
-
-        if "G" in fs_size:
-            return self.convert_to_mb(fs_size)
-        else:
-            return fs_size[:-1]
+        return self.convert_to_mb(fs_props["size"])
 
     @staticmethod
     def get_plex_size(fs_size):
@@ -195,7 +192,7 @@ class Story4331(GenericTest):
         Returns:
             str. The plex size of the file system.
         """
-        return str(int(float(fs_size) * 1024 * 2))
+        return str(Size.parse(fs_size + 'M').sectors)
 
     @staticmethod
     def get_snap_plex_size(fs_size, snap_size):
@@ -207,7 +204,7 @@ class Story4331(GenericTest):
         Returns:
             str. The plex size of the cache.
         """
-        return str(int(float(fs_size) * float(snap_size) / 100) * 1024 * 2)
+        return str(Size.parse(fs_size + 'M').percent(snap_size).sectors)
 
     @staticmethod
     def strip_fs_id_from_litp_url(fs_url):
@@ -235,31 +232,29 @@ class Story4331(GenericTest):
         """
         Description:
             Function to retrieve a dictionary of the file systems which
-            reside below each node.
+            reside below each node. The LITP model is read once into a
+            ModelSnapshot and all lookups are served from it.
         Args:
             vol_driver (str): The volume driver under test, lvm or vxvm.
         Returns:
             dict. A dictionary of all the file systems below each node.
         """
-        #storage_profiles = \
-        #self.get_storage_profile_paths(self.ms_node, vol_driver)
-        storage_profiles = \
-        self.get_storage_profile_paths(self.ms_node, vol_driver)
-        # self.get_storage_profiles_from_litp_model(vol_driver)
-        file_sys_dict = {}
+        model = ModelSnapshot(self, self.ms_node)
+        storage_profiles = model.get_storage_profile_paths(vol_driver)
         all_file_systems = []
+        file_sys_dict = {}
         for storage_profile in storage_profiles:
             volume_groups = \
-            self.get_all_vol_grps_from_storage_profile(storage_profile)
+            self.get_all_vol_grps_from_storage_profile(storage_profile, model)
             for volume_group in volume_groups:
                 all_file_systems.extend(self.get_all_file_sys_from_vol_grp(
-                                        volume_group))
+                                        volume_group, model))
         for file_sys in all_file_systems:
             file_sys_dict = \
-            self.compile_dict(file_sys, file_sys_dict, vol_driver)
+            self.compile_dict(file_sys, file_sys_dict, vol_driver, model)
         return file_sys_dict
 
-    def compile_dict(self, url, fs_dict, vol_driver='lvm'):
+    def compile_dict(self, url, fs_dict, vol_driver='lvm', model=None):
         """
         Description:
             Function to compile a dictionary identifying the file systems
@@ -271,24 +266,23 @@ class Story4331(GenericTest):
             fs_dict (dict): The dictionary to be populated.
             vol_driver (str): The volume driver of the storage profile parent;
                               Could be lvm or vxvm.
+            model (ModelSnapshot): Snapshot of the model; one is taken
+                                   if not given.
         Returns:
             dict. A dictionary of all the file systems below each node.
         """
+        if model is None:
+            model = ModelSnapshot(self, self.ms_node)
         if vol_driver == 'lvm':
-            url_list = url.split('/')
-            node_index = url_list.index('nodes')
-            # LIST COMPREHENSION TO COMPILE NODE URL FROM CHILD URL PROVIDED
-            node_url = \
-            "".join(["/" + x for x in url_list[:node_index + 2] if x != ''])
-
-            fs_dict = self.populate_dict(url, node_url, fs_dict)
+            node_url = model.get_node_url_from_child_url(url)
+            fs_dict = self.populate_dict(url, node_url, fs_dict, model)
         else:
             for node_url in self.node_urls:
-                fs_dict = self.populate_dict(url, node_url, fs_dict)
+                fs_dict = self.populate_dict(url, node_url, fs_dict, model)
 
         return fs_dict
 
-    def populate_dict(self, fs_url, node_url, fs_dict):
+    def populate_dict(self, fs_url, node_url, fs_dict, model=None):
         """
         Description:
             Function to populate a dictionary identifying the file systems
@@ -298,50 +292,58 @@ class Story4331(GenericTest):
             fs_url (str): A url of the file system object.
             node_url (str): A url of the node object.
             dict (dict): The dictionary to be populated.
+            model (ModelSnapshot): Snapshot of the model; one is taken
+                                   if not given.
         Returns:
             dict. A dictionary of all the file systems below each node.
         """
-        hostname = self.get_props_from_url(self.ms_node, node_url, 'hostname')
+        if model is None:
+            model = ModelSnapshot(self, self.ms_node)
+        hostname = model.get_props_from_url(node_url, 'hostname')
 
         if hostname not in fs_dict.keys():
             fs_dict[hostname] = {}
-        stdout = \
-        self.get_props_from_url(self.ms_node, fs_url)
-        snap_external = 'false'
-        if 'snap_external' in stdout:
-            snap_external = \
-            self.get_props_from_url(self.ms_node, fs_url, 'snap_external')
+        props = model.get_props_from_url(fs_url)
+        snap_external = props.get('snap_external', 'false')
         if snap_external not in fs_dict[hostname].keys():
             fs_dict[hostname][snap_external] = {}
-        stdout = self.get_props_from_url(self.ms_node, fs_url, 'type')
-        if stdout not in fs_dict[hostname][snap_external].keys():
-            fs_dict[hostname][snap_external][stdout] = []
-        fs_dict[hostname][snap_external][stdout].append(fs_url)
+        fs_type = props.get('type')
+        if fs_type not in fs_dict[hostname][snap_external].keys():
+            fs_dict[hostname][snap_external][fs_type] = []
+        fs_dict[hostname][snap_external][fs_type].append(fs_url)
         return fs_dict
 
-    def get_all_file_sys_from_vol_grp(self, url):
+    def get_all_file_sys_from_vol_grp(self, url, model=None):
         """
         Description:
             Function to retrieve all of the file system objects residing
             below the provided volume group object.
         Args:
             url (str): A url of the volume group object.
+            model (ModelSnapshot): Snapshot of the model to search; the
+                                   LITP model is queried if not given.
         Returns:
             list. A list of all the file system objects found.
         """
+        if model:
+            return model.find(url, "file-system")
         stdout = self.find(self.ms_node, url, "file-system")
         return stdout
 
-    def get_all_vol_grps_from_storage_profile(self, url):
+    def get_all_vol_grps_from_storage_profile(self, url, model=None):
         """
         Description:
             Function to retrieve all of the volume group object residing
             below the provided storage profile url.
         Args:
             url (str): A url to a storage profile object.
+            model (ModelSnapshot): Snapshot of the model to search; the
+                                   LITP model is queried if not given.
         Returns:
             list. A list of all of the volume group objects found.
         """
+        if model:
+            return model.find(url, "volume-group")
         stdout = self.find(self.ms_node, url, "volume-group")
         return stdout
 
@@ -409,15 +411,12 @@ class Story4331(GenericTest):
     @staticmethod
     def convert_to_mb(size):
         """
-        Converts given size to M
+        Converts given size to M. A size without a unit is taken to be
+        in M already and is returned unchanged.
         """
-        if "G" in size:
-            value, _ = size.split("G")
-            value = int(value)
-            value *= 1024
-            size = str(value)
-
-        return size
+        if size[-1].isdigit():
+            return size
+        return str(Size.parse(size).whole_units('M'))
 
     def get_vol_grp_disks(self, vol_grp_urls):
         """
@@ -495,7 +494,7 @@ class Story4331(GenericTest):
                                       search_type='true')
 
         for vx_url in list(set(vxfs_url_list_1)):
-            self.backup_path_props(self.ms_node, vx_url)
+            self.journal.track(vx_url)
             stdout, stderr, returnc = \
             self.execute_cli_update_cmd(self.ms_node, vx_url,
                                         props='snap_external=false')
@@ -508,7 +507,7 @@ class Story4331(GenericTest):
                                       search_type='false')
 
         for vx_url in vxfs_url_list_2:
-            self.backup_path_props(self.ms_node, vx_url)
+            self.journal.track(vx_url)
         all_vxfs_list = []
         all_vxfs_list.extend(list(set(vxfs_url_list_1)))
         all_vxfs_list.extend(list(set(vxfs_url_list_2)))
@@ -610,116 +609,26 @@ class Story4331(GenericTest):
             dict. A dictionary with Key of the disk name and value of the uuid.
         """
         cmd = self.get_vxdisk_list("-e -o alldgs")
-        nodes_disks = {}
-        for node in self.test_nodes:
-            stdout, _, _ = \
-            self.run_command(node, cmd, su_root=True)
-            nodes_disks[node] = stdout
-        disks_list = self.compile_all_nodes_disks(nodes_disks, volg_grp_ids)
-
-        # ASSERT THAT NO UNASSIGNED SHARED DISKS EXISTS.
-        self.assertNotEqual({}, disks_list)
-        shared_disks = set.intersection(disks_list)
-        # shared_disks = set.intersection(*disks_list)
-        # star gives a pylint error
-        # untested without star wildcard.
+        results = self.fanout.run(self.test_nodes, cmd, su_root=True)
+        nodes_disks = dict((node, results[node].stdout)
+                           for node in self.test_nodes)
+        shared_disks = \
+            SharedDiskResolver(volg_grp_ids).resolve(nodes_disks)
 
         # ASSERT THAT AT LEAST ONE SHARED DISK HAS BEEN FOUND
-        self.assertNotEqual(0, len(shared_disks))
-        disk_names = \
-        self.get_local_disks_from_vxvm_for_shared_disks(
-                                            nodes_disks[self.test_nodes[0]],
-                                            shared_disks)
-
-        cmd = "/bin/ls -la /dev/disk/by-id"
-        stdout, _, _ = self.run_command(self.test_nodes[0], cmd, su_root=True)
-        relevant_entries = []
-        relevant_dict = {}
-        for line in stdout:
-            for disk in disk_names:
-                if re.search(disk + "$", line) and not re.search("wwn", line):
-                    relevant_entries.append(line)
-                    relevant_dict[line] = disk
-        scsi_entries = []
-        scsi_dict = {}
-        for entry in relevant_entries:
-            split_list = entry.split(" ")
-            tidied_list = [x for x in split_list if x != ""]
-            scsi_entries.append(tidied_list[8])
-            scsi_dict[relevant_dict[entry]] = tidied_list[8]
+        self.assertNotEqual({}, shared_disks)
+
+        # THE DISKS ARE KEYED BY THEIR NAME ON THE FIRST NODE, ON WHICH
+        # THEIR SIZE IS READ
+        by_id = ByIdIndex.collect(self.fanout, self.test_nodes)
         uuid_dict = {}
-        for disk in scsi_dict.keys():
-            uuid_dict[disk] = self.strip_uuid_from_scsi_entry(scsi_dict[disk])
+        for disk in shared_disks.values():
+            found = disk.find_by_id(by_id, self.test_nodes)
+            if found is not None:
+                uuid_dict[disk.devices[self.test_nodes[0]]] = found[2]
 
         return uuid_dict
 
-    @staticmethod
-    def strip_uuid_from_scsi_entry(scsi_entry):
-        """
-        Description:
-            Function to strip the uuid value used in LITP from the Linux
-            disk representation.
-        Args:
-            scsi_entry (str): The Linux representation of the disk.
-        Returns
-            str. The uuid used by LITP during the disk object creation.
-        """
-        return scsi_entry.split("-")[1][1:]
-
-    @staticmethod
-    def get_local_disks_from_vxvm_for_shared_disks(vxdisk_console,
-                                                   shared_disks):
-        """
-        Description:
-            Function to strip the Linux disk names from the vxvm console.
-        Args:
-            vxdisk_console (list): The output of the vxdisk list console.
-            shared_disks (list): The name of the shared disks as they appear
-                                 in the vxdisk console output.
-        Returns:
-        list. The Linux names of the shared disks.
-        """
-        entries = [entry for entry in vxdisk_console
-                   for disk in shared_disks if disk in entry]
-        disk_names = []
-        for entry in entries:
-            split_list = entry.split(" ")
-            tidied_list = [x for x in split_list if x != ""]
-            disk_names.append(tidied_list[6])
-        return disk_names
-
-    @staticmethod
-    def compile_all_nodes_disks(nodes_disks, vg_ids):
-        """
-        Description:
-            Function to get all the disks on the nodes which have not
-            been designated for use with LVM, or assigned to a vxvm volume
-            group.
-        Args:
-            nodes_disks (list): List of all the shared disks.
-            vg_ids (list): The ids of all the volume groups of type vxvm as
-                           they appear in the LITP model.
-        Returns:
-            list. A list of disk names as they appear in the vxdisk console.
-        """
-        disks_list = []
-        for node in nodes_disks.keys():
-            disks = []
-            node_disks = nodes_disks[node]
-            for disk_entry in node_disks:
-                if "DEVICE" in disk_entry or "LVM" in disk_entry:
-                    continue
-                # CHECK TO ENSURE THAT THE DISK ISN'T ALREADY ASSIGNED TO A
-                # VOLUME GROUP.
-                disk_assigned = [str for vg in vg_ids if vg in disk_entry]
-                if disk_assigned != []:
-                    continue
-                disk = disk_entry.split(":")[0].split(' ')[0]
-                if disk not in disks:
-                    disks.append(disk)
-            disks_list.append(set(disks))
-        return disks_list
-
     @staticmethod
     def get_vxdisk_list(args=""):
         """
@@ -731,17 +640,6 @@ class Story4331(GenericTest):
         """
         return "/sbin/vxdisk {0} list".format(args)
 
-    @staticmethod
-    def get_vxdg_list(args=""):
-        """
-        Function to pass options to vxdg list command.
-        Args:
-            args (str): The optional argument to be passed.
-        Returns:
-            str. The command with or without the optional argument.
-        """
-        return "/sbin/vxdg {0} list".format(args)
-
     def get_active_node_for_vol_grp(self, vol_grp):
         """
         Function to get the active node from the output of vxdg command.
@@ -751,19 +649,11 @@ class Story4331(GenericTest):
         Returns:
             str. The name of the active node.
         """
-        active_node_found = False
-        self.test_nodes = self.get_managed_node_filenames()
-        for node in self.test_nodes:
-            stdout, _, _ = \
-            self.run_command(node,
-                                 self.get_vxdg_list(), su_root=True)
-            updated_stdout = []
-            for item in stdout:
-                split_list_item = item.split(" ")
-                updated_stdout.extend(split_list_item)
-            if vol_grp in updated_stdout:
-                return node
-        self.assertTrue(active_node_found)
+        node = self.topology.get_owner(vol_grp)
+        self.assertNotEqual(None, node,
+                            "Disk group {0} is not imported on any "
+                            "node".format(vol_grp))
+        return node
 
     @staticmethod
     def get_vxassist_maxsize_cmd(vol_grp, args=""):
@@ -838,7 +728,7 @@ class Story4331(GenericTest):
         Returns:
             str. The size of the blocks in MB.
         """
-        return str(int(blocks) / 1024 / 1024)
+        return str(Size.parse(blocks).whole_units('M'))
 
     def get_vol_grp_file_sys_sizes(self, all_vxfs_list):
         """
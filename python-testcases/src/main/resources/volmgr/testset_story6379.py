@@ -13,16 +13,19 @@ program(s) have been supplied.
             easily identify/audit snapshots later.
 """
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
 from storage_utils import StorageUtils
 import test_constants
 
 
-class Story6379(GenericTest):
+class Story6379(InstrumentedTestMixin, GenericTest):
     """
     As a LITP User I want ability to specify a name tag to the create_snapshot
     command so that I can easily identify/audit snapshots later.
     """
 
+    WATCH_LOG = True
+
     def setUp(self):
         """Setup variables for every test"""
         # 1. Call super class setup
@@ -121,8 +124,7 @@ class Story6379(GenericTest):
         """
         success = True
         index = 1
-        log_path = test_constants.GEN_SYSTEM_LOG_PATH
-        log_len = self.get_file_len(self.ms_node, log_path)
+        self.log_watcher.mark()
 
         self.log('info',
             'Create snapshots until Volume Group is full and plan fails.')
@@ -143,8 +145,7 @@ class Story6379(GenericTest):
                 log_msg = ('has insufficient free space')
 
                 self.assertTrue(self.wait_for_log_msg(
-                        self.ms_node, log_msg, timeout_sec=20,
-                        log_len=log_len))
+                        self.ms_node, log_msg, timeout_sec=20))
 
                 self.assertEqual(self.get_item_state(self.ms_node,
                     "/snapshots/{0}".format(ss_name)), "Initial")
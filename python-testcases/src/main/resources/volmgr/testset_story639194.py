@@ -12,11 +12,12 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
-from redhat_cmd_utils import RHCmdUtils
+from instrumented_test import InstrumentedTestMixin
+from grub_state import GrubState
 import test_constants
 
 
-class Story639194(GenericTest):
+class Story639194(InstrumentedTestMixin, GenericTest):
     """
        As a Litp user I want to add all LVs to the
            kernel boot command in GRUB config
@@ -26,71 +27,33 @@ class Story639194(GenericTest):
         """Setup variables for every test"""
         super(Story639194, self).setUp()
 
-        self.rh_os = RHCmdUtils()
         self.ms_node = self.get_management_node_filename()
         self.mn_nodes = self.get_managed_node_filenames()
-
-        self.grub_default_file = "/etc/default/grub"
-        self.grub_sfha_file = "/etc/grub.d/03_vxdmp_config_script"
-
-        self.vmlinuz = " vmlinuz "
-        self.cmdline = " GRUB_CMDLINE_LINUX "
+        self.grub = GrubState(self)
 
     def tearDown(self):
         """Runs for every test"""
         super(Story639194, self).tearDown()
 
-    def execute_grep(self, node, cmd, present=True):
+    def check_grub_files(self, fss, present=True):
         """
         Description:
-            Function to execute grep command
+            Function to check contents of grub files: the vmlinuz lines
+            of grub.cfg and the sfha grub file, and the cmd line of the
+            default grub file, on all MNs
         Args:
-            node (str): node to run command on
-            cmd (str): grep command
-            present (Boolean): flag which indicates if grep
-                               should be success or not
-        Returns:
-            None
-        """
-        stdout, stderr, rc = self.run_command(node, cmd, su_root=True)
-        if present == True:
-            self.assertEqual(0, rc)
-            self.assertEqual([], stderr)
-            self.assertNotEqual([], stdout)
-        else:
-            self.assertEqual(1, rc)
-            self.assertEqual([], stderr)
-            self.assertEqual([], stdout)
-
-    def check_grub_files(self, fs_name, node, present=True):
-        """
-        Description:
-            Function to check contents of grub files
-        Args:
-            fs_name (str)    : FS name to check for
-            node (str)       : node to run command on
+            fss (list)       : (VG id, FS id) of the FS to check for
             present (Boolean): flag which indicates if FS
-                               should be in the grub file or not
+                               should be in the grub files or not
         Returns:
             None
         """
-
-        # Check vmlinuz lines in grub.cfg
-        cmd = self.rh_os.grep_path + self.vmlinuz + \
-               test_constants.GRUB_CONFIG_FILE + "| " + \
-               self.rh_os.grep_path + " " + fs_name
-        self.execute_grep(node, cmd, present)
-
-        # Check vmlinuz lines in sfha grub file
-        cmd = self.rh_os.grep_path + self.vmlinuz + \
-               self.grub_sfha_file + "| " + self.rh_os.grep_path + \
-               " " + fs_name
-        self.execute_grep(node, cmd, present)
-
-        # Check cmd line default grub file
-        cmd = self.rh_os.grep_path + self.cmdline + self.grub_default_file + \
-               "| " + self.rh_os.grep_path + " " + fs_name
-        self.execute_grep(node, cmd, present)
+        self.grub.collect(self.mn_nodes, GrubState.LV_FILES)
+        for node in self.mn_nodes:
+            for path in GrubState.LV_FILES:
+                self.assertTrue(self.grub.exists(node, path),
+                                "{0} not found on {1}".format(path, node))
+        self.grub.verify_lvs(fss, present)
 
     @attr('all', 'revert', 'story639194', 'story639194_tc20', 'kgb-physical')
     def test_20_p_update_grub_lv_enable(self):
@@ -118,17 +81,20 @@ class Story639194(GenericTest):
         # Get list of FS names in model
         # Get a list of all FS
         # Get a list of all FS other than root and swap
-        list_volumes = self.get_all_volumes(self.ms_node, vol_driver='lvm')
+        list_volumes = [volume for volume in
+                        self.get_all_volumes(self.ms_node, vol_driver='lvm')
+                        if volume['node_name'] in self.mn_nodes]
         self.assertTrue(len(list_volumes) > 0)
         fs_names = list()
         non_root_swap_fs_names = list()
         root_swap_name = ("root", "swap")
         for volume in list_volumes:
-            fs_name = volume['volume_name']
-            if fs_name not in root_swap_name:
+            fs_name = (volume['vg_item_id'], volume['volume_name'])
+            if fs_name in fs_names:
+                continue
+            if volume['volume_name'] not in root_swap_name:
                 non_root_swap_fs_names.append(fs_name)
-            if fs_name not in fs_names:
-                fs_names.append(fs_name)
+            fs_names.append(fs_name)
 
         vcs_cluster_url = self.find(self.ms_node,
                                          "/deployments", "vcs-cluster")[-1]
@@ -141,9 +107,7 @@ class Story639194(GenericTest):
 
         # Check contents of three grub files on MNs
         # files should not contain non root or swap FS
-        for fs_name in non_root_swap_fs_names:
-            for node in self.mn_nodes:
-                self.check_grub_files(fs_name, node, False)
+        self.check_grub_files(non_root_swap_fs_names, False)
 
         self.log("info", "Update grub_lv_enable to true")
         self.execute_cli_update_cmd(self.ms_node,
@@ -167,6 +131,4 @@ class Story639194(GenericTest):
 
         # Check contents of three grub files on MNs
         # Each file should contain reference to each FS
-        for fs_name in fs_names:
-            for node in self.mn_nodes:
-                self.check_grub_files(fs_name, node)
+        self.check_grub_files(fs_names)
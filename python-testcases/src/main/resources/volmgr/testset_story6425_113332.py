@@ -13,10 +13,15 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from model_journal import ModelJournal
+from node_fanout import NodeFanout
 import random
+from vxprint_parser import VxprintOutput
+from size_utils import Size
 
 
-class Story6425(GenericTest):
+class Story6425(InstrumentedTestMixin, GenericTest):
     """
     LITPCDS-6425
     As a LITP user I want to be able to set snap_size percentage on
@@ -46,7 +51,10 @@ class Story6425(GenericTest):
 
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
+        self.journal = ModelJournal(self, self.ms_node)
+        self.journal.start()
         self.test_nodes = self.get_managed_node_filenames()
+        self.fanout = NodeFanout(self)
 
         self.node_urls = self.find(self.ms_node, "/deployments", "node")
         self.node_urls.sort()
@@ -168,11 +176,13 @@ class Story6425(GenericTest):
             snap_name (str): Name assigned to the snapshot.
             expective_positive (bool): Flag to check existence of cache.
         """
-        console = self.get_vxprint_console_output()
+        vxprint = self.get_vxprint_output()
 
         for fsystem in fss:
-            self.assertTrue(
-                    self.is_text_in_list(fsystem['vg_item_id'], console))
+            volume = vxprint.get_volume(fsystem['volume_name'],
+                                        fsystem['volume_group_name'])
+            self.assertNotEqual(None, volume, "Volume {0} not found".format(
+                                fsystem['volume_name']))
             fs_size_in_mb = self.sto.convert_size_to_megabytes(fsystem['size'])
             fs_plex_size = self.get_plex_size(fs_size_in_mb)
             fs_cache_name = "LO{0}_{1}".format(
@@ -181,33 +191,32 @@ class Story6425(GenericTest):
                     fsystem, snap_name)
 
             # VERIFY THAT THE CORRECT NUMBER OF PLEXES EXIST FOR THE FS
-            fs_index = \
-            [i for i, s in enumerate(console) if
-                " {0}".format(fsystem['volume_name']) in s][0]
-            self.assertTrue(fs_plex_size in console[fs_index])
+            self.assertEqual(fs_plex_size, str(volume.length))
             # VERIFY THAT THE CORRECT NUMBER OF PLEXES EXIST FOR THE CACHE
-            cache_index = [i for i, s in enumerate(console)
-                    if "{0}".format(fs_cache_name) in s]
             if expective_positive == True:
                 # use backup snap size for named snapshots if it is set
-                self.assertTrue(fs_snap_size in console[cache_index[0]])
+                cache_volume = vxprint.get_cache_volume(
+                        fs_cache_name, fsystem['volume_group_name'])
+                self.assertNotEqual(None, cache_volume,
+                        "Cache {0} not found".format(fs_cache_name))
+                self.assertEqual(fs_snap_size, str(cache_volume.length))
             else:
-                self.assertEqual([], cache_index)
+                self.assertFalse(vxprint.has_cache(
+                        fs_cache_name, fsystem['volume_group_name']))
 
-    def get_vxprint_console_output(self):
+    def get_vxprint_output(self):
         """
-        Function to get the console output of vxprint.
+        Function to get the parsed vxprint output of all nodes.
         Returns:
-            str. The vxprint -vt console output.
+            VxprintOutput. The vxprint -vt records of all nodes.
         """
         # 6 FROM TEST BELOW
-        console_output = []
+        vxprint = VxprintOutput()
+        results = self.fanout.run(self.test_nodes, '/usr/sbin/vxprint -vt',
+                                  su_root=True)
         for node in self.test_nodes:
-            stdout, _, _ = \
-            self.run_command(node,
-                             '/usr/sbin/vxprint -vt', su_root=True)
-            console_output.extend(stdout)
-        return console_output
+            vxprint.add(results[node].stdout, node)
+        return vxprint
 
     @staticmethod
     def get_plex_size(fs_size):
@@ -218,7 +227,7 @@ class Story6425(GenericTest):
         Returns:
             str. The plex size of the file system.
         """
-        return str(int(float(fs_size) * 1024 * 2))
+        return str(Size.from_units(fs_size, 'M').sectors)
 
     @staticmethod
     def get_snap_plex_size(fs_size, fsystem, snap_name):
@@ -236,7 +245,7 @@ class Story6425(GenericTest):
             snap_size = fsystem['backup_snap_size']
         else:
             snap_size = fsystem['snap_size']
-        return str(int(float(fs_size) * float(snap_size) / 100) * 1024 * 2)
+        return str(Size.from_units(fs_size, 'M').percent(snap_size).sectors)
 
     def set_snap_size(self, fss, prop, value=None):
         """
@@ -296,7 +305,7 @@ class Story6425(GenericTest):
         fss = self.get_all_volumes(self.ms_node)
 
         for fsystem in fss:
-            self.backup_path_props(self.ms_node, fsystem['path'])
+            self.journal.track(fsystem['path'])
 
         self.assertNotEqual([], fss)
 
@@ -13,14 +13,18 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from model_journal import ModelJournal
 from litp_cli_utils import CLIUtils
 from storage_utils import StorageUtils
+from node_fanout import NodeFanout
+from snapshot_inventory import SnapshotInventory
 import test_constants
 import time
 import os
 
 
-class Story7193(GenericTest):
+class Story7193(InstrumentedTestMixin, GenericTest):
     """
     LITPCDS-7193
     As a LITP User
@@ -40,11 +44,15 @@ class Story7193(GenericTest):
         # 2. Set up variables used in the test
         self.ms_nodes = self.get_management_node_filenames()
         self.ms_node = self.ms_nodes[0]
+        self.journal = ModelJournal(self, self.ms_node)
+        self.journal.start()
         self.mn_nodes = self.get_managed_node_filenames()
         self.all_nodes = self.ms_nodes + self.mn_nodes
         self.timeout_mins = 10
         self.cli = CLIUtils()
         self.storage = StorageUtils()
+        self.fanout = NodeFanout(self)
+        self.snapshot_inventory = SnapshotInventory(self, self.fanout)
 
     def tearDown(self):
         """Runs for every test"""
@@ -67,20 +75,12 @@ class Story7193(GenericTest):
         sshots = []
         dg_names = [vg["volume_group_name"] for vg in
                 self.get_all_volumes(self.ms_node)]
-        for dg_name in dg_names:
-            cmd = self.storage.get_vxsnap_cmd(dg_name, grep_args="L_")
-            for node in nodes:
-                out, err, ret_code = self.run_command(node, cmd, su_root=True)
-                self.assertEqual([], err)
-                self.assertTrue(ret_code < 2)
-                if out:
-                    for line in out:
-                        if 'L_' in line:
-                            if not full_path:
-                                sshots.append(line.split(" ")[0])
-                            else:
-                                sshots.append([line.split(" ")[0],
-                                    dg_name, node])
+        self.snapshot_inventory.collect(nodes, dg_names, 'L_')
+        for record in self.snapshot_inventory.find('L_'):
+            if not full_path:
+                sshots.append(record.name)
+            else:
+                sshots.append([record.name, record.disk_group, record.node])
         return sshots
 
     def _create_named_snapshot(self, ss_name):
@@ -107,10 +107,9 @@ class Story7193(GenericTest):
         """ reduce snap sizes"""
         for fsys in fss:
             if fsys["type"] == "xfs":
-                self.backup_path_props(self.ms_node, fsys["path"])
-                cmd = self.cli.get_update_cmd(fsys["path"],
-                                              "snap_size=1")
-                self.run_command(self.ms_node, cmd, default_asserts=True)
+                self.journal.track(fsys["path"])
+                self.execute_cli_update_cmd(self.ms_node, fsys["path"],
+                                            props="snap_size=1")
 
     def _get_grub_dir_contents(self):
         """ Get the Grub directory contents """
@@ -189,7 +188,7 @@ class Story7193(GenericTest):
             if fsystem['type'] != 'xfs':
                 continue
 
-            self.backup_path_props(self.ms_node, fsystem['path'])
+            self.journal.track(fsystem['path'])
             # only update some file systems
             if dont_add_backup_snap_size:
                 # leave one fs without backup_snap_size
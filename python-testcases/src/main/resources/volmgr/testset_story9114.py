@@ -24,17 +24,17 @@ import re
 import test_constants
 
 from litp_generic_test import GenericTest, attr
+from instrumented_test import InstrumentedTestMixin
+from size_utils import Size, split_size, smaller_unit
 
 
-class Story9114(GenericTest):
+class Story9114(InstrumentedTestMixin, GenericTest):
     """
     As a LITP User I want to increase the size of a VxVM volume and the
     filesystem that lives on it, so that I can allocate more space for my
     application
     """
 
-    exponents = {'P': 5, 'T': 4, 'G': 3, 'M': 2, 'K': 1, '': 0}
-
     def setUp(self):
         """
         Description:
@@ -137,68 +137,6 @@ class Story9114(GenericTest):
         vxfs_props = self.get_props_from_url(self.ms_node, vxfs)
         return vxfs_props["size"]
 
-    @staticmethod
-    def _convert_to_bytes(str_rep, unit):
-        """
-        Description:
-            Convert a string representation of a file-system size to bytes.
-
-        Args:
-            str_rep (str): numeric part of size represented as a string
-            unit (str): size unit
-
-        Returns:
-            Integer value representing bytes
-        """
-        exp = Story9114.exponents[unit.upper()]
-        return int(float(str_rep) * (1024 ** exp))
-
-    @staticmethod
-    def _convert_bytes_to_unit(byte_rep, unit):
-        """
-        Description:
-            Converts a value in bytes to a specific unit size.
-
-        Args:
-            byte_rep (byte): the byte representation as an integer.
-            unit (str): the unit as a string.
-
-        Returns:
-            Float value of byte scaled to the specified unit.
-        """
-        exp = Story9114.exponents[unit.upper()]
-        return float(byte_rep) / (1024.0 ** exp)
-
-    @staticmethod
-    def _prefer_smaller_units(value_unit, delta_unit):
-        """
-        Description:
-            When increasing the size of a value by an amount, the units should
-            be consistent. For LITP we should prefer smaller units as all size
-            values should be represented as integers.
-
-            Therefore, always prefer smaller units to larger ones when
-            doing a sum.
-
-        Args:
-            value_unit (str): the unit of the value we wish to change
-            delta_unit (str): the unit of the difference ie the delta.
-
-        Returns:
-            string value representing the required unit value.
-        """
-        if Story9114.exponents[value_unit] == \
-           Story9114.exponents[delta_unit]:
-            return value_unit
-        elif Story9114.exponents[value_unit] < \
-             Story9114.exponents[delta_unit]:
-            return value_unit
-        elif Story9114.exponents[value_unit] > \
-             Story9114.exponents[delta_unit]:
-            return delta_unit
-        else:
-            return None
-
     @staticmethod
     def _increase(volume_size, by_amount):
         """
@@ -213,25 +151,18 @@ class Story9114(GenericTest):
         Returns:
             string representation of the augmented value.
         """
-        pattern = r'^(\d+\.?\d*)([KMGkmg]?)$'
-        pattern_matches = re.match(pattern, volume_size)
-        str_x, unit_x = pattern_matches.groups()
-        pattern_matches = re.match(pattern, by_amount)
-        str_d, unit_d = pattern_matches.groups()
-        bytes_x = Story9114._convert_to_bytes(str_x, unit_x)
-        bytes_d = Story9114._convert_to_bytes(str_d, unit_d)
-        increased_bytes = bytes_x + bytes_d
-        unit = Story9114._prefer_smaller_units(unit_x, unit_d)
-        new_size = Story9114._convert_bytes_to_unit(increased_bytes, unit)
+        _, unit_x = split_size(volume_size)
+        _, unit_d = split_size(by_amount)
+        increased = Size.parse(volume_size) + Size.parse(by_amount)
         # can only be integer size in LITP
-        return str(int(new_size)) + unit
+        return increased.to_litp(smaller_unit(unit_x, unit_d))
 
     @staticmethod
     def _convert_string_size(v_size):
         """
         Description:
             Convert a string representation of a size value to a numeric part
-            and the unit part of the representation using regular expressions.
+            and the unit part of the representation.
 
         Args:
             v_size (str): string representation of size.
@@ -240,10 +171,7 @@ class Story9114(GenericTest):
             - Float value representing the numeric part of the size.
             - String value representing the unit part of the size.
         """
-        pattern = r'^(\d+\.?\d*)([KMGkmg]?)$'
-        pattern_matches = re.match(pattern, v_size)
-        str_size, unit = pattern_matches.groups()
-        return float(str_size), unit.upper()
+        return split_size(v_size)
 
     @staticmethod
     def _sizes_are_equal(size_x, size_y):
@@ -260,11 +188,7 @@ class Story9114(GenericTest):
         Returns:
             boolean indicating equality.
         """
-        num_x, str_x = Story9114._convert_string_size(size_x)
-        num_y, str_y = Story9114._convert_string_size(size_y)
-        bytes_x = Story9114._convert_to_bytes(num_x, str_x)
-        bytes_y = Story9114._convert_to_bytes(num_y, str_y)
-        return bytes_x == bytes_y
+        return Size.parse(size_x) == Size.parse(size_y)
 
     @staticmethod
     def _get_name_from_url(resource, url):
@@ -0,0 +1,236 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Snapshot of the VCS service groups of a cluster. The Parallel
+            attribute and the state of every group on every system are
+            read with one "hagrp -display -attribute" call. Failover
+            groups are switched to a node in one batch, and a single
+            remote execution waits for all of them to come online there.
+'''
+
+from vcs_utils import VCSUtils
+from remote_session import RemoteSession
+
+
+class VcsGroup(object):
+    """
+    A VCS service group.
+    """
+
+    __slots__ = ('name', 'parallel_value', 'states')
+
+    def __init__(self, name):
+        """
+        Description:
+            Creates a group with no attributes read yet.
+        Args:
+            name (str): The group name.
+        """
+        self.name = name
+        self.parallel_value = None
+        self.states = {}
+
+    @property
+    def parallel(self):
+        """ True if the group is a parallel group, False if failover. """
+        return self.parallel_value == '1'
+
+    def get_online_systems(self):
+        """ The systems the group is online on, sorted. """
+        return sorted(system for system, state in self.states.items()
+                      if VcsState.ONLINE in state)
+
+    def is_transitional(self):
+        """ True if the group is starting or stopping on any system. """
+        return any(flag in state for state in self.states.values()
+                   for flag in VcsState.TRANSITIONAL)
+
+    def __repr__(self):
+        return "VcsGroup({0} parallel={1} {2})".format(
+            self.name, self.parallel, self.states)
+
+
+class VcsState(object):
+    """
+    The service groups of a cluster, as seen from one of its nodes.
+    """
+
+    ATTRIBUTES = ('Parallel', 'State')
+    ONLINE = 'ONLINE'
+    TRANSITIONAL = ('STARTING', 'STOPPING')
+    DEFAULT_TIMEOUT_SECS = 600
+    # EXTRA TIME GIVEN TO THE su SESSION BEYOND THE hagrp -wait TIMEOUT
+    SU_TIMEOUT_MARGIN_SECS = 30
+
+    def __init__(self, test, node, vcs=None):
+        """
+        Description:
+            Creates an empty snapshot.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            node (str): The node filename the commands are run on.
+            vcs (VCSUtils): The VCS command builder; one is created if not
+                            given.
+        """
+        self.test = test
+        self.node = node
+        self.vcs = vcs or VCSUtils()
+        self.groups = {}
+
+    def get_display_cmd(self):
+        """ Returns the command reading the attributes of all groups. """
+        return self.vcs.get_hagrp_cmd('-display -attribute {0}'.format(
+            ' '.join(self.ATTRIBUTES)))
+
+    @staticmethod
+    def parse_display_output(lines):
+        """
+        Description:
+            Parses "hagrp -display -attribute Parallel State" output, e.g.
+            "Grp_CS_c1_cs1  State  node1  |ONLINE|".
+        Args:
+            lines (list): The output lines.
+        Returns:
+            dict. The VcsGroup keyed by name.
+        """
+        groups = {}
+        for line in lines:
+            fields = line.split(None, 3)
+            if len(fields) < 4 or fields[0].startswith('#'):
+                continue
+            name, attribute, system, value = fields
+            group = groups.setdefault(name, VcsGroup(name))
+            if attribute == 'Parallel':
+                group.parallel_value = value.strip()
+            elif attribute == 'State':
+                group.states[system] = value.strip()
+        return groups
+
+    def load(self, lines):
+        """
+        Description:
+            Replaces the snapshot with parsed display output, asserting
+            that the Parallel attribute of every group is 0 or 1.
+        Args:
+            lines (list): The output lines.
+        Returns:
+            dict. The VcsGroup keyed by name.
+        """
+        self.groups = self.parse_display_output(lines)
+        for group in self.groups.values():
+            self.test.assertTrue(group.parallel_value in ('0', '1'),
+                                 "Unexpected Parallel value ({0}) returned "
+                                 "for service {1} on node {2}.".format(
+                                     group.parallel_value, group.name,
+                                     self.node))
+        return self.groups
+
+    def refresh(self):
+        """
+        Description:
+            Reads the attributes of all groups with one command.
+        Returns:
+            dict. The VcsGroup keyed by name.
+        """
+        stdout, _, _ = self.test.run_command(
+            self.node, self.get_display_cmd(), su_root=True,
+            default_asserts=True)
+        return self.load(stdout)
+
+    def is_settled(self):
+        """ True if no group is starting or stopping. """
+        return not any(group.is_transitional()
+                       for group in self.groups.values())
+
+    def settle(self):
+        """
+        Description:
+            Reads the groups and, if any is starting or stopping, waits
+            for them as GenericTest.wait_for_all_starting_vcs_groups does
+            and reads them again.
+        """
+        self.refresh()
+        if not self.is_settled():
+            self.test.wait_for_all_starting_vcs_groups(self.node)
+            self.refresh()
+
+    def plan_switches(self, system):
+        """
+        Description:
+            Returns the failover groups to switch to a system: those
+            online on another system only.
+        Args:
+            system (str): The system to switch the groups to.
+        Returns:
+            list. The names of the groups, sorted.
+        """
+        return sorted(group.name for group in self.groups.values()
+                      if not group.parallel and group.get_online_systems()
+                      and system not in group.get_online_systems())
+
+    def get_wait_cmd(self, group_names, system, timeout_secs):
+        """
+        Description:
+            Builds the command waiting, concurrently, for every group to
+            be online on a system. The return code of each hagrp -wait is
+            printed after the group name.
+        Args:
+            group_names (list): The group names.
+            system (str): The system.
+            timeout_secs (int): The maximum time to wait for each group.
+        Returns:
+            str. The command.
+        """
+        starts = []
+        waits = []
+        for index, name in enumerate(group_names):
+            starts.append("{0} & P{1}=$!".format(self.vcs.get_hagrp_cmd(
+                '-wait {0} State {1} -sys {2} -time {3}'.format(
+                    name, self.ONLINE, system, int(timeout_secs))), index))
+            waits.append('wait $P{0}; echo "{1} $?"'.format(index, name))
+        return '; '.join(starts + waits)
+
+    def switch_to(self, system, timeout_secs=DEFAULT_TIMEOUT_SECS):
+        """
+        Description:
+            Switches all the failover groups online elsewhere to a
+            system. The switches are sent in one shell execution; a
+            second one waits for all of them and reads the groups again.
+        Args:
+            system (str): The system to switch the groups to.
+            timeout_secs (int): The maximum time to wait for the groups.
+        Returns:
+            list. The names of the switched groups.
+        """
+        self.settle()
+        group_names = self.plan_switches(system)
+        if not group_names:
+            return group_names
+        session = RemoteSession(self.test, self.node)
+        switch_cmds = [self.vcs.get_hagrp_cmd('-switch {0} -to {1}'.format(
+            name, system)) for name in group_names]
+        for cmd, result in zip(switch_cmds,
+                               session.run_commands(switch_cmds)):
+            self.test.assertEqual(0, result.rc, "{0} failed: {1}".format(
+                cmd, result.stderr))
+
+        wait_res, display_res = session.run_commands(
+            [self.get_wait_cmd(group_names, system, timeout_secs),
+             self.get_display_cmd()],
+            su_timeout_secs=int(timeout_secs) + self.SU_TIMEOUT_MARGIN_SECS)
+        self.test.assertEqual(0, display_res.rc)
+        self.load(display_res.stdout)
+        not_online = [name for name in group_names
+                      if system not in self.groups[name].get_online_systems()]
+        self.test.assertEqual([], not_online,
+                              "Service groups not online on {0}: {1}".format(
+                                  system, '; '.join(wait_res.stdout)))
+        if not self.is_settled():
+            self.settle()
+        return group_names
@@ -0,0 +1,359 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Topology of the VxVM storage of a deployment: cluster -> node
+            -> imported disk group -> volume -> mounted file system. The
+            nodes are swept concurrently with one root shell execution
+            each and only the nodes marked out of date are swept again.
+'''
+
+from node_fanout import NodeFanout
+from remote_session import RemoteSession
+from vxprint_parser import VxprintOutput
+
+
+class VxVolume(object):
+    """
+    A VxVM volume of an imported disk group.
+    """
+
+    __slots__ = ('name', 'disk_group', 'node', 'state', 'length',
+                 'mount_point')
+
+    def __init__(self, name, disk_group, node, state=None, length=None):
+        """
+        Description:
+            Creates a volume.
+        Args:
+            name (str): The volume name.
+            disk_group (str): The disk group name.
+            node (str): The node the disk group is imported on.
+            state (str): The vxprint volume state, e.g. ACTIVE.
+            length (int): The volume length in sectors.
+        """
+        self.name = name
+        self.disk_group = disk_group
+        self.node = node
+        self.state = state
+        self.length = length
+        self.mount_point = None
+
+    @property
+    def device(self):
+        """ The block device of the volume. """
+        return '{0}{1}/{2}'.format(VxTopology.VX_DEVICE_PREFIX,
+                                   self.disk_group, self.name)
+
+    def __repr__(self):
+        return "VxVolume({0}/{1} node={2} mount={3})".format(
+            self.disk_group, self.name, self.node, self.mount_point)
+
+
+class VxDiskGroup(object):
+    """
+    A disk group imported on a node.
+    """
+
+    __slots__ = ('name', 'node', 'state', 'dg_id', 'volumes')
+
+    def __init__(self, name, node, state, dg_id=None):
+        """
+        Description:
+            Creates a disk group read from a "vxdg list" line.
+        Args:
+            name (str): The disk group name.
+            node (str): The node the disk group is imported on.
+            state (str): The disk group state, e.g. enabled.
+            dg_id (str): The disk group id.
+        """
+        self.name = name
+        self.node = node
+        self.state = state
+        self.dg_id = dg_id
+        self.volumes = {}
+
+    def __repr__(self):
+        return "VxDiskGroup({0} node={1} state={2} volumes={3})".format(
+            self.name, self.node, self.state, sorted(self.volumes))
+
+
+class VxTopology(object):
+    """
+    In-memory VxVM topology of a set of nodes.
+    """
+
+    VXDG_CMD = '/sbin/vxdg list'
+    VXPRINT_CMD = '/usr/sbin/vxprint -vt'
+    MOUNTS_CMD = '/bin/cat /proc/mounts'
+    VX_DEVICE_PREFIX = '/dev/vx/dsk/'
+
+    def __init__(self, test, nodes, fanout=None, identity=None, ping=True):
+        """
+        Description:
+            Creates an empty topology. Nothing is run until it is first
+            queried.
+        Args:
+            test (GenericTest): Test case used to run the commands.
+            nodes (list): The peer node filenames.
+            fanout (NodeFanout): Fan-out used to sweep the nodes; one is
+                                 created if not given.
+            identity (NodeIdentityIndex): Index used to find the cluster
+                                          of each node.
+            ping (bool): Skip nodes not answering ping within a minute
+                         instead of failing on them.
+        """
+        self.test = test
+        self.nodes = list(nodes)
+        self.fanout = fanout or NodeFanout(test)
+        self.identity = identity
+        self.ping = ping
+        self.unreachable = set()
+        self.errors = {}
+        self._disk_groups = {}
+        self._owners = {}
+        self._stale = set(self.nodes)
+
+    @staticmethod
+    def parse_vxdg_output(lines, node=None):
+        """
+        Description:
+            Parses "vxdg list" output.
+        Args:
+            lines (list): The vxdg list output lines.
+            node (str): The node the output was taken from.
+        Returns:
+            list. The VxDiskGroup of each imported disk group.
+        """
+        disk_groups = []
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 2 or fields[0] == 'NAME':
+                continue
+            disk_groups.append(VxDiskGroup(
+                fields[0], node, fields[1],
+                fields[2] if len(fields) > 2 else None))
+        return disk_groups
+
+    @classmethod
+    def build_node(cls, node, vxdg_lines, vxprint_lines, mounts_lines):
+        """
+        Description:
+            Builds the disk groups of a node with their volumes and the
+            mount points of the volumes.
+        Args:
+            node (str): The node filename.
+            vxdg_lines (list): The vxdg list output lines.
+            vxprint_lines (list): The vxprint -vt output lines.
+            mounts_lines (list): The /proc/mounts lines.
+        Returns:
+            list. The VxDiskGroup objects in vxdg list order.
+        """
+        disk_groups = cls.parse_vxdg_output(vxdg_lines, node)
+        by_name = dict((disk_group.name, disk_group)
+                       for disk_group in disk_groups)
+        for record in VxprintOutput(vxprint_lines, node).records:
+            if record.record_type != VxprintOutput.VOLUME or \
+               record.disk_group not in by_name:
+                continue
+            by_name[record.disk_group].volumes[record.name] = VxVolume(
+                record.name, record.disk_group, node, record.state,
+                record.length)
+        for line in mounts_lines:
+            fields = line.split()
+            if len(fields) < 2 or \
+               not fields[0].startswith(cls.VX_DEVICE_PREFIX):
+                continue
+            dg_vol = fields[0][len(cls.VX_DEVICE_PREFIX):].split('/')
+            if len(dg_vol) == 2 and dg_vol[0] in by_name and \
+               dg_vol[1] in by_name[dg_vol[0]].volumes:
+                by_name[dg_vol[0]].volumes[dg_vol[1]].mount_point = \
+                    fields[1]
+        return disk_groups
+
+    def _sweep_node(self, node):
+        """
+        Description:
+            Reads the disk groups, volumes and mounts of a node.
+        Args:
+            node (str): The node filename.
+        Returns:
+            tuple. The vxdg list (stderr, rc) and the disk groups, or None
+                   if the node is not reachable.
+        """
+        if self.ping:
+            node_ip = self.test.get_node_att(node, 'ipv4')
+            if not self.test.wait_for_ping(node_ip, timeout_mins=1):
+                return None
+        vxdg_res, vxprint_res, mounts_res = RemoteSession(
+            self.test, node).run_commands(
+                [self.VXDG_CMD, self.VXPRINT_CMD, self.MOUNTS_CMD])
+        return (vxdg_res.stderr, vxdg_res.rc), self.build_node(
+            node, vxdg_res.stdout, vxprint_res.stdout, mounts_res.stdout)
+
+    def refresh(self, nodes=None):
+        """
+        Description:
+            Sweeps the given nodes concurrently and replaces what is known
+            about them.
+        Args:
+            nodes (list): The nodes to sweep; all the nodes by default.
+        """
+        nodes = self.nodes if nodes is None else list(nodes)
+        for node, result in self.fanout.map(self._sweep_node, nodes).items():
+            self._stale.discard(node)
+            if result is None:
+                self.unreachable.add(node)
+                self.errors[node] = ([], None)
+                self._disk_groups[node] = []
+                continue
+            self.unreachable.discard(node)
+            self.errors[node], self._disk_groups[node] = result
+        self._owners = {}
+        for node in self.nodes:
+            for disk_group in self._disk_groups.get(node, []):
+                self._owners.setdefault(disk_group.name, node)
+
+    def ensure(self, nodes=None):
+        """
+        Description:
+            Sweeps those of the given nodes that were never swept or were
+            invalidated.
+        Args:
+            nodes (list): The nodes needed; all the nodes by default.
+        """
+        nodes = self.nodes if nodes is None else nodes
+        stale = [node for node in nodes if node in self._stale or
+                 node not in self._disk_groups]
+        if stale:
+            self.refresh(stale)
+
+    def invalidate(self, nodes=None):
+        """
+        Description:
+            Marks nodes as out of date, e.g. after a failover, a service
+            group switch or a reboot. They are swept on their next query.
+        Args:
+            nodes (list): The nodes; all the nodes by default.
+        """
+        self._stale.update(self.nodes if nodes is None else nodes)
+
+    def get_disk_groups(self, node):
+        """
+        Description:
+            Returns the disk groups imported on a node.
+        Args:
+            node (str): The node filename.
+        Returns:
+            list. The VxDiskGroup objects in vxdg list order.
+        """
+        self.ensure([node])
+        return list(self._disk_groups.get(node, []))
+
+    def get_owner(self, dg_name, verify=False):
+        """
+        Description:
+            Returns the node a disk group is imported on. If the disk group
+            is not found all the nodes are swept again, since it may have
+            just failed over.
+        Args:
+            dg_name (str): The disk group name.
+            verify (bool): Sweep the known owner again before returning
+                           it, for callers that cannot tell whether the
+                           disk group has moved.
+        Returns:
+            str. The node filename, or None if no node imports it.
+        """
+        self.ensure()
+        owner = self._owners.get(dg_name)
+        if owner is not None and verify:
+            self.refresh([owner])
+            owner = self._owners.get(dg_name)
+        if owner is None:
+            self.refresh()
+            owner = self._owners.get(dg_name)
+        return owner
+
+    def get_disk_group(self, dg_name):
+        """
+        Description:
+            Returns a disk group from memory.
+        Args:
+            dg_name (str): The disk group name.
+        Returns:
+            VxDiskGroup. The disk group, or None if it is not imported.
+        """
+        self.ensure()
+        owner = self._owners.get(dg_name)
+        if owner is None:
+            return None
+        for disk_group in self._disk_groups[owner]:
+            if disk_group.name == dg_name:
+                return disk_group
+        return None
+
+    def get_volume(self, dg_name, vol_name):
+        """
+        Description:
+            Returns a volume from memory.
+        Args:
+            dg_name (str): The disk group name.
+            vol_name (str): The volume name.
+        Returns:
+            VxVolume. The volume, or None if it is not known.
+        """
+        disk_group = self.get_disk_group(dg_name)
+        if disk_group is None:
+            return None
+        return disk_group.volumes.get(vol_name)
+
+    def get_volume_by_mount_point(self, mount_point):
+        """
+        Description:
+            Returns the volume mounted on a mount point on any node.
+        Args:
+            mount_point (str): The mount point.
+        Returns:
+            VxVolume. The volume, or None if no volume is mounted there.
+        """
+        self.ensure()
+        for node in self.nodes:
+            for disk_group in self._disk_groups.get(node, []):
+                for volume in disk_group.volumes.values():
+                    if volume.mount_point == mount_point:
+                        return volume
+        return None
+
+    def get_cluster(self, node):
+        """
+        Description:
+            Returns the id of the cluster of a node.
+        Args:
+            node (str): The node filename.
+        Returns:
+            str. The cluster id, or None if it is not known.
+        """
+        if self.identity is None:
+            return None
+        node_url = self.identity.get_url(node)
+        url_list = node_url.split('/') if node_url else []
+        if 'clusters' not in url_list:
+            return None
+        return url_list[url_list.index('clusters') + 1]
+
+    def get_clusters(self):
+        """
+        Description:
+            Returns the nodes of each cluster.
+        Returns:
+            dict. The node filenames keyed by cluster id.
+        """
+        clusters = {}
+        for node in self.nodes:
+            clusters.setdefault(self.get_cluster(node), []).append(node)
+        return clusters
@@ -0,0 +1,216 @@
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Parser for "vxprint -vt" output. The output is read once into
+            typed records indexed by disk group and name so that volume,
+            plex and cache lookups do not rescan the console output.
+'''
+
+
+class VxRecord(object):
+    """
+    A single record line of "vxprint -vt" output.
+    """
+
+    __slots__ = ('record_type', 'name', 'assoc', 'kstate', 'state',
+                 'length', 'disk_group', 'node', 'fields')
+
+    def __init__(self, fields, disk_group=None, node=None):
+        """
+        Description:
+            Builds a record from the whitespace separated fields of a
+            vxprint line.
+        Args:
+            fields (list): The fields of the line, starting with the
+                           record type, e.g. "v", "pl" or "co".
+            disk_group (str): The disk group the record was listed under.
+            node (str): The node the output was taken from.
+        """
+        self.record_type = fields[0]
+        self.name = fields[1]
+        self.assoc = VxprintOutput.column(fields, 2)
+        self.kstate = None
+        self.state = None
+        self.length = None
+        if self.record_type in VxprintOutput.STATE_RECORDS:
+            self.kstate = VxprintOutput.column(fields, 3)
+            self.state = VxprintOutput.column(fields, 4)
+        if self.record_type in VxprintOutput.LENGTH_RECORDS:
+            length = VxprintOutput.column(fields, 5)
+            if length is not None and length.isdigit():
+                self.length = int(length)
+        self.disk_group = disk_group
+        self.node = node
+        self.fields = fields
+
+    def __repr__(self):
+        return "VxRecord({0} {1} dg={2} length={3})".format(
+            self.record_type, self.name, self.disk_group, self.length)
+
+
+class VxprintOutput(object):
+    """
+    Records parsed from the "vxprint -vt" output of one or more nodes.
+    """
+
+    VOLUME = 'v'
+    PLEX = 'pl'
+    SUBDISK = 'sd'
+    CACHE = 'co'
+    DISK = 'dm'
+    DISK_GROUP = 'dg'
+
+    # RECORD TYPES WITH KSTATE/STATE IN COLUMNS 3 AND 4
+    STATE_RECORDS = ('v', 'pl', 'co', 'rv', 'rl')
+    # RECORD TYPES WITH A LENGTH IN SECTORS IN COLUMN 5
+    LENGTH_RECORDS = ('v', 'pl', 'sd', 'sv', 'sc', 'dm')
+    DISK_GROUP_PREFIX = 'Disk group:'
+
+    def __init__(self, lines=None, node=None):
+        """
+        Description:
+            Creates the parsed output, optionally from the lines of a
+            single vxprint invocation.
+        Args:
+            lines (list): Lines of "vxprint -vt" output.
+            node (str): The node the output was taken from.
+        """
+        self.records = []
+        self._by_dg_name = {}
+        self._by_name = {}
+        if lines:
+            self.add(lines, node)
+
+    @staticmethod
+    def column(fields, index):
+        """
+        Description:
+            Returns a column of a record, mapping the "-" placeholder
+            and missing columns to None.
+        Args:
+            fields (list): The fields of the line.
+            index (int): The column index.
+        Returns:
+            str. The column value or None.
+        """
+        if index < len(fields) and fields[index] != '-':
+            return fields[index]
+        return None
+
+    def add(self, lines, node=None):
+        """
+        Description:
+            Parses the lines of a vxprint invocation in a single pass and
+            adds the records to the indexes. Header lines (upper case
+            record types) and blank lines are skipped.
+        Args:
+            lines (list): Lines of "vxprint -vt" output.
+            node (str): The node the output was taken from.
+        """
+        disk_group = None
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith(self.DISK_GROUP_PREFIX):
+                disk_group = stripped[len(self.DISK_GROUP_PREFIX):].strip()
+                continue
+            fields = stripped.split()
+            if len(fields) < 2 or not fields[0].islower():
+                continue
+            record = VxRecord(fields, disk_group, node)
+            if record.record_type == self.DISK_GROUP:
+                disk_group = record.name
+            self.records.append(record)
+            self._by_dg_name.setdefault(
+                (disk_group, record.name), []).append(record)
+            self._by_name.setdefault(record.name, []).append(record)
+
+    def find(self, name, record_type=None, disk_group=None):
+        """
+        Description:
+            Returns the records with the given name.
+        Args:
+            name (str): The exact record name.
+            record_type (str): Only return records of this type.
+            disk_group (str): Only return records of this disk group.
+        Returns:
+            list. The matching records in output order.
+        """
+        if disk_group is None:
+            records = self._by_name.get(name, [])
+        else:
+            records = self._by_dg_name.get((disk_group, name), [])
+        if record_type is None:
+            return list(records)
+        return [rec for rec in records if rec.record_type == record_type]
+
+    def get(self, name, record_type=None, disk_group=None):
+        """
+        Description:
+            Returns the first record with the given name.
+        Args:
+            name (str): The exact record name.
+            record_type (str): Only return a record of this type.
+            disk_group (str): Only return a record of this disk group.
+        Returns:
+            VxRecord. The record or None if it does not exist.
+        """
+        records = self.find(name, record_type, disk_group)
+        if records:
+            return records[0]
+        return None
+
+    def get_volume(self, name, disk_group=None):
+        """
+        Description:
+            Returns the volume record with the given name.
+        Args:
+            name (str): The volume name.
+            disk_group (str): The disk group of the volume.
+        Returns:
+            VxRecord. The volume record or None if it does not exist.
+        """
+        return self.get(name, self.VOLUME, disk_group)
+
+    def get_cache_volume(self, cache_name, disk_group=None):
+        """
+        Description:
+            Returns the volume backing the given cache object. The cache
+            volume is found through the cache object record or, if that
+            is not listed, through the volume associated with the cache.
+        Args:
+            cache_name (str): The cache object name, e.g. LOvol1_.
+            disk_group (str): The disk group of the cache.
+        Returns:
+            VxRecord. The cache volume record or None if it does not exist.
+        """
+        cache = self.get(cache_name, self.CACHE, disk_group)
+        if cache is not None and cache.assoc:
+            volume = self.get_volume(cache.assoc, cache.disk_group)
+            if volume is not None:
+                return volume
+        for record in self.records:
+            if record.record_type == self.VOLUME and \
+               record.assoc == cache_name and \
+               disk_group in (None, record.disk_group):
+                return record
+        return None
+
+    def has_cache(self, cache_name, disk_group=None):
+        """
+        Description:
+            Checks whether a cache object, or a volume associated with
+            it, exists.
+        Args:
+            cache_name (str): The cache object name.
+            disk_group (str): The disk group of the cache.
+        Returns:
+            bool. True if the cache exists.
+        """
+        return bool(self.find(cache_name, self.CACHE, disk_group)) or \
+            self.get_cache_volume(cache_name, disk_group) is not None